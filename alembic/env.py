@@ -5,7 +5,7 @@ from alembic import context
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
-from src.infrastructure.config import Settings
+from src.infrastructure.config.settings import DatabaseSettings
 from src.infrastructure.database.models import Base
 
 # this is the Alembic Config object, which provides
@@ -21,7 +21,7 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
-config.set_main_option("sqlalchemy.url", Settings().database.url)
+config.set_main_option("sqlalchemy.url", DatabaseSettings().url)
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
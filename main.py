@@ -1,11 +1,13 @@
 import sys
+from typing import TYPE_CHECKING
 
-import uvicorn
-from dishka import make_async_container
 from loguru import logger
-from src.di.database import DBConfig, DBProvider
-from src.infrastructure.config import get_settings
-from src.interfaces.api import create_rest_app
+from src.infrastructure.config import get_settings, on_settings_reload
+
+# Supervisor process only reads settings and starts uvicorn; the web stack,
+# SQLAlchemy and dishka are imported by create_app() inside each worker
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
 def configure_logging(settings):
@@ -21,35 +23,121 @@ def configure_logging(settings):
     )
 
 
-def main():
-    """Main application entry point."""
-    settings = get_settings()
+def create_app() -> "FastAPI":
+    """Application factory, called by uvicorn in every worker process.
 
-    # Configure logging
+    The DI container and the database engine are created here rather than at
+    import time, so each worker owns its own connection pool.
+    """
+    from dishka import make_async_container
+    from src.di.cache import CacheConfig, CacheProvider
+    from src.di.database import DBConfig, DBProvider
+    from src.di.events import EventBusConfig, EventBusProvider
+    from src.di.outbox import OutboxConfig, OutboxProvider
+    from src.di.rate_limit import RateLimitConfig, RateLimitProvider
+    from src.infrastructure.outbox.serializers import Codec
+    from src.interfaces.api import create_rest_app
+
+    settings = get_settings()
     configure_logging(settings)
+    # Log level is applied on SIGHUP without restarting the worker
+    on_settings_reload(configure_logging)
 
-    logger.info(f"Starting {settings.app.name} v{settings.app.version}")
-    logger.info(f"Environment: {settings.app.environment}")
-    logger.info(f"Debug mode: {settings.app.debug}")
+    # Size the per-worker pool from the connection budget
+    connection_plan = settings.connection_plan
+    logger.info(f"Database connection plan: {connection_plan.describe()}")
 
     # Create database configuration
-    db_config = DBConfig(url=settings.database.url)
+    db_config = DBConfig(
+        url=settings.database.url,
+        echo=settings.database.echo,
+        pool_size=connection_plan.pool_size,
+        max_overflow=connection_plan.max_overflow,
+        pool_timeout=settings.database.pool_timeout,
+        pool_recycle=settings.database.pool_recycle,
+        pool_pre_ping=settings.database.pool_pre_ping,
+        pool_use_lifo=settings.database.pool_use_lifo,
+        statement_cache_size=settings.database.statement_cache_size,
+        pgbouncer=settings.database.pgbouncer,
+        pgbouncer_null_pool=settings.database.pgbouncer_null_pool,
+        shard_urls=settings.database.shard_urls,
+        retry_max_attempts=settings.database.retry_max_attempts,
+        retry_base_delay=settings.database.retry_base_delay,
+        retry_max_delay=settings.database.retry_max_delay,
+    )
+
+    # Create event bus configuration
+    event_bus_config = EventBusConfig(
+        queue_size=settings.event_bus.queue_size,
+        publish_timeout=settings.event_bus.publish_timeout,
+        overflow=settings.event_bus.overflow,
+    )
+
+    # Create outbox configuration
+    outbox_config = OutboxConfig(
+        codec=Codec[settings.outbox.codec.upper()],
+        compression_threshold=settings.outbox.compression_threshold,
+        notify_channel=settings.outbox.notify_channel,
+        feed_poll_interval=settings.outbox.feed_poll_interval,
+        feed_batch_size=settings.outbox.feed_batch_size,
+        feed_queue_size=settings.outbox.feed_queue_size,
+        feed_gap_timeout=settings.outbox.feed_gap_timeout,
+        feed_heartbeat_interval=settings.outbox.feed_heartbeat_interval,
+    )
+
+    # Create response cache configuration
+    cache_config = CacheConfig(
+        max_entries=settings.cache.max_entries,
+        redis_url=settings.cache.redis_url,
+        key_prefix=settings.cache.key_prefix,
+    )
+
+    # Create rate limiter configuration
+    rate_limit_config = RateLimitConfig(
+        max_keys=settings.rate_limit.max_keys,
+        redis_url=settings.rate_limit.redis_url,
+        key_prefix=settings.rate_limit.key_prefix,
+    )
 
     # Create DI container
     container = make_async_container(
         DBProvider(config=db_config),
+        EventBusProvider(config=event_bus_config),
+        OutboxProvider(config=outbox_config),
+        CacheProvider(config=cache_config),
+        RateLimitProvider(config=rate_limit_config),
     )
 
     # Create FastAPI application
-    app = create_rest_app(container)
+    return create_rest_app(container)
+
+
+def main():
+    """Main application entry point."""
+    import uvicorn
+
+    settings = get_settings()
+
+    # Configure logging
+    configure_logging(settings)
+
+    logger.info(f"Starting {settings.app.name} v{settings.app.version}")
+    logger.info(f"Environment: {settings.app.environment}")
+    logger.info(f"Debug mode: {settings.app.debug}")
+    logger.info(f"Workers: {settings.app.workers}")
+    if settings.app.limit_max_requests is not None and settings.app.workers == 1:
+        logger.warning("APP_LIMIT_MAX_REQUESTS with a single worker stops the server instead of recycling the worker")
 
-    # Run application
+    # Uvicorn only supervises workers (restarting crashed ones and those that
+    # reached the request limit) when the app is given as an import string
     uvicorn.run(
-        app=app,
+        app="main:create_app",
+        factory=True,
         host=settings.app.host,
         port=settings.app.port,
         reload=settings.app.reload,
         workers=settings.app.workers,
+        limit_max_requests=settings.app.limit_max_requests,
     )
 
 
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEntry:
+    """Готовый ответ эндпоинта.
+
+    headers — заголовки ответа (Content-Type, ETag, Cache-Control и т. п.)
+    без Content-Length и Set-Cookie. created_at — время по часам системы
+    (time.time()), чтобы записи в общем кеше были сравнимы между процессами.
+    """
+
+    body: bytes
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    created_at: float
+    ttl: float
+    stale_ttl: float = 0.0
+
+    @property
+    def expires_at(self) -> float:
+        return self.created_at + self.ttl
+
+    @property
+    def stale_until(self) -> float:
+        return self.expires_at + self.stale_ttl
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_servable(self, now: float) -> bool:
+        """Запись еще можно отдать, пока она обновляется в фоне"""
+        return now < self.stale_until
+
+
+class ICache(Protocol):
+    """Хранилище ответов эндпоинтов"""
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Возвращает запись, если ее еще можно отдать (свежую или устаревшую)"""
+        ...
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Сохраняет запись до entry.stale_until"""
+        ...
+
+    async def delete(self, key: str) -> None: ...
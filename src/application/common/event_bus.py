@@ -0,0 +1,24 @@
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import Protocol
+
+from .value_objects import EventType, OutboxEvent
+
+type EventHandler = Callable[[OutboxEvent], Awaitable[None]]
+
+
+class IEventBus(Protocol):
+    """Шина для подписчиков в том же процессе, получающих события после коммита"""
+
+    def subscribe(
+        self,
+        event_types: EventType | Iterable[EventType],
+        handler: EventHandler,
+        *,
+        queue_size: int | None = None,
+    ) -> Callable[[], None]:
+        """Подписывает обработчик на типы событий, возвращает функцию отписки"""
+        ...
+
+    async def publish(self, events: Sequence[OutboxEvent]) -> None:
+        """Передает события подписчикам. Не выбрасывает ошибок подписчиков"""
+        ...
@@ -0,0 +1,106 @@
+import json
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import replace
+from typing import Any, Protocol
+
+from .value_objects import EventType, OutboxEvent
+
+
+class CoalescingRule(Protocol):
+    """Правило объединения событий одной транзакции перед коммитом"""
+
+    def key(self, event: OutboxEvent) -> Hashable | None:
+        """Ключ группы событий. None — событие правилом не обрабатывается"""
+        ...
+
+    def merge(self, first: OutboxEvent, second: OutboxEvent) -> OutboxEvent:
+        """Объединяет накопленное событие группы с более поздним"""
+        ...
+
+
+class DuplicatePayloadRule:
+    """Оставляет одно событие из нескольких с одинаковыми типом, payload и metadata"""
+
+    def __init__(self, event_types: Iterable[EventType] | None = None) -> None:
+        self._event_types = frozenset(event_types) if event_types is not None else None
+
+    def key(self, event: OutboxEvent) -> Hashable | None:
+        if self._event_types is not None and event.event_type not in self._event_types:
+            return None
+        return (
+            event.event_type,
+            json.dumps(event.payload, sort_keys=True, default=str),
+            json.dumps(event.metadata, sort_keys=True, default=str),
+        )
+
+    def merge(self, first: OutboxEvent, second: OutboxEvent) -> OutboxEvent:
+        return first
+
+
+class AuditLogCoalescingRule:
+    """Объединяет все AUDIT_LOG события одной сущности в одно.
+
+    Для полей в формате {"old": ..., "new": ...} сохраняется самое раннее
+    old и самое позднее new, остальные значения перезаписываются последними.
+    """
+
+    def key(self, event: OutboxEvent) -> Hashable | None:
+        if event.event_type is not EventType.AUDIT_LOG:
+            return None
+        return (event.payload.get("entity_type"), event.payload.get("entity_id"))
+
+    def merge(self, first: OutboxEvent, second: OutboxEvent) -> OutboxEvent:
+        changes = dict(first.payload.get("changes") or {})
+        for name, change in (second.payload.get("changes") or {}).items():
+            previous = changes.get(name)
+            if _is_diff(previous) and _is_diff(change):
+                changes[name] = {"old": previous["old"], "new": change["new"]}
+            else:
+                changes[name] = change
+
+        payload = {
+            **first.payload,
+            **second.payload,
+            "operation": _merge_operation(first.payload.get("operation"), second.payload.get("operation")),
+            "user_id": second.payload.get("user_id") or first.payload.get("user_id"),
+            "changes": changes,
+        }
+        return replace(first, payload=payload, metadata={**first.metadata, **second.metadata})
+
+
+def _is_diff(value: Any) -> bool:
+    return isinstance(value, dict) and value.keys() == {"old", "new"}
+
+
+def _merge_operation(first: str | None, second: str | None) -> str | None:
+    # Сущность, созданная и измененная в одной транзакции, остается созданной,
+    # а удаление всегда важнее предыдущих операций
+    if second == "delete" or first is None:
+        return second
+    if first == "create":
+        return first
+    return second or first
+
+
+def coalesce_events(events: Sequence[OutboxEvent], rules: Sequence[CoalescingRule]) -> list[OutboxEvent]:
+    """Объединяет события по правилам, сохраняя позицию первого события группы"""
+    if not rules:
+        return list(events)
+
+    result: list[OutboxEvent] = []
+    positions: dict[tuple[int, Hashable], int] = {}
+    for event in events:
+        for index, rule in enumerate(rules):
+            key = rule.key(event)
+            if key is None:
+                continue
+            position = positions.get((index, key))
+            if position is None:
+                positions[index, key] = len(result)
+                result.append(event)
+            else:
+                result[position] = rule.merge(result[position], event)
+            break
+        else:
+            result.append(event)
+    return result
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitResult:
+    """Результат списания из корзины токенов"""
+
+    allowed: bool
+    remaining: float
+    retry_after: float = 0.0
+
+
+class IRateLimiter(Protocol):
+    """Корзины токенов, пополняемые со скоростью rate до burst"""
+
+    async def hit(self, key: str, rate: float, burst: int, cost: int = 1) -> RateLimitResult:
+        """Списывает cost токенов, если их хватает; иначе сообщает, через сколько секунд хватит"""
+        ...
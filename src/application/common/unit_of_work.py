@@ -1,8 +1,59 @@
-from typing import Protocol
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, ClassVar, Protocol
 
 from .value_objects import OutboxEvent
 
 
+class IsolationLevel(StrEnum):
+    """Уровни изоляции транзакции"""
+
+    READ_COMMITTED = "READ COMMITTED"
+    REPEATABLE_READ = "REPEATABLE READ"
+    SERIALIZABLE = "SERIALIZABLE"
+
+
+@dataclass(frozen=True)
+class TransactionMode:
+    """Характеристики транзакции UnitOfWork.
+
+    isolation_level=None оставляет уровень изоляции по умолчанию для БД.
+    DEFERRABLE имеет смысл только для SERIALIZABLE READ ONLY: такая транзакция
+    ждет безопасный снимок и не может быть прервана ошибкой сериализации.
+    """
+
+    isolation_level: IsolationLevel | None = None
+    read_only: bool = False
+    deferrable: bool = False
+
+    READ_WRITE: ClassVar["TransactionMode"]
+    READ_ONLY: ClassVar["TransactionMode"]
+    READ_ONLY_DEFERRABLE: ClassVar["TransactionMode"]
+    READ_COMMITTED: ClassVar["TransactionMode"]
+    REPEATABLE_READ: ClassVar["TransactionMode"]
+
+    def __post_init__(self) -> None:
+        if self.deferrable and not (self.read_only and self.isolation_level is IsolationLevel.SERIALIZABLE):
+            raise ValueError("DEFERRABLE requires a SERIALIZABLE READ ONLY transaction")
+
+    @property
+    def is_default(self) -> bool:
+        return self == TransactionMode.READ_WRITE
+
+
+TransactionMode.READ_WRITE = TransactionMode()
+TransactionMode.READ_ONLY = TransactionMode(read_only=True)
+TransactionMode.READ_ONLY_DEFERRABLE = TransactionMode(
+    isolation_level=IsolationLevel.SERIALIZABLE,
+    read_only=True,
+    deferrable=True,
+)
+TransactionMode.READ_COMMITTED = TransactionMode(isolation_level=IsolationLevel.READ_COMMITTED)
+TransactionMode.REPEATABLE_READ = TransactionMode(isolation_level=IsolationLevel.REPEATABLE_READ)
+
+
 class IUnitOfWork(Protocol):
     _events: list[OutboxEvent]
 
@@ -14,6 +65,37 @@ class IUnitOfWork(Protocol):
         """Регистрирует событие для отправки через outbox pattern"""
         self._events.append(event)
 
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """Вложенная транзакция: ошибка внутри блока откатывает только его изменения"""
+        ...
+
+    def bulk(self, refresh: bool = False) -> AbstractAsyncContextManager[list[Any]]:
+        """Пакетная запись: сохранения репозиториев выполняются одним flush в конце блока"""
+        ...
+
+    async def run[T](self, work: Callable[[], Awaitable[T]]) -> T:
+        """Выполняет work с повтором при ошибках сериализации и взаимоблокировках"""
+        ...
+
     async def commit(self) -> None: ...
 
     async def rollback(self) -> None: ...
+
+
+# Отдельные типы позволяют обработчику выбрать режим транзакции через DI
+class IReadOnlyUnitOfWork(IUnitOfWork, Protocol):
+    """UnitOfWork в транзакции READ ONLY: без flush и без регистрации событий"""
+
+
+class IDeferrableReadOnlyUnitOfWork(IReadOnlyUnitOfWork, Protocol):
+    """UnitOfWork в транзакции SERIALIZABLE READ ONLY DEFERRABLE для согласованных отчетов"""
+
+
+class IRepeatableReadUnitOfWork(IUnitOfWork, Protocol):
+    """UnitOfWork в транзакции REPEATABLE READ"""
+
+
+class IShardedUnitOfWorkFactory(Protocol):
+    """Открывает UnitOfWork на шарде, которому принадлежит ключ (id сущности или арендатора)"""
+
+    def for_key(self, key: Any) -> AbstractAsyncContextManager[IUnitOfWork]: ...
@@ -26,6 +26,13 @@ class OutboxEvent:
     event_type: EventType
     payload: dict[str, Any]
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Ключ идемпотентности: события с одинаковым ключом в одной транзакции регистрируются один раз
+    idempotency_key: str | None = None
+
+    @property
+    def resource(self) -> str | None:
+        """Ресурс, к которому относится событие (используется для фильтрации подписок)"""
+        return self.metadata.get("resource") or self.payload.get("resource") or self.payload.get("entity_type")
 
     @classmethod
     def create(
@@ -33,12 +40,14 @@ class OutboxEvent:
         event_type: EventType,
         payload: dict[str, Any],
         metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Self:
         return cls(
             id=EventId(),
             event_type=event_type,
             payload=payload,
             metadata=metadata or {},
+            idempotency_key=idempotency_key,
         )
 
     @classmethod
@@ -49,6 +58,7 @@ class OutboxEvent:
         body: str,
         subject: str | None = None,
         metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Self:
         """Создает событие для отправки сообщения (email, sms и т.д.)"""
         payload = {
@@ -61,6 +71,7 @@ class OutboxEvent:
             event_type=EventType.MESSAGE,
             payload=payload,
             metadata=metadata or {},
+            idempotency_key=idempotency_key,
         )
 
     @classmethod
@@ -71,6 +82,7 @@ class OutboxEvent:
         resource: str | None = None,
         details: dict[str, Any] | None = None,
         metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Self:
         """Создает событие для записи действия пользователя"""
         payload = {
@@ -83,6 +95,7 @@ class OutboxEvent:
             event_type=EventType.USER_ACTION,
             payload=payload,
             metadata=metadata or {},
+            idempotency_key=idempotency_key,
         )
 
     @classmethod
@@ -94,6 +107,7 @@ class OutboxEvent:
         user_id: str | None = None,
         changes: dict[str, Any] | None = None,
         metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Self:
         """Создает событие для аудит лога"""
         payload = {
@@ -107,6 +121,7 @@ class OutboxEvent:
             event_type=EventType.AUDIT_LOG,
             payload=payload,
             metadata=metadata or {},
+            idempotency_key=idempotency_key,
         )
 
     @classmethod
@@ -117,6 +132,7 @@ class OutboxEvent:
         headers: dict[str, str] | None = None,
         body: dict[str, Any] | None = None,
         metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Self:
         """Создает событие для отправки webhook"""
         payload = {
@@ -129,6 +145,7 @@ class OutboxEvent:
             event_type=EventType.WEBHOOK,
             payload=payload,
             metadata=metadata or {},
+            idempotency_key=idempotency_key,
         )
 
     @classmethod
@@ -140,6 +157,7 @@ class OutboxEvent:
         notification_type: str = "info",
         link: str | None = None,
         metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> Self:
         """Создает событие для отправки уведомления"""
         payload = {
@@ -153,4 +171,5 @@ class OutboxEvent:
             event_type=EventType.NOTIFICATION,
             payload=payload,
             metadata=metadata or {},
+            idempotency_key=idempotency_key,
         )
@@ -0,0 +1,29 @@
+from collections.abc import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from pydantic import BaseModel
+
+from src.application.common.cache import ICache
+from src.infrastructure.cache import InMemoryCache, RedisCache
+
+
+class CacheConfig(BaseModel):
+    max_entries: int = 10_000
+    redis_url: str | None = None
+    key_prefix: str = "cache"
+
+
+class CacheProvider(Provider):
+    def __init__(self, config: CacheConfig):
+        super().__init__()
+        self._config = config
+
+    @provide(scope=Scope.APP, provides=ICache)
+    async def get_cache(self) -> AsyncGenerator[ICache, None]:  # noqa: UP043
+        # Без Redis у каждого worker'а свой кеш
+        if self._config.redis_url is None:
+            yield InMemoryCache(max_entries=self._config.max_entries)
+            return
+        cache = RedisCache.from_url(self._config.redis_url, key_prefix=self._config.key_prefix)
+        yield cache
+        await cache.close()
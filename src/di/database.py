@@ -1,33 +1,194 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
+from typing import Any
+from uuid import uuid4
 
 from dishka import Provider, Scope, provide
 from pydantic import BaseModel
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
-from src.application.common.unit_of_work import IUnitOfWork
+from src.application.common.event_bus import IEventBus
+from src.application.common.event_coalescing import CoalescingRule
+from src.application.common.unit_of_work import (
+    IDeferrableReadOnlyUnitOfWork,
+    IReadOnlyUnitOfWork,
+    IRepeatableReadUnitOfWork,
+    IShardedUnitOfWorkFactory,
+    IUnitOfWork,
+    TransactionMode,
+)
+from src.infrastructure.database.deadline import bind_deadline
+from src.infrastructure.database.retry import RetryPolicy
+from src.infrastructure.database.sharding import ShardedUnitOfWorkFactory, ShardRouter
+from src.infrastructure.database.telemetry import PoolTelemetry
+from src.infrastructure.outbox.audit import AuditCapture
+from src.infrastructure.outbox.writer import OutboxWriter
 from src.infrastructure.unit_of_work import UnitOfWork
 
 
 class DBConfig(BaseModel):
     url: str
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    pool_use_lifo: bool = False
+    statement_cache_size: int = 100
+    pgbouncer: bool = False
+    pgbouncer_null_pool: bool = True
+    shard_urls: list[str] = []
+    retry_max_attempts: int = 3
+    retry_base_delay: float = 0.05
+    retry_max_delay: float = 1.0
+
+
+def unique_statement_name() -> str:
+    # Номера prepared statements asyncpg повторяются между соединениями и конфликтуют за PgBouncer
+    return f"__asyncpg_{uuid4()}__"
+
+
+def engine_options(config: DBConfig, telemetry: PoolTelemetry) -> dict[str, Any]:
+    url = make_url(config.url)
+    options: dict[str, Any] = {
+        "url": url,
+        "echo": config.echo,
+        "pool_pre_ping": config.pool_pre_ping,
+        "pool_recycle": config.pool_recycle,
+    }
+    if config.pgbouncer and config.pgbouncer_null_pool:
+        # Пулом владеет PgBouncer: локальный пул только удерживал бы его серверные соединения
+        options["poolclass"] = NullPool
+    # SQLite (тесты, локальный запуск) использует собственные пулы без очереди
+    elif url.get_backend_name() != "sqlite":
+        options |= {
+            "poolclass": telemetry.pool_class(),
+            "pool_size": config.pool_size,
+            "max_overflow": config.max_overflow,
+            "pool_timeout": config.pool_timeout,
+            "pool_use_lifo": config.pool_use_lifo,
+        }
+    if url.get_driver_name() == "asyncpg":
+        options["url"] = url.update_query_dict({"prepared_statement_cache_size": str(config.statement_cache_size)})
+        if config.pgbouncer:
+            options["connect_args"] = {
+                "prepared_statement_name_func": unique_statement_name,
+                # Внутренний кеш asyncpg не знает о PgBouncer, кешем управляет SQLAlchemy
+                "statement_cache_size": 0,
+            }
+    return options
 
 
 class DBProvider(Provider):
-    def __init__(self, config: DBConfig):
+    def __init__(
+        self,
+        config: DBConfig,
+        coalescing_rules: Sequence[CoalescingRule] = (),
+        audit_capture: AuditCapture | None = None,
+    ):
+        super().__init__()
         self._config = config
+        self._coalescing_rules = coalescing_rules
+        self._audit_capture = audit_capture
+        self._retry_policy = RetryPolicy(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+        )
 
     @provide(scope=Scope.APP)
-    def get_engine(self) -> AsyncEngine:
+    def get_pool_telemetry(self) -> PoolTelemetry:
+        return PoolTelemetry()
+
+    @provide(scope=Scope.APP)
+    def get_engine(self, telemetry: PoolTelemetry) -> AsyncEngine:
         if getattr(self, "_engine", None) is None:
-            self._engine = create_async_engine(self._config.url)
+            self._engine = create_async_engine(**engine_options(self._config, telemetry))
+            telemetry.instrument(self._engine)
         return self._engine
 
+    @provide(scope=Scope.APP)
+    async def get_shard_router(
+        self, engine: AsyncEngine, telemetry: PoolTelemetry
+    ) -> AsyncGenerator[ShardRouter, None]:  # noqa: UP043
+        # Шард 0 — основная БД; остальные движки используют те же настройки пула
+        shard_engines = [
+            create_async_engine(**engine_options(self._config.model_copy(update={"url": url}), telemetry))
+            for url in self._config.shard_urls
+        ]
+        # Телеметрия общая для всех пулов, иначе waiting считался бы по всем, а выдачи — по основному
+        for shard_engine in shard_engines:
+            telemetry.instrument(shard_engine)
+        yield ShardRouter([engine, *shard_engines])
+        for shard_engine in shard_engines:
+            await shard_engine.dispose()
+
+    @provide(scope=Scope.APP, provides=IShardedUnitOfWorkFactory)
+    def get_sharded_unit_of_work_factory(
+        self,
+        router: ShardRouter,
+        event_bus: IEventBus,
+        outbox_writer: OutboxWriter,
+    ) -> ShardedUnitOfWorkFactory:
+        return ShardedUnitOfWorkFactory(
+            router,
+            lambda session: self._unit_of_work(session, TransactionMode.READ_WRITE, event_bus, outbox_writer),
+        )
+
     @provide(scope=Scope.REQUEST, provides=AsyncSession)
     async def get_session(self, engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:  # noqa: UP043
         async with AsyncSession(engine, expire_on_commit=False) as session:
+            bind_deadline(session)
             yield session
 
     @provide(scope=Scope.REQUEST, provides=IUnitOfWork)
-    async def get_unit_of_work(self, session: AsyncSession) -> AsyncGenerator[IUnitOfWork, None]:  # noqa: UP043
-        async with UnitOfWork(session=session) as uow:
+    async def get_unit_of_work(
+        self,
+        session: AsyncSession,
+        event_bus: IEventBus,
+        outbox_writer: OutboxWriter,
+    ) -> AsyncGenerator[IUnitOfWork, None]:  # noqa: UP043
+        async with self._unit_of_work(session, TransactionMode.READ_WRITE, event_bus, outbox_writer) as uow:
+            yield uow
+
+    @provide(scope=Scope.REQUEST, provides=IReadOnlyUnitOfWork)
+    async def get_read_only_unit_of_work(self, session: AsyncSession) -> AsyncGenerator[IReadOnlyUnitOfWork, None]:  # noqa: UP043
+        async with self._unit_of_work(session, TransactionMode.READ_ONLY) as uow:
+            yield uow
+
+    @provide(scope=Scope.REQUEST, provides=IDeferrableReadOnlyUnitOfWork)
+    async def get_deferrable_read_only_unit_of_work(
+        self,
+        session: AsyncSession,
+    ) -> AsyncGenerator[IDeferrableReadOnlyUnitOfWork, None]:  # noqa: UP043
+        async with self._unit_of_work(session, TransactionMode.READ_ONLY_DEFERRABLE) as uow:
+            yield uow
+
+    @provide(scope=Scope.REQUEST, provides=IRepeatableReadUnitOfWork)
+    async def get_repeatable_read_unit_of_work(
+        self,
+        session: AsyncSession,
+        event_bus: IEventBus,
+        outbox_writer: OutboxWriter,
+    ) -> AsyncGenerator[IRepeatableReadUnitOfWork, None]:  # noqa: UP043
+        async with self._unit_of_work(session, TransactionMode.REPEATABLE_READ, event_bus, outbox_writer) as uow:
             yield uow
+
+    def _unit_of_work(
+        self,
+        session: AsyncSession,
+        mode: TransactionMode,
+        event_bus: IEventBus | None = None,
+        outbox_writer: OutboxWriter | None = None,
+    ) -> UnitOfWork:
+        return UnitOfWork(
+            session=session,
+            coalescing_rules=self._coalescing_rules,
+            audit_capture=self._audit_capture,
+            event_bus=event_bus,
+            outbox_writer=outbox_writer,
+            mode=mode,
+            retry_policy=self._retry_policy,
+        )
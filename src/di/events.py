@@ -0,0 +1,29 @@
+from collections.abc import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from pydantic import BaseModel
+
+from src.application.common.event_bus import IEventBus
+from src.infrastructure.event_bus import InProcessEventBus, OverflowPolicy
+
+
+class EventBusConfig(BaseModel):
+    queue_size: int = 1000
+    publish_timeout: float = 0.1
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
+
+
+class EventBusProvider(Provider):
+    def __init__(self, config: EventBusConfig):
+        super().__init__()
+        self._config = config
+
+    @provide(scope=Scope.APP, provides=IEventBus)
+    async def get_event_bus(self) -> AsyncGenerator[IEventBus, None]:  # noqa: UP043
+        bus = InProcessEventBus(
+            queue_size=self._config.queue_size,
+            publish_timeout=self._config.publish_timeout,
+            overflow=self._config.overflow,
+        )
+        yield bus
+        await bus.close()
@@ -0,0 +1,61 @@
+from collections.abc import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from pydantic import BaseModel
+
+from src.infrastructure.database.sharding import ShardRouter
+from src.infrastructure.outbox.feed import OutboxFeed, ShardedOutboxFeed
+from src.infrastructure.outbox.serializers import Codec, EventSerializer
+from src.infrastructure.outbox.writer import DEFAULT_NOTIFY_CHANNEL, OutboxWriter
+
+
+class OutboxConfig(BaseModel):
+    codec: Codec = Codec.ORJSON
+    compression_threshold: int | None = 1024
+    notify_channel: str | None = DEFAULT_NOTIFY_CHANNEL
+    feed_poll_interval: float = 1.0
+    feed_batch_size: int = 500
+    feed_queue_size: int = 1000
+    feed_gap_timeout: float = 5.0
+    feed_heartbeat_interval: float = 15.0
+
+
+class OutboxProvider(Provider):
+    def __init__(self, config: OutboxConfig):
+        super().__init__()
+        self._config = config
+
+    @provide(scope=Scope.APP)
+    def get_serializer(self) -> EventSerializer:
+        return EventSerializer(
+            codec=self._config.codec,
+            compression_threshold=self._config.compression_threshold,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_writer(self, serializer: EventSerializer) -> OutboxWriter:
+        return OutboxWriter(serializer=serializer, notify_channel=self._config.notify_channel)
+
+    @provide(scope=Scope.APP)
+    async def get_feed(
+        self, router: ShardRouter, serializer: EventSerializer
+    ) -> AsyncGenerator[ShardedOutboxFeed, None]:  # noqa: UP043
+        # Шарды пишут outbox в свои БД, поэтому каждую из них слушает своя лента
+        feed = ShardedOutboxFeed(
+            [
+                OutboxFeed(
+                    engine=engine,
+                    serializer=serializer,
+                    channel=self._config.notify_channel,
+                    poll_interval=self._config.feed_poll_interval,
+                    batch_size=self._config.feed_batch_size,
+                    queue_size=self._config.feed_queue_size,
+                    gap_timeout=self._config.feed_gap_timeout,
+                    heartbeat_interval=self._config.feed_heartbeat_interval,
+                )
+                for engine in router.engines
+            ],
+            heartbeat_interval=self._config.feed_heartbeat_interval,
+        )
+        yield feed
+        await feed.close()
@@ -0,0 +1,29 @@
+from collections.abc import AsyncGenerator
+
+from dishka import Provider, Scope, provide
+from pydantic import BaseModel
+
+from src.application.common.rate_limit import IRateLimiter
+from src.infrastructure.rate_limit import InMemoryRateLimiter, RedisRateLimiter
+
+
+class RateLimitConfig(BaseModel):
+    max_keys: int = 100_000
+    redis_url: str | None = None
+    key_prefix: str = "ratelimit"
+
+
+class RateLimitProvider(Provider):
+    def __init__(self, config: RateLimitConfig):
+        super().__init__()
+        self._config = config
+
+    @provide(scope=Scope.APP, provides=IRateLimiter)
+    async def get_rate_limiter(self) -> AsyncGenerator[IRateLimiter, None]:  # noqa: UP043
+        # Без Redis лимит считается отдельно в каждом worker'е
+        if self._config.redis_url is None:
+            yield InMemoryRateLimiter(max_keys=self._config.max_keys)
+            return
+        limiter = RedisRateLimiter.from_url(self._config.redis_url, key_prefix=self._config.key_prefix)
+        yield limiter
+        await limiter.close()
@@ -1,7 +1,9 @@
 from abc import abstractmethod
+from operator import attrgetter
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler
+from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import CoreSchema, core_schema
 
 
@@ -67,10 +69,26 @@ class UuidEntityId(EntityId[UUID]):
         instance_schema = core_schema.is_instance_schema(cls)
 
         # Объединяем обе схемы
-        return core_schema.union_schema(
-            [instance_schema, from_uuid_schema],
+        schema = core_schema.union_schema([instance_schema, from_uuid_schema])
+
+        # В JSON UUID достается attrgetter'ом (без Python-функции на каждое значение)
+        # и кодируется в Rust; model_dump() по-прежнему дает строку
+        return core_schema.json_or_python_schema(
+            json_schema=schema,
+            python_schema=core_schema.union_schema(
+                [instance_schema, from_uuid_schema],
+                serialization=core_schema.plain_serializer_function_ser_schema(
+                    lambda instance: str(instance.value),
+                    return_schema=core_schema.str_schema(),
+                ),
+            ),
             serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda instance: str(instance.value),
-                return_schema=core_schema.str_schema(),
+                attrgetter("_value"),
+                return_schema=core_schema.uuid_schema(),
+                when_used="json",
             ),
         )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        return handler(core_schema.uuid_schema())
@@ -0,0 +1,104 @@
+import struct
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.application.common.cache import CacheEntry, ICache
+
+try:
+    from redis import asyncio as redis
+except ImportError:  # pragma: no cover
+    redis = None
+
+# Заголовок записи в Redis: created_at, ttl, stale_ttl, статус, длина блока заголовков ответа
+_HEADER = struct.Struct(">dddHI")
+# Версия формата входит в ключ: после его смены записи прежнего формата не читаются
+_FORMAT_VERSION = 2
+
+
+class InMemoryCache(ICache):
+    """LRU-кеш ответов в памяти worker'а, ограниченный числом записей"""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_servable(time.time()):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def encode_entry(entry: CacheEntry) -> bytes:
+    headers = "\r\n".join(f"{name}: {value}" for name, value in entry.headers).encode("latin-1")
+    header = _HEADER.pack(entry.created_at, entry.ttl, entry.stale_ttl, entry.status_code, len(headers))
+    return header + headers + entry.body
+
+
+def decode_entry(data: bytes) -> CacheEntry:
+    created_at, ttl, stale_ttl, status_code, headers_size = _HEADER.unpack_from(data)
+    body_start = _HEADER.size + headers_size
+    headers = data[_HEADER.size : body_start].decode("latin-1")
+    return CacheEntry(
+        body=data[body_start:],
+        status_code=status_code,
+        headers=tuple(tuple(line.split(": ", 1)) for line in headers.split("\r\n")) if headers else (),
+        created_at=created_at,
+        ttl=ttl,
+        stale_ttl=stale_ttl,
+    )
+
+
+class RedisCache(ICache):
+    """Общий для всех worker'ов кеш ответов в Redis.
+
+    Запись хранится до stale_until (PX), поэтому устаревшие ответы удаляет сам Redis.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "cache") -> None:
+        self._client = client
+        self._key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "cache") -> "RedisCache":
+        if redis is None:
+            raise RuntimeError("Redis cache requires the 'redis' extra: pip install 'python-web-template[redis]'")
+        return cls(redis.Redis.from_url(url), key_prefix=key_prefix)
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}:v{_FORMAT_VERSION}:{key}"
+
+    async def get(self, key: str) -> CacheEntry | None:
+        data = await self._client.get(self._key(key))
+        if data is None:
+            return None
+        entry = decode_entry(data)
+        return entry if entry.is_servable(time.time()) else None
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        expires_in_ms = int((entry.stale_until - time.time()) * 1000)
+        if expires_in_ms > 0:
+            await self._client.set(self._key(key), encode_entry(entry), px=expires_in_ms)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._key(key))
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -1,5 +1,6 @@
 """Configuration module for the application."""
 
-from .settings import Settings, get_settings
+from .settings import Settings
+from .store import get_settings, on_settings_reload, reload_settings
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_settings", "on_settings_reload", "reload_settings"]
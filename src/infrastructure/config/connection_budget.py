@@ -0,0 +1,70 @@
+"""Connection budget planning for per-process database pools."""
+
+from dataclasses import dataclass
+
+
+class ConnectionBudgetError(ValueError):
+    """Raised when the requested processes cannot fit into the connection budget."""
+
+
+@dataclass(frozen=True)
+class PoolAllocation:
+    """Pool sizing for every application process."""
+
+    processes: int
+    pool_size: int
+    max_overflow: int
+    budget: int | None
+    reserved: int = 0
+
+    @property
+    def peak_connections(self) -> int:
+        """Connections used when every process exhausts its pool and overflow."""
+        return self.processes * (self.pool_size + self.max_overflow)
+
+    def describe(self) -> str:
+        budget = "unlimited" if self.budget is None else f"{self.budget} (reserved {self.reserved})"
+        return (
+            f"pool_size={self.pool_size} max_overflow={self.max_overflow} per process, "
+            f"{self.processes} processes, peak {self.peak_connections} connections, budget {budget}"
+        )
+
+
+def plan_connection_budget(
+    *,
+    pool_size: int,
+    max_overflow: int,
+    workers: int,
+    replicas: int = 1,
+    budget: int | None = None,
+    reserved: int = 0,
+) -> PoolAllocation:
+    """Fit per-process pools into a total connection budget.
+
+    Every uvicorn worker in every replica owns a separate pool, so the peak
+    is ``workers * replicas * (pool_size + max_overflow)``. The configured
+    pool size and overflow are upper bounds: each process gets an equal share
+    of the budget, filled with persistent connections first and overflow next.
+    """
+    processes = workers * replicas
+    if budget is None:
+        return PoolAllocation(processes=processes, pool_size=pool_size, max_overflow=max_overflow, budget=None)
+
+    available = budget - reserved
+    per_process = available // processes if available > 0 else 0
+    if per_process < 1:
+        raise ConnectionBudgetError(
+            f"Connection budget of {budget} (with {reserved} reserved) cannot give one connection to each of "
+            f"{processes} processes ({workers} workers x {replicas} replicas): "
+            f"raise DB_CONNECTION_BUDGET to at least {processes + reserved} or run fewer workers"
+        )
+
+    planned_pool_size = min(pool_size, per_process)
+    planned_overflow = min(max_overflow, per_process - planned_pool_size)
+    return PoolAllocation(
+        processes=processes,
+        pool_size=planned_pool_size,
+        max_overflow=planned_overflow,
+        budget=budget,
+        reserved=reserved,
+    )
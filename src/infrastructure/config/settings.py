@@ -1,13 +1,55 @@
 """Application settings configuration using Pydantic Settings."""
 
-from functools import lru_cache
-from typing import Literal
+import json
+import os
+from collections.abc import Mapping
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Annotated, Any, Literal
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from dotenv import dotenv_values
+from pydantic import Field, field_validator, model_validator
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    NoDecode,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
+from .connection_budget import PoolAllocation, plan_connection_budget
 
-class DatabaseSettings(BaseSettings):
+# Set while load_settings() builds a snapshot from values it has already read
+_preloaded: ContextVar[bool] = ContextVar("settings_preloaded", default=False)
+
+
+def _split_list(value):
+    """Accept a JSON list or a comma-separated string."""
+    if isinstance(value, str):
+        if value.lstrip().startswith("["):
+            return json.loads(value)
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
+class PreloadableSettings(BaseSettings):
+    """Base for settings that load_settings() builds without re-reading .env and the environment."""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        if _preloaded.get():
+            return (init_settings,)
+        return (init_settings, env_settings, dotenv_settings, file_secret_settings)
+
+
+class DatabaseSettings(PreloadableSettings):
     """Database configuration settings."""
 
     model_config = SettingsConfigDict(
@@ -15,6 +57,7 @@ class DatabaseSettings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     host: str = Field(default="localhost", description="Database host")
@@ -25,6 +68,58 @@ class DatabaseSettings(BaseSettings):
     echo: bool = Field(default=False, description="Echo SQL queries")
     pool_size: int = Field(default=5, description="Database connection pool size")
     max_overflow: int = Field(default=10, description="Max overflow connections")
+    pool_timeout: float = Field(default=30.0, gt=0, description="Seconds to wait for a pool connection")
+    pool_recycle: int = Field(
+        default=-1,
+        description="Recycle connections older than this many seconds (-1 to disable)",
+    )
+    pool_pre_ping: bool = Field(default=False, description="Test connections for liveness on checkout")
+    pool_use_lifo: bool = Field(default=False, description="Reuse the most recently returned connection first")
+    statement_cache_size: int = Field(
+        default=100,
+        ge=0,
+        description="asyncpg prepared statement cache size per connection (0 to disable)",
+    )
+    pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer in transaction mode (unique prepared statement names)",
+    )
+    pgbouncer_null_pool: bool = Field(
+        default=True,
+        description="Open a connection per checkout in PgBouncer mode instead of keeping a local pool",
+    )
+    connection_budget: int | None = Field(
+        default=None,
+        ge=1,
+        description="Total connections all workers of all replicas may open (empty to use pool settings as is)",
+    )
+    reserved_connections: int = Field(
+        default=0,
+        ge=0,
+        description="Connections of the budget kept free for migrations and admin sessions",
+    )
+    warmup_connections: int | None = Field(
+        default=None,
+        ge=0,
+        description="Pool connections opened during warmup; defaults to the pool size",
+    )
+    shard_urls: Annotated[list[str], NoDecode] = Field(
+        default_factory=list,
+        description="Comma-separated URLs of additional shards; the primary database is shard 0",
+    )
+    retry_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts for transactions failing with serialization errors or deadlocks",
+    )
+    retry_base_delay: float = Field(default=0.05, ge=0, description="Base backoff delay between retries in seconds")
+    retry_max_delay: float = Field(default=1.0, ge=0, description="Max backoff delay between retries in seconds")
+
+    @field_validator("shard_urls", mode="before")
+    @classmethod
+    def split_shard_urls(cls, v):
+        """Parse a comma-separated string or a JSON list."""
+        return _split_list(v)
 
     @property
     def url(self) -> str:
@@ -32,7 +127,7 @@ class DatabaseSettings(BaseSettings):
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
 
-class AppSettings(BaseSettings):
+class AppSettings(PreloadableSettings):
     """Application configuration settings."""
 
     model_config = SettingsConfigDict(
@@ -40,6 +135,7 @@ class AppSettings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     name: str = Field(default="Python Web Template", description="Application name")
@@ -56,10 +152,17 @@ class AppSettings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="API host")
     port: int = Field(default=8000, description="API port")
     reload: bool = Field(default=False, description="Auto-reload on code changes")
-    workers: int = Field(default=1, description="Number of worker processes")
+    workers: int = Field(default=1, ge=1, description="Number of worker processes")
+    warmup: bool = Field(default=True, description="Warm up pools, DI graph and schemas before reporting ready")
+    limit_max_requests: int | None = Field(
+        default=None,
+        ge=1,
+        description="Requests served by a worker before it is replaced with a fresh one",
+    )
+    replicas: int = Field(default=1, ge=1, description="Number of application instances sharing the database")
 
 
-class LoggingSettings(BaseSettings):
+class LoggingSettings(PreloadableSettings):
     """Logging configuration settings."""
 
     model_config = SettingsConfigDict(
@@ -67,6 +170,7 @@ class LoggingSettings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     level: Literal["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -87,7 +191,7 @@ class LoggingSettings(BaseSettings):
     backtrace: bool = Field(default=True, description="Enable backtrace in logs")
 
 
-class CORSSettings(BaseSettings):
+class CORSSettings(PreloadableSettings):
     """CORS configuration settings."""
 
     model_config = SettingsConfigDict(
@@ -95,27 +199,26 @@ class CORSSettings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     enabled: bool = Field(default=True, description="Enable CORS")
-    allow_origins: list[str] = Field(
+    allow_origins: Annotated[list[str], NoDecode] = Field(
         default=["*"],
         description="Allowed origins",
     )
     allow_credentials: bool = Field(default=True, description="Allow credentials")
-    allow_methods: list[str] = Field(default=["*"], description="Allowed methods")
-    allow_headers: list[str] = Field(default=["*"], description="Allowed headers")
+    allow_methods: Annotated[list[str], NoDecode] = Field(default=["*"], description="Allowed methods")
+    allow_headers: Annotated[list[str], NoDecode] = Field(default=["*"], description="Allowed headers")
 
     @field_validator("allow_origins", "allow_methods", "allow_headers", mode="before")
     @classmethod
     def split_str(cls, v):
-        """Split comma-separated string into list."""
-        if isinstance(v, str):
-            return [item.strip() for item in v.split(",")]
-        return v
+        """Parse a comma-separated string or a JSON list."""
+        return _split_list(v)
 
 
-class APISettings(BaseSettings):
+class APISettings(PreloadableSettings):
     """API configuration settings."""
 
     model_config = SettingsConfigDict(
@@ -123,6 +226,7 @@ class APISettings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     prefix: str = Field(default="/api/v1", description="API prefix")
@@ -134,9 +238,177 @@ class APISettings(BaseSettings):
         default="REST API for Python Web Template",
         description="API summary",
     )
+    request_timeout: float | None = Field(
+        default=30.0,
+        gt=0,
+        description="Default request deadline in seconds, applied to database statements",
+    )
+    request_timeout_header: str = Field(
+        default="X-Request-Timeout",
+        description="Header with a client-supplied request deadline in seconds",
+    )
+    max_request_timeout: float | None = Field(
+        default=300.0,
+        gt=0,
+        description="Upper bound for client-supplied request deadlines in seconds",
+    )
+    pool_stats: bool = Field(
+        default=False,
+        description="Expose database pool statistics at /health/db-pool for monitoring",
+    )
+    compression: bool = Field(default=True, description="Compress responses (zstd, br, gzip)")
+    compression_minimum_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Smallest response body in bytes that gets compressed",
+    )
+    compression_streaming: bool = Field(default=True, description="Compress streaming responses chunk by chunk")
+    compression_cache_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Size of the cache of compressed bodies per worker in bytes, 0 disables it",
+    )
+    max_concurrent_requests: int | None = Field(
+        default=None,
+        ge=1,
+        description="Requests processed concurrently per worker, the rest wait in a queue; unset disables the limit",
+    )
+    admission_queue_size: int = Field(default=100, ge=0, description="Requests that may wait for a free slot")
+    admission_queue_timeout: float = Field(
+        default=1.0,
+        gt=0,
+        description="Longest wait for a free slot in seconds before answering 503",
+    )
+    admission_pool_waiters: int | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Reject new requests with 503 while this many wait for a database connection; "
+            "unset uses the planned per-worker pool size, 0 disables it"
+        ),
+    )
+    admission_retry_after: int = Field(default=1, ge=0, description="Retry-After of 503 responses in seconds")
+    priority_paths: Annotated[list[str], NoDecode] = Field(
+        default=["/health"],
+        description="Comma-separated path prefixes that bypass admission control",
+    )
+
+    @field_validator("priority_paths", mode="before")
+    @classmethod
+    def split_priority_paths(cls, v):
+        """Parse a comma-separated string or a JSON list."""
+        return _split_list(v)
+
+
+class EventBusSettings(PreloadableSettings):
+    """In-process event bus configuration settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="EVENT_BUS_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+    queue_size: int = Field(default=1000, ge=1, description="Max queued events per subscriber")
+    publish_timeout: float = Field(
+        default=0.1,
+        ge=0,
+        description="Seconds to wait for room in a full subscriber queue before dropping the event",
+    )
+    overflow: Literal["block", "drop_newest", "drop_oldest"] = Field(
+        default="block",
+        description="What to do when a subscriber queue is full",
+    )
 
 
-class Settings(BaseSettings):
+class OutboxSettings(PreloadableSettings):
+    """Outbox storage and change feed configuration settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="OUTBOX_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+    codec: Literal["orjson", "msgpack"] = Field(default="orjson", description="Codec for stored events")
+    compression_threshold: int | None = Field(
+        default=1024,
+        ge=0,
+        description="Compress stored events larger than this many bytes with zstd (empty to disable)",
+    )
+    notify_channel: str | None = Field(
+        default="outbox_events",
+        description="PostgreSQL NOTIFY channel for new events (empty to rely on polling only)",
+    )
+    feed_poll_interval: float = Field(default=1.0, gt=0, description="Change feed polling interval in seconds")
+    feed_batch_size: int = Field(default=500, ge=1, description="Events read from the outbox per query")
+    feed_queue_size: int = Field(default=1000, ge=1, description="Buffered events per change feed client")
+    feed_gap_timeout: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds to wait for a missing outbox position before skipping it",
+    )
+    feed_heartbeat_interval: float = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds without events before a heartbeat is sent to change feed clients",
+    )
+
+
+class CacheSettings(PreloadableSettings):
+    """Endpoint response cache configuration settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+    enabled: bool = Field(default=True, description="Serve cached endpoint responses")
+    ttl: float = Field(default=30.0, gt=0, description="Default seconds a cached response stays fresh")
+    stale_ttl: float = Field(
+        default=30.0,
+        ge=0,
+        description="Default seconds an expired response is still served while it is refreshed",
+    )
+    max_entries: int = Field(default=10_000, ge=1, description="In-memory cache size per worker")
+    redis_url: str | None = Field(default=None, description="Redis URL for a cache shared by all workers")
+    key_prefix: str = Field(default="cache", description="Prefix of cache keys in Redis")
+
+
+class RateLimitSettings(PreloadableSettings):
+    """Token-bucket rate limiting configuration settings."""
+
+    model_config = SettingsConfigDict(
+        env_prefix="RATE_LIMIT_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+    enabled: bool = Field(default=False, description="Apply rate limits to requests")
+    rate: float = Field(default=20.0, gt=0, description="Requests per second allowed for each client")
+    burst: int = Field(default=40, ge=1, description="Requests a client may make at once after being idle")
+    key_header: str | None = Field(
+        default=None,
+        description=(
+            "Header with a client key verified upstream (e.g. by the gateway); "
+            "unset or missing limits clients by IP address"
+        ),
+    )
+    max_keys: int = Field(default=100_000, ge=1, description="In-memory buckets kept per worker")
+    redis_url: str | None = Field(default=None, description="Redis URL for limits shared by all workers")
+    key_prefix: str = Field(default="ratelimit", description="Prefix of rate limit keys in Redis")
+
+
+class Settings(PreloadableSettings):
     """Main application settings."""
 
     model_config = SettingsConfigDict(
@@ -144,6 +416,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
         case_sensitive=False,
+        frozen=True,
     )
 
     app: AppSettings = Field(default_factory=AppSettings)
@@ -151,9 +424,62 @@ class Settings(BaseSettings):
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     cors: CORSSettings = Field(default_factory=CORSSettings)
     api: APISettings = Field(default_factory=APISettings)
+    event_bus: EventBusSettings = Field(default_factory=EventBusSettings)
+    outbox: OutboxSettings = Field(default_factory=OutboxSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
+    rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
+
+    @model_validator(mode="after")
+    def check_connection_budget(self) -> "Settings":
+        """Fail fast when the worker pools cannot fit into the connection budget."""
+        _ = self.connection_plan
+        return self
+
+    @property
+    def connection_plan(self) -> PoolAllocation:
+        """Per-process pool sizing derived from the connection budget."""
+        return plan_connection_budget(
+            pool_size=self.database.pool_size,
+            max_overflow=self.database.max_overflow,
+            workers=self.app.workers,
+            replicas=self.app.replicas,
+            budget=self.database.connection_budget,
+            reserved=self.database.reserved_connections,
+        )
+
+
+def read_environment(env_file: str | Path | None = ".env") -> dict[str, str]:
+    """Read the .env file and the process environment in one pass.
+
+    Keys are upper-cased; the process environment overrides .env, as in pydantic-settings.
+    """
+    values: dict[str, str] = {}
+    if env_file is not None and Path(env_file).is_file():
+        values.update({key.upper(): value for key, value in dotenv_values(env_file).items() if value is not None})
+    values.update({key.upper(): value for key, value in os.environ.items()})
+    return values
+
+
+def _section_values(section: type[BaseSettings], environ: Mapping[str, str]) -> dict[str, Any]:
+    """Parse a section from the already read values with the pydantic-settings env source.
+
+    The source applies the same prefix matching, JSON decoding of complex
+    fields and NoDecode handling as reading the environment directly.
+    """
+    source = EnvSettingsSource(section)
+    source.env_vars = environ if source.case_sensitive else {key.lower(): value for key, value in environ.items()}
+    return source()
 
 
-@lru_cache
-def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+def load_settings(env_file: str | Path | None = ".env") -> Settings:
+    """Build an immutable settings snapshot from a single read of .env and the environment."""
+    environ = read_environment(env_file)
+    token = _preloaded.set(True)
+    try:
+        sections = {
+            name: field.annotation(**_section_values(field.annotation, environ))
+            for name, field in Settings.model_fields.items()
+        }
+        return Settings(**sections)
+    finally:
+        _preloaded.reset(token)
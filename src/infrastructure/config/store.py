@@ -0,0 +1,95 @@
+"""Current settings snapshot and hot reload of runtime-safe settings."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+from pydantic_settings import BaseSettings
+
+from .settings import Settings, load_settings
+
+# Sections and fields that can change without restarting workers; None means
+# the whole section. Everything else (database, pools, workers) needs a restart.
+RELOADABLE_FIELDS: dict[str, frozenset[str] | None] = {
+    "logging": frozenset({"level"}),
+    "cors": None,
+    "cache": frozenset({"enabled", "ttl", "stale_ttl"}),
+    "rate_limit": frozenset({"enabled", "rate", "burst", "key_header"}),
+}
+
+type ReloadCallback = Callable[[Settings], None]
+
+
+class SettingsStore:
+    """Holds the immutable settings snapshot and swaps it on reload.
+
+    Readers call get() and keep no references across requests, so a reload
+    is a single reference swap: nothing is rebuilt and the connection pool
+    is untouched.
+    """
+
+    def __init__(self, env_file: str | Path | None = ".env") -> None:
+        self._env_file = env_file
+        self._settings: Settings | None = None
+        self._callbacks: list[ReloadCallback] = []
+
+    def get(self) -> Settings:
+        if self._settings is None:
+            self._settings = load_settings(self._env_file)
+        return self._settings
+
+    def subscribe(self, callback: ReloadCallback) -> None:
+        """Call callback with the new snapshot after every reload."""
+        self._callbacks.append(callback)
+
+    def reload(self) -> Settings:
+        """Re-read .env and the environment and apply the reloadable settings."""
+        current = self.get()
+        fresh = load_settings(self._env_file)
+        updates = {}
+        for name in Settings.model_fields:
+            section, fresh_section = getattr(current, name), getattr(fresh, name)
+            if section == fresh_section:
+                continue
+            updates[name] = self._merge_section(name, section, fresh_section)
+
+        self._settings = current.model_copy(update=updates)
+        logger.info("Settings reloaded: {}", ", ".join(updates) or "no changes")
+        for callback in self._callbacks:
+            try:
+                callback(self._settings)
+            except Exception:  # noqa: BLE001
+                logger.exception("Settings reload callback {!r} failed", callback)
+        return self._settings
+
+    @staticmethod
+    def _merge_section[S: BaseSettings](name: str, section: S, fresh_section: S) -> S:
+        reloadable = RELOADABLE_FIELDS.get(name, frozenset())
+        if reloadable is None:
+            return fresh_section
+        changed = {
+            field for field in type(section).model_fields if getattr(section, field) != getattr(fresh_section, field)
+        }
+        if ignored := changed - reloadable:
+            logger.warning("Settings {}.{} changed but need a restart to apply", name, ", ".join(sorted(ignored)))
+        if not (applied := changed & reloadable):
+            return section
+        return section.model_copy(update={field: getattr(fresh_section, field) for field in applied})
+
+
+_store = SettingsStore()
+
+
+def get_settings() -> Settings:
+    """Get the current settings snapshot."""
+    return _store.get()
+
+
+def reload_settings() -> Settings:
+    """Re-read settings and apply the runtime-safe ones (installed as the SIGHUP handler)."""
+    return _store.reload()
+
+
+def on_settings_reload(callback: ReloadCallback) -> None:
+    """Register a callback for the new snapshot after every reload."""
+    _store.subscribe(callback)
@@ -0,0 +1,131 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import batched
+from typing import Any
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm.attributes import set_committed_value
+
+BULK_WRITER_KEY = "bulk_writer"
+
+
+@dataclass
+class _PendingSave:
+    model: Any
+    value: Any
+    to_entity: Callable[[Any], Any]
+
+
+class BulkWriter:
+    """Буфер сохранений репозиториев для uow.bulk().
+
+    Пока буфер активен, SaveMethodMixin только складывает модели сюда.
+    flush() одним SELECT на пачку находит уже существующие строки, переносит
+    в них новые значения, остальные модели добавляет в сессию и выполняет
+    один flush: INSERT группируются через insertmanyvalues, UPDATE — через
+    executemany. Серверные значения по умолчанию перечитываются только при
+    refresh=True, тоже одним SELECT на пачку.
+    """
+
+    def __init__(self, session: AsyncSession, refresh: bool = False, batch_size: int = 1000) -> None:
+        self._session = session
+        self._refresh = refresh
+        self._batch_size = batch_size
+        self._pending: list[_PendingSave] = []
+        # По одному результату на каждый вызов save() в порядке вызовов; заполняется в flush().
+        # При повторном сохранении одной строки с refresh=True все ее вызовы получают итоговое состояние
+        self.saved: list[Any] = []
+
+    @staticmethod
+    def current(session: AsyncSession) -> "BulkWriter | None":
+        return session.info.get(BULK_WRITER_KEY)
+
+    def add(self, model: Any, value: Any, to_entity: Callable[[Any], Any]) -> None:
+        self._pending.append(_PendingSave(model=model, value=value, to_entity=to_entity))
+
+    async def flush(self) -> None:
+        by_mapper: dict[Mapper, list[tuple[int, _PendingSave]]] = {}
+        for index, pending in enumerate(self._pending):
+            by_mapper.setdefault(inspect(pending.model).mapper, []).append((index, pending))
+        self._pending = []
+
+        staged = {mapper: await self._stage(mapper, saves) for mapper, saves in by_mapper.items()}
+        await self._session.flush()
+        results: dict[int, Any] = {}
+        for mapper, saves in staged.items():
+            if self._refresh:
+                # Повторные сохранения одной строки делят объект, перечитываем его один раз
+                targets = list({id(target): target for _, target, _ in saves}.values())
+                await self._refresh_models(mapper, targets)
+                results.update((index, pending.to_entity(target)) for index, target, pending in saves)
+            else:
+                results.update((index, pending.value) for index, _, pending in saves)
+        self.saved.extend(results[index] for index in sorted(results))
+
+    async def _stage(
+        self, mapper: Mapper, saves: list[tuple[int, _PendingSave]]
+    ) -> list[tuple[int, Any, _PendingSave]]:
+        if len(mapper.primary_key) != 1:
+            # Составной ключ не собрать в один IN, поэтому обычный merge
+            return [(index, await self._session.merge(pending.model), pending) for index, pending in saves]
+
+        pk_key = mapper.get_property_by_column(mapper.primary_key[0]).key
+        # Повторное сохранение одной сущности внутри блока: в строку пишется последнее
+        keyed: dict[str, list[tuple[int, _PendingSave]]] = {}
+        staged: list[tuple[int, Any, _PendingSave]] = []
+        for index, pending in saves:
+            pk = getattr(pending.model, pk_key)
+            if pk is None:
+                self._session.add(pending.model)
+                staged.append((index, pending.model, pending))
+            else:
+                keyed.setdefault(str(pk), []).append((index, pending))
+
+        existing = await self._load_existing(
+            mapper, pk_key, [getattr(group[-1][1].model, pk_key) for group in keyed.values()]
+        )
+        for key, group in keyed.items():
+            latest = group[-1][1]
+            target = existing.get(key)
+            if target is None:
+                target = latest.model
+                self._session.add(target)
+            else:
+                state = inspect(latest.model)
+                for attr in mapper.column_attrs:
+                    if attr.key != pk_key and attr.key in state.dict:
+                        setattr(target, attr.key, state.dict[attr.key])
+            staged.extend((index, target, pending) for index, pending in group)
+        return staged
+
+    async def _load_existing(self, mapper: Mapper, pk_key: str, pks: list[Any]) -> dict[str, Any]:
+        pk_column = mapper.primary_key[0]
+        # Ключи в моделях могут быть строками, а в загруженных объектах — UUID,
+        # поэтому сопоставляем их по строковому представлению
+        existing = {}
+        for chunk in batched(pks, self._batch_size, strict=False):
+            result = await self._session.execute(select(mapper).where(pk_column.in_(chunk)))
+            existing.update({str(getattr(obj, pk_key)): obj for obj in result.scalars()})
+        return existing
+
+    async def _refresh_models(self, mapper: Mapper, models: list[Any]) -> None:
+        if len(mapper.primary_key) != 1:
+            for model in models:
+                await self._session.refresh(model)
+            return
+
+        pk_column = mapper.primary_key[0]
+        pk_key = mapper.get_property_by_column(pk_column).key
+        attrs = [attr for attr in mapper.column_attrs if attr.key != pk_key]
+        by_key = {str(getattr(model, pk_key)): model for model in models}
+        for chunk in batched(models, self._batch_size, strict=False):
+            # Читаем колонки, а не объекты, чтобы не плодить копии в identity map
+            query = select(pk_column, *(attr.columns[0] for attr in attrs)).where(
+                pk_column.in_([getattr(model, pk_key) for model in chunk])
+            )
+            for pk, *values in await self._session.execute(query):
+                model = by_key[str(pk)]
+                for attr, value in zip(attrs, values, strict=True):
+                    set_committed_value(model, attr.key, value)
@@ -0,0 +1,66 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+QUERY_CANCELED = "57014"
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(TimeoutError):
+    """Срок выполнения запроса истек до обращения к базе"""
+
+
+@contextmanager
+def request_deadline(timeout: float | None) -> Iterator[None]:
+    """Задает срок выполнения для кода внутри блока (включая вложенные задачи).
+
+    Вложенный блок не может продлить срок внешнего, только сократить.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    current = _deadline.get()
+    if current is not None and (deadline is None or current < deadline):
+        deadline = current
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Секунды до истечения срока или None, если срок не задан"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def statement_timeout_sql() -> str | None:
+    remaining = remaining_time()
+    if remaining is None:
+        return None
+    if remaining <= 0:
+        raise DeadlineExceededError("Request deadline exceeded before the transaction started")
+    # 0 в statement_timeout отключает ограничение, поэтому не меньше 1 мс
+    return f"SET LOCAL statement_timeout = {max(int(remaining * 1000), 1)}"
+
+
+def _set_statement_timeout(session, transaction, connection) -> None:
+    # SET LOCAL действует до конца внешней транзакции, для SAVEPOINT повторять не нужно
+    if transaction.nested or connection.dialect.name != "postgresql":
+        return
+    sql = statement_timeout_sql()
+    if sql is not None:
+        connection.exec_driver_sql(sql)
+
+
+def bind_deadline(session: AsyncSession) -> None:
+    """Ограничивает каждую транзакцию сессии оставшимся сроком запроса через statement_timeout.
+
+    Срок читается в момент начала транзакции, поэтому сессия, созданная до
+    request_deadline(), тоже его учитывает.
+    """
+    event.listen(session.sync_session, "after_begin", _set_statement_timeout)
@@ -1,3 +1,4 @@
 from .base import Base
+from .outbox import OutboxRecord
 
-__all__ = ["Base"]
+__all__ = ["Base", "OutboxRecord"]
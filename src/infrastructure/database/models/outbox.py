@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, LargeBinary, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class OutboxRecord(Base):
+    """Событие outbox, сохраненное в той же транзакции, что и изменения данных.
+
+    ``position`` монотонно растет и служит курсором для чтения ленты событий.
+    """
+
+    position: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    id: Mapped[uuid.UUID] = mapped_column(unique=True, nullable=False)
+    event_type: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    resource: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from typing import Any
 
+from sqlalchemy import Select, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.common.entity import EntityId
+
+from ..bulk import BulkWriter
+
 
 class SaveMethodMixin[ENTITY_T](ABC):
     _session: AsyncSession
@@ -15,6 +22,11 @@ class SaveMethodMixin[ENTITY_T](ABC):
 
     async def save(self, value: ENTITY_T) -> ENTITY_T:
         model = self.entity_to_model(value)
+        bulk_writer = BulkWriter.current(self._session)
+        if bulk_writer is not None:
+            # В режиме uow.bulk() запись откладывается до выхода из блока
+            bulk_writer.add(model, value, self.model_to_entity)
+            return value
         merged_model = await self._session.merge(model)
         await self._session.flush()
         await self._session.refresh(merged_model)
@@ -33,6 +45,65 @@ class GetByIdMethodMixin[ENTITY_T, ENTITY_ID_T](ABC):
         return self.model_to_entity(model) if model else None
 
 
+class GetManyByIdMethodMixin[ENTITY_T, ENTITY_ID_T](ABC):
+    _session: AsyncSession
+    _model_cls: type
+
+    @abstractmethod
+    def model_to_entity(self, model: Any) -> ENTITY_T: ...
+
+    async def get_many_by_id(self, values: Sequence[ENTITY_ID_T]) -> list[ENTITY_T]:
+        if not values:
+            return []
+        pk_column = inspect(self._model_cls).primary_key[0]
+        keys = [value.value if isinstance(value, EntityId) else value for value in values]
+        result = await self._session.execute(select(self._model_cls).where(pk_column.in_(keys)))
+        return [self.model_to_entity(model) for model in result.scalars()]
+
+
+class StreamMethodMixin[ENTITY_T](ABC):
+    _session: AsyncSession
+    _model_cls: type
+
+    @abstractmethod
+    def model_to_entity(self, model: Any) -> ENTITY_T: ...
+
+    async def stream(self, statement: Select | None = None, *, batch_size: int = 1000) -> AsyncIterator[ENTITY_T]:
+        """Отдает сущности по одной, читая строки серверным курсором пачками по batch_size.
+
+        В памяти держится не больше одной пачки, сколько бы строк ни вернул запрос.
+        """
+        statement = select(self._model_cls) if statement is None else statement
+        result = await self._session.stream_scalars(statement.execution_options(yield_per=batch_size))
+        try:
+            async for model in result:
+                yield self.model_to_entity(model)
+        finally:
+            await result.close()
+
+
+class VersionMethodMixin[ENTITY_ID_T](ABC):
+    """Версии записей по updated_at (TimestampMixin) без загрузки самих сущностей"""
+
+    _session: AsyncSession
+    _model_cls: type
+
+    async def get_updated_at(self, value: ENTITY_ID_T) -> datetime | None:
+        pk_column = inspect(self._model_cls).primary_key[0]
+        key = value.value if isinstance(value, EntityId) else value
+        return await self._session.scalar(select(self._model_cls.updated_at).where(pk_column == key))
+
+    async def get_collection_version(self, statement: Select | None = None) -> tuple[datetime | None, int]:
+        """max(updated_at) и число строк выборки statement (по умолчанию всей таблицы)"""
+        if statement is None:
+            query = select(func.max(self._model_cls.updated_at), func.count()).select_from(self._model_cls)
+        else:
+            rows = statement.order_by(None).limit(None).offset(None).subquery()
+            query = select(func.max(rows.c.updated_at), func.count()).select_from(rows)
+        updated_at, count = (await self._session.execute(query)).one()
+        return updated_at, count
+
+
 class DeleteByIdMethodMixin[ENTITY_ID_T](ABC):
     _session: AsyncSession
     _model_cls: type
@@ -0,0 +1,37 @@
+import random
+from dataclasses import dataclass
+
+from sqlalchemy.exc import DBAPIError
+
+SERIALIZATION_FAILURE = "40001"
+DEADLOCK_DETECTED = "40P01"
+
+
+def get_sqlstate(exc: DBAPIError) -> str | None:
+    """SQLSTATE исходной ошибки драйвера (asyncpg и psycopg 3 — sqlstate, psycopg2 — pgcode)"""
+    orig = exc.orig
+    return getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Политика повтора транзакций, прерванных из-за конкурентного доступа.
+
+    Задержка выбирается случайно в диапазоне [0, base_delay * 2^(attempt-1)],
+    ограниченном max_delay, чтобы конфликтующие транзакции не повторялись синхронно.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    sqlstates: frozenset[str] = frozenset({SERIALIZATION_FAILURE, DEADLOCK_DETECTED})
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        return isinstance(exc, DBAPIError) and get_sqlstate(exc) in self.sqlstates
+
+    def delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))  # noqa: S311
@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.domain.common.entity import EntityId
+from src.infrastructure.unit_of_work import UnitOfWork
+
+from .deadline import bind_deadline
+
+type ShardKey = EntityId | UUID | str
+
+
+def shard_index(key: ShardKey, shard_count: int) -> int:
+    """Номер шарда для ключа.
+
+    Хешируется строковое представление, поэтому UuidEntityId, UUID и его
+    строковая форма попадают на один шард. hash() не подходит: он меняется
+    между процессами.
+    """
+    digest = hashlib.blake2b(str(key).encode(), digest_size=8).digest()
+    return int.from_bytes(digest) % shard_count
+
+
+class ShardRouter:
+    """Распределяет ключи (id сущностей или ключи арендаторов) по движкам шардов.
+
+    Шард выбирается остатком от деления хеша ключа на число шардов, поэтому
+    число шардов нельзя менять без переноса данных.
+    """
+
+    def __init__(self, engines: Sequence[AsyncEngine]) -> None:
+        if not engines:
+            raise ValueError("At least one shard engine is required")
+        self._engines = tuple(engines)
+
+    @property
+    def engines(self) -> tuple[AsyncEngine, ...]:
+        return self._engines
+
+    def shard_for(self, key: ShardKey) -> int:
+        return shard_index(key, len(self._engines))
+
+    def engine_for(self, key: ShardKey) -> AsyncEngine:
+        return self._engines[self.shard_for(key)]
+
+    def session(self, shard: int) -> AsyncSession:
+        session = AsyncSession(self._engines[shard], expire_on_commit=False)
+        bind_deadline(session)
+        return session
+
+    def group[K: ShardKey](self, keys: Iterable[K]) -> dict[int, list[K]]:
+        groups: dict[int, list[K]] = {}
+        for key in keys:
+            groups.setdefault(self.shard_for(key), []).append(key)
+        return groups
+
+    async def scatter[K: ShardKey, T](
+        self,
+        keys: Iterable[K],
+        fetch: Callable[[AsyncSession, list[K]], Awaitable[Sequence[T]]],
+    ) -> list[T]:
+        """Выполняет fetch параллельно на каждом шарде со своей частью ключей и объединяет результаты.
+
+        Результаты идут по порядку шардов, внутри шарда — в порядке, который вернул fetch.
+        """
+
+        async def fetch_shard(shard: int, shard_keys: list[K]) -> Sequence[T]:
+            async with self.session(shard) as session:
+                return await fetch(session, shard_keys)
+
+        groups = sorted(self.group(keys).items())
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(fetch_shard(shard, shard_keys)) for shard, shard_keys in groups]
+        return [item for task in tasks for item in task.result()]
+
+
+class ShardedUnitOfWorkFactory:
+    """Открывает UnitOfWork в отдельной сессии шарда, которому принадлежит ключ"""
+
+    def __init__(self, router: ShardRouter, make_unit_of_work: Callable[[AsyncSession], UnitOfWork]) -> None:
+        self._router = router
+        self._make_unit_of_work = make_unit_of_work
+
+    @asynccontextmanager
+    async def for_key(self, key: ShardKey) -> AsyncIterator[UnitOfWork]:
+        shard = self._router.shard_for(key)
+        async with self._router.session(shard) as session, self._make_unit_of_work(session) as uow:
+            yield uow
+
+
+class _GetManyById[ENTITY_T, ENTITY_ID_T](Protocol):
+    async def get_many_by_id(self, values: Sequence[ENTITY_ID_T]) -> list[ENTITY_T]: ...
+
+
+class ShardedReader[ENTITY_T, ENTITY_ID_T: ShardKey]:
+    """Чтение сущностей по id со всех шардов через обычный репозиторий.
+
+    get_many_by_id раскладывает id по шардам и опрашивает их параллельно,
+    каждый шард — одним запросом в своей сессии.
+    """
+
+    def __init__(
+        self,
+        router: ShardRouter,
+        repository_factory: Callable[[AsyncSession], _GetManyById[ENTITY_T, ENTITY_ID_T]],
+    ) -> None:
+        self._router = router
+        self._repository_factory = repository_factory
+
+    async def get_by_id(self, value: ENTITY_ID_T) -> ENTITY_T | None:
+        found = await self.get_many_by_id([value])
+        return found[0] if found else None
+
+    async def get_many_by_id(self, values: Iterable[ENTITY_ID_T]) -> list[ENTITY_T]:
+        return await self._router.scatter(
+            values, lambda session, shard_values: self._repository_factory(session).get_many_by_id(shard_values)
+        )
@@ -0,0 +1,152 @@
+import bisect
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Границы корзин гистограммы ожидания соединения, в секундах
+DEFAULT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class CheckoutStats:
+    """Счетчики выдачи соединений из пула в рамках одного запроса"""
+
+    checkouts: int = 0
+
+
+_request_stats: ContextVar[CheckoutStats | None] = ContextVar("db_checkout_stats", default=None)
+
+
+@contextmanager
+def track_checkouts() -> Iterator[CheckoutStats]:
+    """Считает выдачи соединений, сделанные внутри блока (включая вложенные задачи)"""
+    stats = CheckoutStats()
+    token = _request_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _request_stats.reset(token)
+
+
+class Histogram:
+    """Кумулятивная гистограмма в стиле Prometheus"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_WAIT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> dict[str, int]:
+        result = {}
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self._counts, strict=True):
+            total += count
+            result["+Inf" if bound == float("inf") else str(bound)] = total
+        return result
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Снимок состояния пула соединений"""
+
+    size: int | None
+    checked_in: int | None
+    checked_out: int | None
+    overflow: int | None
+    waiting: int
+    checkouts: int
+    checkout_timeouts: int
+    wait_count: int
+    wait_sum: float
+    wait_buckets: dict[str, int]
+
+
+class PoolTelemetry:
+    """Телеметрия пулов соединений движков.
+
+    С шардами instrument() вызывается для каждого движка, и все счетчики и
+    размеры в snapshot() суммируются по их пулам.
+
+    Обработчик события checkout выполняется в greenlet SQLAlchemy, который
+    наследует контекст вызывающей корутины, поэтому выдачи соединений
+    попадают в счетчик текущего запроса из track_checkouts.
+
+    Время ожидания соединения, число ожидающих (waiting) и таймауты выдачи
+    измеряются только для пула из pool_class(): событий SQLAlchemy для
+    ожидания в очереди пула нет.
+    """
+
+    def __init__(self, wait_buckets: Sequence[float] = DEFAULT_WAIT_BUCKETS) -> None:
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        # Сколько корутин сейчас ждут соединение в очереди пула
+        self.waiting = 0
+        self.wait_time = Histogram(wait_buckets)
+        self._engines: list[AsyncEngine] = []
+
+    def pool_class(self) -> type[QueuePool]:
+        """Класс пула для create_async_engine(poolclass=...), замеряющий ожидание соединения"""
+        telemetry = self
+
+        class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+            def _do_get(self):
+                started = time.perf_counter()
+                # Ждет только вызов при исчерпанном пуле; открытие нового соединения ожиданием не считается
+                blocking = self._max_overflow > -1 and self._overflow >= self._max_overflow
+                if blocking:
+                    telemetry.waiting += 1
+                try:
+                    return super()._do_get()
+                except sa_exc.TimeoutError:
+                    telemetry.checkout_timeouts += 1
+                    raise
+                finally:
+                    if blocking:
+                        telemetry.waiting -= 1
+                    telemetry.wait_time.observe(time.perf_counter() - started)
+
+        return InstrumentedQueuePool
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        self._engines.append(engine)
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+
+    def snapshot(self) -> PoolStats:
+        # Размеры есть только у QueuePool; у StaticPool и NullPool их нет
+        pools = [engine.sync_engine.pool for engine in self._engines]
+        queue_pools = [pool for pool in pools if isinstance(pool, QueuePool)]
+
+        def total(measure: Callable[[QueuePool], int]) -> int | None:
+            return sum(measure(pool) for pool in queue_pools) if queue_pools else None
+
+        return PoolStats(
+            size=total(QueuePool.size),
+            checked_in=total(QueuePool.checkedin),
+            checked_out=total(QueuePool.checkedout),
+            overflow=total(lambda pool: max(pool.overflow(), 0)),
+            waiting=self.waiting,
+            checkouts=self.checkouts,
+            checkout_timeouts=self.checkout_timeouts,
+            wait_count=self.wait_time.count,
+            wait_sum=self.wait_time.sum,
+            wait_buckets=self.wait_time.cumulative(),
+        )
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        self.checkouts += 1
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.checkouts += 1
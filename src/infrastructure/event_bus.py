@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import contextvars
+from collections.abc import Callable, Iterable, Sequence
+from enum import StrEnum
+
+from loguru import logger
+
+from src.application.common.event_bus import EventHandler, IEventBus
+from src.application.common.value_objects import EventType, OutboxEvent
+
+
+class OverflowPolicy(StrEnum):
+    """Поведение при заполненной очереди подписчика"""
+
+    BLOCK = "block"  # Ждать свободного места не дольше publish_timeout, затем отбросить событие
+    DROP_NEWEST = "drop_newest"  # Сразу отбросить новое событие
+    DROP_OLDEST = "drop_oldest"  # Вытеснить самое старое событие из очереди
+
+
+class _Subscription:
+    def __init__(
+        self,
+        event_types: frozenset[EventType],
+        handler: EventHandler,
+        queue_size: int,
+        overflow: OverflowPolicy,
+    ) -> None:
+        self.event_types = event_types
+        self.handler = handler
+        self.overflow = overflow
+        self.queue: asyncio.Queue[OutboxEvent] = asyncio.Queue(maxsize=queue_size)
+        self.task: asyncio.Task | None = None
+        self.dropped = 0
+
+    @property
+    def name(self) -> str:
+        return getattr(self.handler, "__qualname__", repr(self.handler))
+
+    async def run(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.handler(event)
+            except Exception:  # noqa: BLE001
+                logger.exception("Event bus subscriber {} failed on event {}", self.name, event.id)
+            finally:
+                self.queue.task_done()
+
+
+class InProcessEventBus(IEventBus):
+    """Асинхронная шина событий внутри процесса.
+
+    У каждого подписчика своя ограниченная очередь и задача-обработчик,
+    поэтому медленный или падающий подписчик не влияет на остальных и на
+    запрос, который публикует события.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = 1000,
+        publish_timeout: float = 0.1,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        self._queue_size = queue_size
+        self._publish_timeout = publish_timeout
+        self._overflow = overflow
+        self._subscriptions: list[_Subscription] = []
+
+    def subscribe(
+        self,
+        event_types: EventType | Iterable[EventType],
+        handler: EventHandler,
+        *,
+        queue_size: int | None = None,
+        overflow: OverflowPolicy | None = None,
+    ) -> Callable[[], None]:
+        types = frozenset([event_types] if isinstance(event_types, EventType) else event_types)
+        subscription = _Subscription(
+            event_types=types,
+            handler=handler,
+            queue_size=queue_size or self._queue_size,
+            overflow=overflow or self._overflow,
+        )
+        self._subscriptions.append(subscription)
+
+        def unsubscribe() -> None:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if subscription.task is not None:
+                subscription.task.cancel()
+
+        return unsubscribe
+
+    async def publish(self, events: Sequence[OutboxEvent]) -> None:
+        for event in events:
+            for subscription in self._subscriptions:
+                if event.event_type in subscription.event_types:
+                    await self._enqueue(subscription, event)
+
+    async def join(self) -> None:
+        """Ожидает обработки всех опубликованных событий"""
+        for subscription in list(self._subscriptions):
+            await subscription.queue.join()
+
+    async def close(self) -> None:
+        for subscription in self._subscriptions:
+            if subscription.task is not None:
+                subscription.task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await subscription.task
+                subscription.task = None
+        self._subscriptions.clear()
+
+    async def _enqueue(self, subscription: _Subscription, event: OutboxEvent) -> None:
+        if subscription.task is None:
+            # Обработчик запускается лениво, так как подписка возможна до старта event loop.
+            # Пустой контекст: задача живет дольше запроса и не должна унаследовать его срок
+            subscription.task = asyncio.create_task(
+                subscription.run(), name=f"event-bus:{subscription.name}", context=contextvars.Context()
+            )
+
+        queue = subscription.queue
+        if not queue.full():
+            queue.put_nowait(event)
+            return
+
+        if subscription.overflow is OverflowPolicy.DROP_OLDEST:
+            queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(event)
+            self._on_drop(subscription, "oldest event evicted")
+            return
+
+        if subscription.overflow is OverflowPolicy.BLOCK:
+            try:
+                await asyncio.wait_for(queue.put(event), timeout=self._publish_timeout)
+                return
+            except TimeoutError:
+                pass
+        self._on_drop(subscription, f"event {event.id} dropped")
+
+    def _on_drop(self, subscription: _Subscription, reason: str) -> None:
+        subscription.dropped += 1
+        logger.warning(
+            "Event bus queue of {} is full: {} (dropped total: {})",
+            subscription.name,
+            reason,
+            subscription.dropped,
+        )
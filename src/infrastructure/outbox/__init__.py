@@ -0,0 +1,12 @@
+from .audit import AuditCapture, AuditLogCollector, AuditRule
+from .serializers import Codec, Compression, EventSerializationError, EventSerializer
+
+__all__ = [
+    "AuditCapture",
+    "AuditLogCollector",
+    "AuditRule",
+    "Codec",
+    "Compression",
+    "EventSerializationError",
+    "EventSerializer",
+]
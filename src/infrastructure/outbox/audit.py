@@ -0,0 +1,163 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import InstanceState, Session
+
+from src.application.common.value_objects import OutboxEvent
+from src.infrastructure.database.models.outbox import OutboxRecord
+
+# Служебные таблицы не аудируются: иначе записи outbox попадали бы в аудит следующей транзакции
+_INFRASTRUCTURE_MODELS: tuple[type, ...] = (OutboxRecord,)
+
+
+@dataclass(frozen=True)
+class AuditRule:
+    """Настройки аудита для одной модели"""
+
+    include: Iterable[str] | None = None
+    exclude: Iterable[str] = ()
+    entity_type: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.include is not None:
+            object.__setattr__(self, "include", frozenset(self.include))
+        object.__setattr__(self, "exclude", frozenset(self.exclude))
+
+    def is_audited(self, key: str) -> bool:
+        return (self.include is None or key in self.include) and key not in self.exclude
+
+
+@dataclass(frozen=True)
+class AuditCapture:
+    """Конфигурация автоматического аудита изменений моделей.
+
+    Модели без правила в ``models`` аудируются по ``default_rule``, а если
+    оно не задано — пропускаются. Служебные модели (OutboxRecord) не
+    аудируются никогда.
+    """
+
+    models: Mapping[type, AuditRule] = field(default_factory=dict)
+    default_rule: AuditRule | None = None
+
+    def rule_for(self, model_cls: type) -> AuditRule | None:
+        if issubclass(model_cls, _INFRASTRUCTURE_MODELS):
+            return None
+        for cls in model_cls.__mro__:
+            rule = self.models.get(cls)
+            if rule is not None:
+                return rule
+        return self.default_rule
+
+
+@dataclass
+class _EntityChanges:
+    entity_type: str
+    operation: str
+    changes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    entity_id: str | None = None
+
+
+class AuditLogCollector:
+    """Собирает изменения моделей сессии в события AUDIT_LOG.
+
+    Изменения читаются из истории атрибутов в ``before_flush``, поэтому
+    старые значения не требуют дополнительных SELECT. Идентификаторы новых
+    объектов известны только после flush и дописываются в ``after_flush_postexec``.
+    Все изменения одной сущности за транзакцию попадают в одно событие.
+    """
+
+    def __init__(self, config: AuditCapture) -> None:
+        self._config = config
+        self._entities: dict[InstanceState, _EntityChanges] = {}
+        self._pending: list[tuple[InstanceState, _EntityChanges]] = []
+
+    def attach(self, session: Session) -> None:
+        event.listen(session, "before_flush", self._before_flush)
+        event.listen(session, "after_flush_postexec", self._after_flush_postexec)
+
+    def detach(self, session: Session) -> None:
+        event.remove(session, "before_flush", self._before_flush)
+        event.remove(session, "after_flush_postexec", self._after_flush_postexec)
+
+    def clear(self) -> None:
+        self._entities.clear()
+        self._pending.clear()
+
+    def snapshot(self) -> dict[InstanceState, _EntityChanges]:
+        """Копия собранных изменений для отката к ней через restore()"""
+        return {state: replace(entity, changes=dict(entity.changes)) for state, entity in self._entities.items()}
+
+    def restore(self, snapshot: dict[InstanceState, _EntityChanges]) -> None:
+        self._entities = snapshot
+        self._pending.clear()
+
+    def drain(self) -> list[OutboxEvent]:
+        events = [
+            OutboxEvent.create_audit_log(
+                entity_type=entity.entity_type,
+                entity_id=entity.entity_id,
+                operation=entity.operation,
+                changes=entity.changes,
+            )
+            for entity in self._entities.values()
+            if entity.entity_id is not None and (entity.changes or entity.operation != "update")
+        ]
+        self.clear()
+        return events
+
+    def _before_flush(self, session: Session, flush_context: Any, instances: Any) -> None:
+        for obj in session.new:
+            self._track(obj, "create")
+        for obj in session.dirty:
+            self._track(obj, "update")
+        for obj in session.deleted:
+            self._track(obj, "delete")
+
+    def _after_flush_postexec(self, session: Session, flush_context: Any) -> None:
+        for state, entity in self._pending:
+            if state.identity is not None:
+                entity.entity_id = ",".join(str(value) for value in state.identity)
+            if entity.operation == "create":
+                # Значения по умолчанию появляются в объекте только после INSERT
+                rule = self._config.rule_for(state.class_)
+                for attr in state.mapper.column_attrs:
+                    if attr.key in state.dict and rule.is_audited(attr.key):
+                        entity.changes.setdefault(attr.key, {"old": None, "new": state.dict[attr.key]})
+        self._pending.clear()
+
+    def _track(self, obj: object, operation: str) -> None:
+        state: InstanceState = inspect(obj)
+        rule = self._config.rule_for(state.class_)
+        if rule is None:
+            return
+
+        changes = {}
+        for attr in state.mapper.column_attrs:
+            if not rule.is_audited(attr.key):
+                continue
+            if operation == "delete":
+                if attr.key in state.dict:
+                    changes[attr.key] = {"old": state.dict[attr.key], "new": None}
+                continue
+            history = state.attrs[attr.key].history
+            if history.has_changes():
+                changes[attr.key] = {
+                    "old": history.deleted[0] if history.deleted else None,
+                    "new": history.added[0] if history.added else None,
+                }
+        if operation == "update" and not changes:
+            return
+
+        entity = self._entities.get(state)
+        if entity is None:
+            entity = _EntityChanges(entity_type=rule.entity_type or state.class_.__name__, operation=operation)
+            self._entities[state] = entity
+        elif operation == "delete" or entity.operation != "create":
+            entity.operation = operation
+
+        for key, change in changes.items():
+            previous = entity.changes.get(key)
+            entity.changes[key] = {"old": previous["old"], "new": change["new"]} if previous else change
+        self._pending.append((state, entity))
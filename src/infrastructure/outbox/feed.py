@@ -0,0 +1,389 @@
+import asyncio
+import contextlib
+import contextvars
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass
+
+from loguru import logger
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.application.common.value_objects import EventType, OutboxEvent
+from src.infrastructure.database.models.outbox import OutboxRecord
+
+from .serializers import EventSerializer
+from .writer import DEFAULT_NOTIFY_CHANNEL
+
+
+class InvalidResumeTokenError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    position: int
+    event: OutboxEvent
+    # Позиции всех шардов на момент события; None для ленты одной БД
+    cursor: tuple[int, ...] | None = None
+
+    @property
+    def resume_token(self) -> str:
+        if self.cursor is None:
+            return str(self.position)
+        return ".".join(map(str, self.cursor))
+
+
+def parse_resume_token(token: str | None) -> int | None:
+    if not token:
+        return None
+    try:
+        position = int(token)
+    except ValueError as exc:
+        raise InvalidResumeTokenError(f"Invalid resume token: {token!r}") from exc
+    if position < 0:
+        raise InvalidResumeTokenError(f"Invalid resume token: {token!r}")
+    return position
+
+
+class _Subscriber:
+    def __init__(
+        self,
+        event_types: frozenset[EventType] | None,
+        resources: frozenset[str] | None,
+        queue_size: int,
+    ) -> None:
+        self.event_types = event_types
+        self.resources = resources
+        # None в очереди означает, что подписчик не успевал читать и должен переподключиться
+        self.queue: asyncio.Queue[FeedEvent | None] = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def matches(self, event: OutboxEvent) -> bool:
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        return self.resources is None or event.resource in self.resources
+
+    def push(self, item: FeedEvent) -> None:
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class OutboxFeed:
+    """Лента зафиксированных событий outbox для потоковой отдачи клиентам.
+
+    На воркер используется один слушатель БД: на PostgreSQL это LISTEN на
+    канале, в который пишет OutboxWriter, плюс периодический опрос как
+    страховка; на других СУБД — только опрос. Прочитанные события
+    декодируются один раз и раздаются всем подходящим подписчикам.
+
+    Позиции выдаются при INSERT, а видны после COMMIT, поэтому более
+    поздняя позиция может появиться раньше предыдущей. Курсор не переходит
+    через пропуск, пока тот не заполнится или не истечет gap_timeout
+    (пропуски навсегда остаются после откатов).
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        serializer: EventSerializer,
+        channel: str | None = DEFAULT_NOTIFY_CHANNEL,
+        poll_interval: float = 1.0,
+        batch_size: int = 500,
+        queue_size: int = 1000,
+        gap_timeout: float = 5.0,
+        heartbeat_interval: float = 15.0,
+    ) -> None:
+        self._engine = engine
+        self._serializer = serializer
+        self._channel = channel
+        self._poll_interval = poll_interval
+        self._batch_size = batch_size
+        self._queue_size = queue_size
+        self._gap_timeout = gap_timeout
+        self._heartbeat_interval = heartbeat_interval
+
+        self._subscribers: set[_Subscriber] = set()
+        self._task: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._listen_connection: AsyncConnection | None = None
+
+        self._cursor: int | None = None
+        self._seen: set[int] = set()
+        self._gap_since: float | None = None
+
+    async def subscribe(
+        self,
+        event_types: Iterable[EventType] | None = None,
+        resources: Iterable[str] | None = None,
+        after: int | None = None,
+    ) -> AsyncIterator[FeedEvent | None]:
+        """Поток событий подписчика.
+
+        При заданном ``after`` сначала догружает пропущенные события из БД.
+        Отдает None, если за heartbeat_interval не было событий. Завершается,
+        если подписчик не успевает читать: клиент должен переподключиться
+        с последним resume token.
+        """
+        subscriber = _Subscriber(
+            event_types=frozenset(event_types) if event_types else None,
+            resources=frozenset(resources) if resources else None,
+            queue_size=self._queue_size,
+        )
+        self._subscribers.add(subscriber)
+        self._ensure_started()
+        try:
+            backfilled: set[int] = set()
+            if after is not None:
+                await self._ready.wait()
+                async for item in self._backfill(after, subscriber):
+                    backfilled.add(item.position)
+                    yield item
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(subscriber.queue.get(), timeout=self._heartbeat_interval)
+                except TimeoutError:
+                    yield None
+                    continue
+                if item is None:
+                    logger.warning("Outbox feed subscriber is too slow, closing its stream")
+                    return
+                if item.position not in backfilled:
+                    yield item
+        finally:
+            self._subscribers.discard(subscriber)
+
+    async def latest_position(self) -> int:
+        """Позиция последнего записанного события"""
+        return await self._fetch_max_position()
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self._stop_listening()
+
+    def _ensure_started(self) -> None:
+        if self._task is None:
+            # Задачу запускает первый SSE-запрос; пустой контекст не дает ей унаследовать
+            # срок запроса и счетчик соединений
+            self._task = asyncio.create_task(self._run(), name="outbox-feed", context=contextvars.Context())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if self._cursor is None:
+                    self._cursor = await self._fetch_max_position()
+                    self._ready.set()
+                await self._start_listening()
+                await self._poll()
+            except Exception:  # noqa: BLE001
+                logger.exception("Outbox feed failed to read events, retrying in {}s", self._poll_interval)
+                await self._stop_listening()
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+            self._wakeup.clear()
+
+    async def _poll(self) -> None:
+        while True:
+            async with self._engine.connect() as connection:
+                rows = (
+                    await connection.execute(
+                        select(OutboxRecord.position, OutboxRecord.data)
+                        .where(OutboxRecord.position > self._cursor)
+                        .order_by(OutboxRecord.position)
+                        .limit(self._batch_size)
+                    )
+                ).all()
+
+            delivered = 0
+            for position, data in rows:
+                if position in self._seen:
+                    continue
+                self._seen.add(position)
+                delivered += 1
+                self._dispatch(position, data)
+            self._advance_cursor()
+
+            if len(rows) < self._batch_size or delivered == 0:
+                return
+
+    def _dispatch(self, position: int, data: bytes) -> None:
+        if not self._subscribers:
+            return
+        try:
+            event = self._serializer.deserialize(data)
+        except ValueError:
+            logger.exception("Skipping undecodable outbox event at position {}", position)
+            return
+        item = FeedEvent(position=position, event=event)
+        for subscriber in self._subscribers:
+            if subscriber.matches(event):
+                subscriber.push(item)
+
+    def _advance_cursor(self) -> None:
+        while self._seen:
+            next_position = self._cursor + 1
+            if next_position in self._seen:
+                self._seen.remove(next_position)
+                self._cursor = next_position
+                self._gap_since = None
+                continue
+
+            now = time.monotonic()
+            if self._gap_since is None:
+                self._gap_since = now
+            if now - self._gap_since < self._gap_timeout:
+                return
+            # Пропуск так и не заполнился — транзакция откатилась, идем дальше
+            self._cursor = min(self._seen) - 1
+            self._gap_since = None
+
+    async def _backfill(self, after: int, subscriber: _Subscriber) -> AsyncIterator[FeedEvent]:
+        position = after
+        while True:
+            query = self._filtered(
+                select(OutboxRecord.position, OutboxRecord.data).where(OutboxRecord.position > position),
+                subscriber,
+            )
+            async with self._engine.connect() as connection:
+                rows = (await connection.execute(query.order_by(OutboxRecord.position).limit(self._batch_size))).all()
+
+            for position, data in rows:
+                yield FeedEvent(position=position, event=self._serializer.deserialize(data))
+            if len(rows) < self._batch_size:
+                return
+
+    @staticmethod
+    def _filtered(query: Select, subscriber: _Subscriber) -> Select:
+        if subscriber.event_types is not None:
+            query = query.where(
+                OutboxRecord.event_type.in_([event_type.value for event_type in subscriber.event_types])
+            )
+        if subscriber.resources is not None:
+            query = query.where(OutboxRecord.resource.in_(subscriber.resources))
+        return query
+
+    async def _fetch_max_position(self) -> int:
+        async with self._engine.connect() as connection:
+            return (await connection.execute(select(func.coalesce(func.max(OutboxRecord.position), 0)))).scalar_one()
+
+    async def _start_listening(self) -> None:
+        if self._listen_connection is not None or self._channel is None or self._engine.dialect.name != "postgresql":
+            return
+        connection = await self._engine.connect()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if not hasattr(driver_connection, "add_listener"):
+            await connection.close()
+            self._channel = None
+            return
+        await driver_connection.add_listener(self._channel, self._on_notify)
+        self._listen_connection = connection
+
+    async def _stop_listening(self) -> None:
+        if self._listen_connection is None:
+            return
+        connection, self._listen_connection = self._listen_connection, None
+        with contextlib.suppress(Exception):
+            await connection.close()
+
+    def _on_notify(self, *args) -> None:
+        self._wakeup.set()
+
+
+_CLOSED = object()
+
+
+class ShardedOutboxFeed:
+    """Лента событий outbox со всех шардов.
+
+    Шард пишет outbox в свою БД в одной транзакции с данными, поэтому на
+    каждый шард работает своя OutboxFeed, а их потоки сливаются в один.
+    Позиции шардов независимы: resume token содержит позиции всех шардов
+    через точку. С одной БД лента прозрачно отдает OutboxFeed и ее токены.
+    """
+
+    def __init__(self, feeds: Sequence[OutboxFeed], heartbeat_interval: float = 15.0) -> None:
+        self._feeds = tuple(feeds)
+        self._heartbeat_interval = heartbeat_interval
+
+    @property
+    def feeds(self) -> tuple[OutboxFeed, ...]:
+        return self._feeds
+
+    def parse_resume_token(self, token: str | None) -> tuple[int, ...] | None:
+        if not token:
+            return None
+        parts = token.split(".")
+        if len(parts) != len(self._feeds) or not all(parts):
+            raise InvalidResumeTokenError(f"Invalid resume token: {token!r}")
+        return tuple(parse_resume_token(part) for part in parts)
+
+    async def subscribe(
+        self,
+        event_types: Iterable[EventType] | None = None,
+        resources: Iterable[str] | None = None,
+        after: Sequence[int] | None = None,
+    ) -> AsyncIterator[FeedEvent | None]:
+        """Поток событий подписчика со всех шардов, см. OutboxFeed.subscribe.
+
+        Завершается, как только завершается поток любого из шардов.
+        """
+        if len(self._feeds) == 1:
+            async for item in self._feeds[0].subscribe(event_types, resources, after[0] if after else None):
+                yield item
+            return
+
+        event_types = list(event_types) if event_types else None
+        resources = list(resources) if resources else None
+        if after is None:
+            # Новый подписчик начинает с текущих позиций; догрузка закрывает промежуток
+            # между их чтением и подпиской
+            after = [await feed.latest_position() for feed in self._feeds]
+        cursor = list(after)
+        queue: asyncio.Queue[tuple[int, object]] = asyncio.Queue(maxsize=len(self._feeds))
+        closed = asyncio.Event()
+
+        async def pump(shard: int, feed: OutboxFeed) -> None:
+            try:
+                async for item in feed.subscribe(event_types, resources, after=cursor[shard]):
+                    if item is not None:
+                        await queue.put((shard, item))
+            finally:
+                closed.set()
+                with contextlib.suppress(asyncio.QueueFull):
+                    queue.put_nowait((shard, _CLOSED))
+
+        tasks = [asyncio.create_task(pump(shard, feed)) for shard, feed in enumerate(self._feeds)]
+        try:
+            while not (closed.is_set() and queue.empty()):
+                try:
+                    shard, item = await asyncio.wait_for(queue.get(), timeout=self._heartbeat_interval)
+                except TimeoutError:
+                    yield None
+                    continue
+                if item is _CLOSED:
+                    return
+                cursor[shard] = max(cursor[shard], item.position)
+                yield FeedEvent(position=item.position, event=item.event, cursor=tuple(cursor))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        for feed in self._feeds:
+            await feed.close()
@@ -0,0 +1,155 @@
+import struct
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import IntEnum
+from typing import Any, Protocol
+from uuid import UUID
+
+import orjson
+import zstandard
+
+from src.application.common.value_objects import EventId, EventType, OutboxEvent
+from src.domain.common.entity import EntityId
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+# Заголовок сохраненного события: версия формата, кодек, сжатие
+FORMAT_VERSION = 1
+_HEADER = struct.Struct(">BBB")
+
+
+class Codec(IntEnum):
+    """Кодеки, которыми может быть закодировано тело события"""
+
+    ORJSON = 1
+    MSGPACK = 2
+
+
+class Compression(IntEnum):
+    """Алгоритмы сжатия тела события"""
+
+    NONE = 0
+    ZSTD = 1
+
+
+class EventSerializationError(ValueError):
+    pass
+
+
+class EventCodec(Protocol):
+    codec: Codec
+
+    def dumps(self, value: dict[str, Any]) -> bytes: ...
+
+    def loads(self, value: bytes) -> dict[str, Any]: ...
+
+
+def json_default(value: Any) -> Any:
+    """Приводит значения, которые не умеют кодеки, к примитивам"""
+    if isinstance(value, EntityId):
+        return str(value)
+    if isinstance(value, UUID | Decimal):
+        return str(value)
+    if isinstance(value, datetime | date | time):
+        return value.isoformat()
+    if isinstance(value, set | frozenset | tuple):
+        return list(value)
+    raise TypeError(f"Type is not serializable: {type(value)}")
+
+
+class OrjsonCodec:
+    codec = Codec.ORJSON
+
+    def dumps(self, value: dict[str, Any]) -> bytes:
+        return orjson.dumps(value, default=json_default)
+
+    def loads(self, value: bytes) -> dict[str, Any]:
+        return orjson.loads(value)
+
+
+class MsgpackCodec:
+    codec = Codec.MSGPACK
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise ImportError("msgpack is not installed. Install it with `uv add msgpack`.")
+
+    def dumps(self, value: dict[str, Any]) -> bytes:
+        return msgpack.packb(value, default=json_default, datetime=False)
+
+    def loads(self, value: bytes) -> dict[str, Any]:
+        return msgpack.unpackb(value, raw=False)
+
+
+def event_to_dict(event: OutboxEvent) -> dict[str, Any]:
+    return {
+        "id": str(event.id),
+        "event_type": event.event_type.value,
+        "payload": event.payload,
+        "metadata": event.metadata,
+        "idempotency_key": event.idempotency_key,
+    }
+
+
+def event_from_dict(value: Mapping[str, Any]) -> OutboxEvent:
+    return OutboxEvent(
+        id=EventId(UUID(value["id"])),
+        event_type=EventType(value["event_type"]),
+        payload=value["payload"],
+        metadata=value["metadata"],
+        idempotency_key=value.get("idempotency_key"),
+    )
+
+
+class EventSerializer:
+    """Сериализует OutboxEvent в компактный бинарный формат с версией.
+
+    Формат: 3 байта заголовка (версия, кодек, сжатие) + тело события.
+    Декодирование ориентируется на заголовок, поэтому события, записанные
+    другим кодеком или без сжатия, читаются при любой текущей настройке.
+    """
+
+    def __init__(
+        self,
+        codec: Codec = Codec.ORJSON,
+        compression_threshold: int | None = 1024,
+        compression_level: int = 3,
+    ) -> None:
+        self._codecs: dict[Codec, EventCodec] = {Codec.ORJSON: OrjsonCodec()}
+        if codec is Codec.MSGPACK or msgpack is not None:
+            self._codecs[Codec.MSGPACK] = MsgpackCodec()
+        self._codec = self._codecs[codec]
+
+        self._compression_threshold = compression_threshold
+        self._compressor = zstandard.ZstdCompressor(level=compression_level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def serialize(self, event: OutboxEvent) -> bytes:
+        body = self._codec.dumps(event_to_dict(event))
+        compression = Compression.NONE
+        if self._compression_threshold is not None and len(body) > self._compression_threshold:
+            body = self._compressor.compress(body)
+            compression = Compression.ZSTD
+        return _HEADER.pack(FORMAT_VERSION, self._codec.codec, compression) + body
+
+    def deserialize(self, value: bytes) -> OutboxEvent:
+        if len(value) < _HEADER.size:
+            raise EventSerializationError("Serialized event is too short")
+        version, codec_id, compression_id = _HEADER.unpack_from(value)
+        if version != FORMAT_VERSION:
+            raise EventSerializationError(f"Unsupported event format version: {version}")
+
+        try:
+            codec = self._codecs[Codec(codec_id)]
+            compression = Compression(compression_id)
+        except (KeyError, ValueError) as exc:
+            raise EventSerializationError(f"Unsupported codec or compression: {codec_id}/{compression_id}") from exc
+
+        body = value[_HEADER.size :]
+        if compression is Compression.ZSTD:
+            body = self._decompressor.decompress(body)
+        return event_from_dict(codec.loads(body))
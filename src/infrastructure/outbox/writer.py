@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.common.value_objects import OutboxEvent
+from src.infrastructure.database.models.outbox import OutboxRecord
+
+from .serializers import EventSerializer
+
+DEFAULT_NOTIFY_CHANNEL = "outbox_events"
+
+
+class OutboxWriter:
+    """Записывает события в таблицу outbox в текущей транзакции сессии.
+
+    На PostgreSQL дополнительно отправляет NOTIFY: уведомление доставляется
+    слушателям только после коммита, поэтому лента не увидит незафиксированных событий.
+    """
+
+    def __init__(self, serializer: EventSerializer, notify_channel: str | None = DEFAULT_NOTIFY_CHANNEL) -> None:
+        self._serializer = serializer
+        self._notify_channel = notify_channel
+
+    async def write(self, session: AsyncSession, events: Sequence[OutboxEvent]) -> None:
+        if not events:
+            return
+        session.add_all(
+            [
+                OutboxRecord(
+                    id=event.id.value,
+                    event_type=event.event_type.value,
+                    resource=event.resource,
+                    data=self._serializer.serialize(event),
+                )
+                for event in events
+            ]
+        )
+        if self._notify_channel is not None and session.bind.dialect.name == "postgresql":
+            await session.execute(select(func.pg_notify(self._notify_channel, "")))
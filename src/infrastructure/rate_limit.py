@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+from src.application.common.rate_limit import IRateLimiter, RateLimitResult
+
+try:
+    from redis import asyncio as redis
+except ImportError:  # pragma: no cover
+    redis = None
+
+# Корзина целиком пересчитывается на сервере: чтение, пополнение и списание
+# атомарны, а время берется из TIME Redis, чтобы часы worker'ов не расходились
+BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1])
+if tokens == nil then
+    tokens = burst
+else
+    tokens = math.min(burst, tokens + math.max(0, now - tonumber(state[2])) * rate)
+end
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+else
+    retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return {allowed, tostring(tokens), tostring(retry_after)}
+"""
+
+
+class InMemoryRateLimiter(IRateLimiter):
+    """Корзины токенов в памяти worker'а; при max_keys вытесняются давно не использованные"""
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def hit(self, key: str, rate: float, burst: int, cost: int = 1) -> RateLimitResult:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = float(burst)
+        else:
+            tokens, updated_at = bucket
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+            self._buckets.move_to_end(key)
+
+        if tokens >= cost:
+            result = RateLimitResult(allowed=True, remaining=tokens - cost)
+            tokens -= cost
+        else:
+            result = RateLimitResult(allowed=False, remaining=tokens, retry_after=(cost - tokens) / rate)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class RedisRateLimiter(IRateLimiter):
+    """Общие для всех worker'ов и реплик корзины токенов в Redis.
+
+    Один вызов — один EVALSHA; ключ живет, пока корзина не наполнится снова.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "ratelimit") -> None:
+        self._client = client
+        self._key_prefix = key_prefix
+        self._script = client.register_script(BUCKET_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "ratelimit") -> "RedisRateLimiter":
+        if redis is None:
+            raise RuntimeError(
+                "Redis rate limiter requires the 'redis' extra: pip install 'python-web-template[redis]'"
+            )
+        return cls(redis.Redis.from_url(url), key_prefix=key_prefix)
+
+    async def hit(self, key: str, rate: float, burst: int, cost: int = 1) -> RateLimitResult:
+        allowed, remaining, retry_after = await self._script(
+            keys=[f"{self._key_prefix}:{key}"], args=[rate, burst, cost]
+        )
+        return RateLimitResult(allowed=bool(allowed), remaining=float(remaining), retry_after=float(retry_after))
+
+    async def close(self) -> None:
+        await self._client.aclose()
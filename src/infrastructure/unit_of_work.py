@@ -1,24 +1,223 @@
-from src.application.common.unit_of_work import IUnitOfWork, OutboxEvent
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+
+from src.application.common.event_bus import IEventBus
+from src.application.common.event_coalescing import CoalescingRule, coalesce_events
+from src.application.common.unit_of_work import IUnitOfWork, OutboxEvent, TransactionMode
+from src.infrastructure.database.bulk import BULK_WRITER_KEY, BulkWriter
+from src.infrastructure.database.retry import RetryPolicy, get_sqlstate
+from src.infrastructure.outbox.audit import AuditCapture, AuditLogCollector
+from src.infrastructure.outbox.writer import OutboxWriter
+
+
+class ReadOnlyTransactionError(RuntimeError):
+    pass
+
+
+def set_transaction_sql(mode: TransactionMode) -> str:
+    characteristics = []
+    if mode.isolation_level is not None:
+        characteristics.append(f"ISOLATION LEVEL {mode.isolation_level}")
+    characteristics.append("READ ONLY" if mode.read_only else "READ WRITE")
+    if mode.deferrable:
+        characteristics.append("DEFERRABLE")
+    return "SET TRANSACTION " + ", ".join(characteristics)
 
 
 class UnitOfWork(IUnitOfWork):
-    def __init__(self, session):
+    def __init__(
+        self,
+        session,
+        coalescing_rules: Sequence[CoalescingRule] = (),
+        audit_capture: AuditCapture | None = None,
+        event_bus: IEventBus | None = None,
+        outbox_writer: OutboxWriter | None = None,
+        mode: TransactionMode = TransactionMode.READ_WRITE,
+        retry_policy: RetryPolicy | None = None,
+    ):
         self._session = session
+        self._mode = mode
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._event_bus = event_bus
+        self._outbox_writer = outbox_writer
         self._events: list[OutboxEvent] = []
+        self._idempotency_keys: set[str] = set()
+        self._coalescing_rules = tuple(coalescing_rules)
+        # Чтение не порождает аудита, поэтому read-only транзакции его не собирают
+        if audit_capture is not None and not mode.read_only:
+            self._audit_collector = AuditLogCollector(audit_capture)
+            self._audit_collector.attach(session.sync_session)
+        else:
+            self._audit_collector = None
+        self._apply_mode()
 
     async def __aenter__(self) -> "UnitOfWork":
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
-        await self.rollback()
+        # Если транзакция не начиналась, соединение из пула не бралось и откатывать нечего
+        if self._session.in_transaction():
+            await self.rollback()
+        else:
+            self._reset()
+        if self._audit_collector is not None:
+            self._audit_collector.detach(self._session.sync_session)
+        self._release_mode()
+
+    def _apply_mode(self) -> None:
+        # Сессия запроса общая для репозиториев и UnitOfWork, поэтому режим у нее один
+        current = self._session.info.setdefault("transaction_mode", self._mode)
+        if current != self._mode:
+            raise ValueError(f"Session is already used with {current}, cannot switch to {self._mode}")
+        if self._mode.read_only:
+            self._session.sync_session.autoflush = False
+        if not self._mode.is_default:
+            event.listen(self._session.sync_session, "after_begin", self._set_transaction)
+
+    def _release_mode(self) -> None:
+        if not self._mode.is_default:
+            event.remove(self._session.sync_session, "after_begin", self._set_transaction)
+        self._session.info.pop("transaction_mode", None)
+
+    def _set_transaction(self, session, transaction, connection) -> None:
+        # SET TRANSACTION должен быть первым запросом транзакции; SAVEPOINT его не требует
+        if transaction.nested or connection.dialect.name != "postgresql":
+            return
+        connection.exec_driver_sql(set_transaction_sql(self._mode))
 
     async def register_event(self, event: OutboxEvent) -> None:
         """Регистрирует событие для отправки через outbox pattern"""
+        if self._mode.read_only:
+            raise ReadOnlyTransactionError("Cannot register events in a read-only unit of work")
+        if event.idempotency_key is not None:
+            if event.idempotency_key in self._idempotency_keys:
+                logger.debug("Skipping duplicate event with idempotency key {}", event.idempotency_key)
+                return
+            self._idempotency_keys.add(event.idempotency_key)
         self._events.append(event)
 
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        """Выполняет блок в SAVEPOINT: при ошибке откатываются только изменения и события блока"""
+        if not self._mode.read_only:
+            # Сбрасываем изменения до SAVEPOINT, чтобы снимок аудита их уже содержал
+            await self._session.flush()
+        events_count = len(self._events)
+        idempotency_keys = set(self._idempotency_keys)
+        audit_snapshot = self._audit_collector.snapshot() if self._audit_collector is not None else None
+        try:
+            async with self._session.begin_nested():
+                yield
+        except BaseException:
+            del self._events[events_count:]
+            self._idempotency_keys = idempotency_keys
+            if audit_snapshot is not None:
+                self._audit_collector.restore(audit_snapshot)
+            raise
+
+    @asynccontextmanager
+    async def bulk(self, refresh: bool = False) -> AsyncIterator[list[Any]]:
+        """Откладывает сохранения репозиториев до конца блока и записывает их одним flush.
+
+        Внутри блока autoflush выключен, а save() возвращает переданную сущность.
+        После выхода из блока отданный список содержит сохраненные сущности;
+        с refresh=True они перечитаны из БД вместе с серверными значениями.
+        """
+        if self._mode.read_only:
+            raise ReadOnlyTransactionError("Cannot write in a read-only unit of work")
+        if (current := BulkWriter.current(self._session)) is not None:
+            yield current.saved
+            return
+
+        sync_session = self._session.sync_session
+        autoflush = sync_session.autoflush
+        bulk_writer = BulkWriter(self._session, refresh=refresh)
+        sync_session.autoflush = False
+        self._session.info[BULK_WRITER_KEY] = bulk_writer
+        try:
+            yield bulk_writer.saved
+        finally:
+            del self._session.info[BULK_WRITER_KEY]
+            sync_session.autoflush = autoflush
+        await bulk_writer.flush()
+
+    async def run[T](self, work: Callable[[], Awaitable[T]]) -> T:
+        """Выполняет work, повторяя его при ошибках сериализации и взаимоблокировках.
+
+        work должен сам вызывать commit: такие ошибки часто возникают именно при COMMIT.
+        Перед повтором транзакция откатывается, поэтому work должен заново читать данные.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await work()
+            except DBAPIError as exc:
+                if attempt >= self._retry_policy.max_attempts or not self._retry_policy.is_retryable(exc):
+                    raise
+                await self.rollback()
+                delay = self._retry_policy.delay(attempt)
+                logger.warning(
+                    "Transaction failed with SQLSTATE {}, retrying in {:.3f}s (attempt {}/{})",
+                    get_sqlstate(exc),
+                    delay,
+                    attempt + 1,
+                    self._retry_policy.max_attempts,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
     async def commit(self) -> None:
+        if self._mode.read_only:
+            await self._commit_read_only()
+            return
+        if self._audit_collector is not None:
+            # flush до коммита, чтобы изменения попали в аудит этой же транзакции
+            await self._session.flush()
+            self._events.extend(self._audit_collector.drain())
+        self._events = coalesce_events(self._events, self._coalescing_rules)
+        if not self._events and not self._session.in_transaction():
+            self._reset()
+            return
+        if self._outbox_writer is not None:
+            await self._outbox_writer.write(self._session, self._events)
         await self._session.commit()
+        if self._audit_collector is not None:
+            # flush внутри commit тоже проходит через коллектор; его изменения уже не нужны
+            self._audit_collector.clear()
+
+        events, self._events = self._events, []
+        self._idempotency_keys.clear()
+        if self._event_bus is not None and events:
+            await self._publish(events)
+
+    async def _commit_read_only(self) -> None:
+        session = self._session
+        if session.new or session.dirty or session.deleted:
+            raise ReadOnlyTransactionError("Read-only unit of work has pending changes")
+        # Изменений нет, поэтому COMMIT только завершает транзакцию и flush не выполняется
+        if session.in_transaction():
+            await session.commit()
+        self._reset()
+
+    async def _publish(self, events: list[OutboxEvent]) -> None:
+        # Транзакция уже зафиксирована: ошибки подписчиков не должны ломать запрос
+        try:
+            await self._event_bus.publish(events)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to publish {} committed events to the event bus", len(events))
 
     async def rollback(self) -> None:
         await self._session.rollback()
+        self._reset()
+
+    def _reset(self) -> None:
         self._events.clear()
+        self._idempotency_keys.clear()
+        if self._audit_collector is not None:
+            self._audit_collector.clear()
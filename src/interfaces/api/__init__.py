@@ -1,25 +1,58 @@
+import asyncio
+import contextlib
+import signal
 from contextlib import asynccontextmanager
 
 from dishka import AsyncContainer
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
+from sqlalchemy.exc import DBAPIError
 
-from src.infrastructure.config import get_settings
+from src.infrastructure.config import get_settings, reload_settings
+from src.infrastructure.database.deadline import DeadlineExceededError
 
-from .exception_handlers import all_exceptions_handler
+from .exception_handlers import all_exceptions_handler, database_error_handler, deadline_exceeded_handler
+from .health import pool_stats_router
+from .health import router as health_router
+from .middlewares import (
+    AdmissionMiddleware,
+    CompressionMiddleware,
+    DBCheckoutMiddleware,
+    ETagMiddleware,
+    RateLimitMiddleware,
+    ReloadableCORSMiddleware,
+    RequestDeadlineMiddleware,
+)
 from .v1 import router as v1_router
+from .warmup import default_warmup_steps, run_warmup
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting up application and initializing Dishka container.")
+    settings = get_settings()
+    # Worker сообщает о готовности только после прогрева
+    if settings.app.warmup:
+        steps = default_warmup_steps(settings.database.warmup_connections)
+        app.state.warmup = await run_warmup(app, app.state.dishka_container, steps)
+    reload_on_sighup = _install_sighup_handler()
     yield
+    if reload_on_sighup:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGHUP)
     logger.info("Shutting down application and closing Dishka container.")
     await app.state.dishka_container.close()
 
 
+def _install_sighup_handler() -> bool:
+    # В SIGHUP worker перечитывает настройки; под супервизором uvicorn сигнал
+    # нужно слать самим worker'ам, на SIGHUP супервизор перезапускает их
+    with contextlib.suppress(AttributeError, NotImplementedError, RuntimeError):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_settings)
+        return True
+    return False
+
+
 def create_rest_app(container: AsyncContainer) -> FastAPI:
     settings = get_settings()
 
@@ -35,20 +68,55 @@ def create_rest_app(container: AsyncContainer) -> FastAPI:
         lifespan=lifespan,
     )
 
-    # Setup CORS
-    if settings.cors.enabled:
+    # 304 по ETag тела для ответов без собственной версии; внутри CORS, чтобы 304 получал его заголовки
+    app.add_middleware(ETagMiddleware)
+    # Сжатие снаружи ETag: ETag считается по несжатому телу
+    if settings.api.compression:
         app.add_middleware(
-            CORSMiddleware,
-            allow_origins=settings.cors.allow_origins,
-            allow_credentials=settings.cors.allow_credentials,
-            allow_methods=settings.cors.allow_methods,
-            allow_headers=settings.cors.allow_headers,
+            CompressionMiddleware,
+            minimum_size=settings.api.compression_minimum_size,
+            streaming=settings.api.compression_streaming,
+            cache_bytes=settings.api.compression_cache_bytes,
         )
-
     setup_dishka(container=container, app=app)
 
+    # Добавляется после Dishka, чтобы учитывать соединения, взятые при закрытии зависимостей
+    app.add_middleware(DBCheckoutMiddleware)
+    # Снаружи Dishka: отклоненный запрос не открывает зависимости; внутри срока, чтобы
+    # отключение клиента снимало запрос с очереди
+    pool_waiters = settings.api.admission_pool_waiters
+    if pool_waiters is None:
+        # Размер пула worker'а с учетом бюджета соединений, как в DBConfig
+        pool_waiters = settings.connection_plan.pool_size
+    app.add_middleware(
+        AdmissionMiddleware,
+        max_concurrent=settings.api.max_concurrent_requests,
+        queue_size=settings.api.admission_queue_size,
+        queue_timeout=settings.api.admission_queue_timeout,
+        pool_waiters=pool_waiters or None,
+        retry_after=settings.api.admission_retry_after,
+        priority_paths=settings.api.priority_paths,
+    )
+    # Снаружи ограничения одновременных запросов: клиент сверх лимита не занимает очередь
+    app.add_middleware(RateLimitMiddleware, exempt_paths=settings.api.priority_paths)
+    # Внешний слой, чтобы отмена при отключении клиента прерывала и запросы к БД в зависимостях
+    app.add_middleware(
+        RequestDeadlineMiddleware,
+        default_timeout=settings.api.request_timeout,
+        header=settings.api.request_timeout_header,
+        max_timeout=settings.api.max_request_timeout,
+    )
+    # Setup CORS; the options follow settings reloads. Самый внешний слой: ответы 429, 503
+    # и 504 получают его заголовки, а preflight-запросы не тратят лимиты и слоты
+    app.add_middleware(ReloadableCORSMiddleware)
+
+    app.include_router(health_router)
+    if settings.api.pool_stats:
+        app.include_router(pool_stats_router)
     app.include_router(v1_router, prefix=settings.api.prefix)
 
+    app.add_exception_handler(DeadlineExceededError, deadline_exceeded_handler)
+    app.add_exception_handler(DBAPIError, database_error_handler)
     app.add_exception_handler(Exception, all_exceptions_handler)
 
     return app
@@ -0,0 +1,228 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request, Response
+from loguru import logger
+from starlette.background import BackgroundTask
+
+from src.application.common.cache import CacheEntry, ICache
+from src.infrastructure.config import get_settings
+
+from .responses import FastJSONResponse
+
+_REQUEST_PARAM = "_cache_request"
+_RESPONSE_PARAM = "_cache_response"
+# Заголовки, которые не сохраняются: длина пересчитывается, а cookie — личные данные клиента
+_SKIPPED_HEADERS = frozenset({"content-length", "set-cookie"})
+
+
+class SingleFlight[T]:
+    """Объединяет одновременные вычисления по одному ключу в одно.
+
+    Первый вызов вычисляет значение, остальные ждут его результата. Если
+    первый вызов упал или был отменен (клиент отключился), ожидающие не
+    получают его ошибку: один из них вычисляет значение заново.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[T]] = {}
+
+    def running(self, key: str) -> bool:
+        return key in self._calls
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[T]]) -> T:
+        while (future := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await compute()
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._calls[key]
+        future.set_result(result)
+        return result
+
+
+def cache_key(namespace: str, request: Request, vary_on_headers: Sequence[str] = ()) -> str:
+    """Ключ из пути, запроса с отсортированными параметрами и выбранных заголовков"""
+    query = urlencode(sorted(parse_qsl(request.url.query, keep_blank_values=True)))
+    parts = [request.url.path, query, *(request.headers.get(header, "") for header in vary_on_headers)]
+    digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def _render(result: Any, sub_response: Response) -> Response:
+    """Ответ эндпоинта со статусом и заголовками, выставленными на Response запроса.
+
+    FastAPI переносит их только в ответы, которые собирает сам (например,
+    ETag и Last-Modified из ConditionalRequestDep); готовый Response
+    эндпоинта отдается как есть.
+    """
+    if isinstance(result, Response):
+        return result
+    response = FastJSONResponse(result, status_code=sub_response.status_code or 200)
+    response.raw_headers.extend(sub_response.raw_headers)
+    return response
+
+
+def _find_parameter(signature: inspect.Signature, annotation: type) -> str | None:
+    return next(
+        (
+            parameter.name
+            for parameter in signature.parameters.values()
+            if isinstance(parameter.annotation, type) and issubclass(parameter.annotation, annotation)
+        ),
+        None,
+    )
+
+
+def _to_entry(response: Response, ttl: float, stale_ttl: float) -> CacheEntry:
+    return CacheEntry(
+        body=bytes(response.body),
+        status_code=response.status_code,
+        headers=tuple((name, value) for name, value in response.headers.items() if name not in _SKIPPED_HEADERS),
+        created_at=time.time(),
+        ttl=ttl,
+        stale_ttl=stale_ttl,
+    )
+
+
+def _to_response(entry: CacheEntry) -> Response:
+    response = Response(entry.body, status_code=entry.status_code)
+    response.raw_headers.extend((name.encode("latin-1"), value.encode("latin-1")) for name, value in entry.headers)
+    return response
+
+
+def _mark(response: Response, status: str) -> Response:
+    response.headers["X-Cache"] = status
+    return response
+
+
+async def _resolve_cache(request: Request) -> ICache | None:
+    try:
+        return await request.app.state.dishka_container.get(ICache)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Response cache is unavailable, serving uncached: {}", exc)
+        return None
+
+
+async def _cache_get(cache: ICache, key: str) -> CacheEntry | None:
+    try:
+        return await cache.get(key)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Response cache read failed, serving uncached: {}", exc)
+        return None
+
+
+async def _cache_set(cache: ICache, key: str, entry: CacheEntry) -> None:
+    try:
+        await cache.set(key, entry)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Response cache write failed: {}", exc)
+
+
+def cached(
+    ttl: float | None = None,
+    stale_ttl: float | None = None,
+    vary_on_headers: Sequence[str] = (),
+    namespace: str | None = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Кеширует готовый ответ GET-эндпоинта.
+
+    Ключ строится из пути, нормализованного запроса и заголовков
+    vary_on_headers. Свежий ответ отдается из кеша без вызова эндпоинта;
+    устаревший (в пределах stale_ttl) отдается сразу, а эндпоинт вызывается
+    после отправки ответа, пока зависимости запроса еще открыты. Одновременные
+    промахи по одному ключу вычисляются один раз. ttl и stale_ttl по
+    умолчанию берутся из настроек CACHE_* и меняются при их перезагрузке.
+    Если кеш недоступен, эндпоинт вызывается как обычно.
+
+    Результат эндпоинта кодируется как FastJSONResponse (или берется готовый
+    Response с телом), поэтому эндпоинт должен возвращать то, что отдается
+    клиенту, — response_model к закешированному ответу не применяется.
+    Из кеша ответ отдается с сохраненными заголовками (кроме Set-Cookie),
+    включая выставленные на Response запроса (ETag из ConditionalRequestDep).
+    Кешируются только ответы 200::
+
+        @router.get("/items")
+        @cached(ttl=10, vary_on_headers=["Accept-Language"])
+        @inject
+        async def list_items(uow: ReadOnlyUnitOfWorkDep) -> ItemsResponse: ...
+    """
+
+    def decorator(endpoint: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        key_namespace = namespace or f"{endpoint.__module__}.{endpoint.__qualname__}"
+        flights: SingleFlight[CacheEntry] = SingleFlight()
+        signature = inspect.signature(endpoint)
+        request_param = _find_parameter(signature, Request)
+        response_param = _find_parameter(signature, Response)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request: Request = kwargs[request_param] if request_param else kwargs.pop(_REQUEST_PARAM)
+            sub_response: Response = kwargs[response_param] if response_param else kwargs.pop(_RESPONSE_PARAM)
+            settings = get_settings().cache
+            if not settings.enabled or request.method not in {"GET", "HEAD"}:
+                return await endpoint(*args, **kwargs)
+
+            cache = await _resolve_cache(request)
+            if cache is None:
+                return await endpoint(*args, **kwargs)
+            key = cache_key(key_namespace, request, vary_on_headers)
+            entry_ttl = settings.ttl if ttl is None else ttl
+            entry_stale_ttl = settings.stale_ttl if stale_ttl is None else stale_ttl
+            # Ответ, вычисленный этим запросом: его и отдаем, остальным — копию из записи
+            computed: list[Response] = []
+
+            async def compute() -> CacheEntry:
+                response = _render(await endpoint(*args, **kwargs), sub_response)
+                computed.append(response)
+                entry = _to_entry(response, entry_ttl, entry_stale_ttl)
+                if entry.status_code == 200:
+                    await _cache_set(cache, key, entry)
+                return entry
+
+            async def revalidate() -> None:
+                try:
+                    await flights.run(key, compute)
+                except Exception:  # noqa: BLE001
+                    logger.exception("Cache revalidation of {} failed", key_namespace)
+
+            entry = await _cache_get(cache, key)
+            if entry is not None and entry.is_fresh(time.time()):
+                return _mark(_to_response(entry), "HIT")
+            if entry is not None:
+                response = _mark(_to_response(entry), "STALE")
+                if not flights.running(key):
+                    response.background = BackgroundTask(revalidate)
+                return response
+            entry = await flights.run(key, compute)
+            return _mark(computed[0] if computed else _to_response(entry), "MISS")
+
+        extra_parameters = [
+            inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+            for name, annotation, declared in (
+                (_REQUEST_PARAM, Request, request_param),
+                (_RESPONSE_PARAM, Response, response_param),
+            )
+            if declared is None
+        ]
+        if extra_parameters:
+            wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), *extra_parameters])
+        return wrapper
+
+    return decorator
@@ -0,0 +1,85 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import HTTPException, Request, Response, status
+
+# Заголовки, которые ответ 304 повторяет из полного ответа (RFC 9110, 15.4.5)
+NOT_MODIFIED_HEADERS = ("etag", "last-modified", "cache-control", "content-location", "date", "expires", "vary")
+
+
+def weak_etag(*parts: object) -> str:
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def body_etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    # SQLite возвращает время без зоны; в БД оно хранится в UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return format_datetime(value.astimezone(UTC).replace(microsecond=0), usegmt=True)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Слабое сравнение If-None-Match с ETag: префикс W/ не учитывается"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified_since(if_modified_since: str | None, last_modified: datetime) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=UTC)
+    # HTTP-дата с точностью до секунды
+    return last_modified.replace(microsecond=0) <= since
+
+
+class ConditionalRequest:
+    """Условный GET по версии ресурса из updated_at.
+
+    Обработчик сначала получает версию легким запросом (get_updated_at или
+    get_collection_version) и вызывает check(): если версия у клиента
+    совпадает, сразу отвечается 304 — сущность не загружается и не
+    сериализуется. Иначе ETag и Last-Modified добавляются к ответу.
+    """
+
+    def __init__(self, request: Request, response: Response) -> None:
+        self._request = request
+        self._response = response
+
+    def check(self, updated_at: datetime | None, count: int | None = None) -> None:
+        """Проверяет версию ресурса; count передается для коллекций.
+
+        updated_at=None (ресурса нет или коллекция пуста) для одной сущности
+        ничего не делает, чтобы обработчик ответил как обычно.
+        """
+        if updated_at is None and count is None:
+            return
+        etag = weak_etag(updated_at.isoformat() if updated_at else "", count if count is not None else "")
+        headers = {"ETag": etag}
+        if updated_at is not None:
+            headers["Last-Modified"] = http_date(updated_at)
+
+        if_none_match = self._request.headers.get("if-none-match")
+        if if_none_match is not None:
+            modified = not etag_matches(if_none_match, etag)
+        else:
+            modified = updated_at is None or not not_modified_since(
+                self._request.headers.get("if-modified-since"), updated_at
+            )
+        if not modified and self._request.method in {"GET", "HEAD"}:
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        self._response.headers.update(headers)
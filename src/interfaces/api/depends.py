@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from dishka.integrations.fastapi import FromDishka
+from fastapi import Depends
+
+from src.application.common.unit_of_work import (
+    IDeferrableReadOnlyUnitOfWork,
+    IReadOnlyUnitOfWork,
+    IRepeatableReadUnitOfWork,
+    IShardedUnitOfWorkFactory,
+    IUnitOfWork,
+)
+
+from .conditional import ConditionalRequest
+
+# Режим транзакции выбирается типом зависимости обработчика
+UnitOfWorkDep = FromDishka[IUnitOfWork]
+ReadOnlyUnitOfWorkDep = FromDishka[IReadOnlyUnitOfWork]
+DeferrableReadOnlyUnitOfWorkDep = FromDishka[IDeferrableReadOnlyUnitOfWork]
+RepeatableReadUnitOfWorkDep = FromDishka[IRepeatableReadUnitOfWork]
+ShardedUnitOfWorkFactoryDep = FromDishka[IShardedUnitOfWorkFactory]
+
+# Условный GET: версия ресурса проверяется до загрузки сущности
+ConditionalRequestDep = Annotated[ConditionalRequest, Depends()]
@@ -1,7 +1,24 @@
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from loguru import logger
+from sqlalchemy.exc import DBAPIError
+
+from src.infrastructure.database.deadline import QUERY_CANCELED
+from src.infrastructure.database.retry import get_sqlstate
 
 
 async def all_exceptions_handler(*args, **kwargs) -> JSONResponse:  # noqa: RUF029
     logger.error("An error occurred: args={}, kwargs={}", args, kwargs)
     return JSONResponse({"msg": "something went wrong"})
+
+
+async def deadline_exceeded_handler(request: Request, exc: Exception) -> JSONResponse:  # noqa: RUF029
+    logger.warning("{} {} exceeded its deadline: {}", request.method, request.url.path, exc)
+    return JSONResponse({"msg": "request deadline exceeded"}, status_code=status.HTTP_504_GATEWAY_TIMEOUT)
+
+
+async def database_error_handler(request: Request, exc: DBAPIError) -> JSONResponse:
+    # Запрос, прерванный statement_timeout, — это истекший срок, а не сбой
+    if get_sqlstate(exc) == QUERY_CANCELED:
+        return await deadline_exceeded_handler(request, exc)
+    return await all_exceptions_handler(request, exc)
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Request
+
+from src.infrastructure.database.telemetry import PoolStats, PoolTelemetry
+
+from .warmup import WarmupReport
+
+router = APIRouter(tags=["health"])
+# Служебные данные для мониторинга; подключается только с API_POOL_STATS и не попадает в схему
+pool_stats_router = APIRouter(prefix="/health", tags=["health"], include_in_schema=False)
+
+
+@dataclass(frozen=True)
+class HealthStatus:
+    status: Literal["ok", "degraded"]
+    warmup: WarmupReport | None
+
+
+@router.get("/health")
+async def get_health(request: Request) -> HealthStatus:
+    """Проверка живости worker'а и результат его прогрева"""
+    warmup: WarmupReport | None = getattr(request.app.state, "warmup", None)
+    return HealthStatus(status="ok" if warmup is None or warmup.ok else "degraded", warmup=warmup)
+
+
+@pool_stats_router.get("/db-pool")
+@inject
+async def get_db_pool_stats(telemetry: FromDishka[PoolTelemetry]) -> PoolStats:
+    """Состояние пула соединений: занятые соединения, переполнение, ожидание и таймауты выдачи"""
+    return telemetry.snapshot()
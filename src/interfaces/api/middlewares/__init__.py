@@ -0,0 +1,17 @@
+from .admission import AdmissionMiddleware
+from .compression import CompressionMiddleware
+from .cors import ReloadableCORSMiddleware
+from .db_telemetry import DBCheckoutMiddleware
+from .deadline import RequestDeadlineMiddleware
+from .etag import ETagMiddleware
+from .rate_limit import RateLimitMiddleware
+
+__all__ = [
+    "AdmissionMiddleware",
+    "CompressionMiddleware",
+    "DBCheckoutMiddleware",
+    "ETagMiddleware",
+    "RateLimitMiddleware",
+    "ReloadableCORSMiddleware",
+    "RequestDeadlineMiddleware",
+]
@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Sequence
+
+from dishka.exceptions import NoFactoryError
+from fastapi import status
+from fastapi.responses import JSONResponse
+from loguru import logger
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.database.telemetry import PoolTelemetry
+
+
+class AdmissionMiddleware:
+    """Ограничивает число запросов, обрабатываемых worker'ом одновременно.
+
+    Сверх max_concurrent запросы ждут в очереди FIFO не дольше queue_timeout;
+    при переполненной очереди или истекшем ожидании сразу отдается 503 с
+    Retry-After. Пока в очереди пула соединений ждут pool_waiters запросов,
+    новые запросы отклоняются, не дожидаясь таймаута пула: ответ за
+    миллисекунды лучше, чем ответ за pool_timeout, который к тому же держит
+    соединение клиента. Телеметрия пула берется из контейнера Dishka.
+
+    Пути с префиксами из priority_paths (health-check и критичные маршруты)
+    не ограничиваются и не ждут в очереди. Потоковый ответ (без
+    Content-Length: SSE, выгрузки) освобождает слот, как только начал
+    отправляться, иначе долгие потоки заняли бы все слоты.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrent: int | None = None,
+        queue_size: int = 100,
+        queue_timeout: float = 1.0,
+        pool_waiters: int | None = None,
+        retry_after: int = 1,
+        priority_paths: Sequence[str] = ("/health",),
+        telemetry: PoolTelemetry | None = None,
+    ) -> None:
+        self.app = app
+        self.max_concurrent = max_concurrent
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.pool_waiters = pool_waiters
+        self.retry_after = retry_after
+        self.priority_paths = tuple(priority_paths)
+        self.in_flight = 0
+        self.rejected = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._telemetry = telemetry
+        self._telemetry_resolved = telemetry is not None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.priority_paths):
+            await self.app(scope, receive, send)
+            return
+
+        if await self._pool_saturated(scope):
+            await self._reject(scope, receive, send, "database pool is saturated")
+            return
+        if not await self._acquire():
+            await self._reject(scope, receive, send, "too many requests in flight")
+            return
+        released = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal released
+            if message["type"] == "http.response.start" and "content-length" not in Headers(raw=message["headers"]):
+                released = True
+                self._release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not released:
+                self._release()
+
+    async def _pool_saturated(self, scope: Scope) -> bool:
+        if self.pool_waiters is None:
+            return False
+        if not self._telemetry_resolved:
+            self._telemetry_resolved = True
+            container = getattr(scope["app"].state, "dishka_container", None)
+            if container is not None:
+                with contextlib.suppress(NoFactoryError):
+                    self._telemetry = await container.get(PoolTelemetry)
+        return self._telemetry is not None and self._telemetry.waiting >= self.pool_waiters
+
+    async def _acquire(self) -> bool:
+        if self.max_concurrent is None:
+            return True
+        if self.in_flight < self.max_concurrent and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # Слот уже передан этому запросу — отдаем его следующему
+                self._release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+            if isinstance(exc, TimeoutError):
+                return False
+            raise
+        return True
+
+    def _release(self) -> None:
+        if self.max_concurrent is None:
+            return
+        # Слот переходит первому ожидающему, in_flight не меняется
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, reason: str) -> None:
+        self.rejected += 1
+        logger.debug("{} {} rejected: {}", scope["method"], scope["path"], reason)
+        response = JSONResponse(
+            {"msg": "server is overloaded, retry later"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(self.retry_after)},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,280 @@
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Protocol
+
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# Типы, которые имеет смысл сжимать; text/event-stream не сжимается, чтобы события не задерживались
+COMPRESSIBLE_TYPES = (
+    "text/html",
+    "text/plain",
+    "text/csv",
+    "text/css",
+    "application/json",
+    "application/x-ndjson",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+)
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Сжимает кусок и сбрасывает буфер, чтобы клиент получил его сразу"""
+
+    def finish(self) -> bytes: ...
+
+
+class _ZstdStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _GzipStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, wbits=31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class Encoding:
+    """Кодирование Content-Encoding: сжатие целого тела и потоковое"""
+
+    def __init__(
+        self,
+        name: str,
+        level: int,
+        compress: Callable[[bytes, int], bytes],
+        stream: Callable[[int], StreamCompressor],
+    ) -> None:
+        self.name = name
+        self.level = level
+        self._compress = compress
+        self._stream = stream
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data, self.level)
+
+    def stream(self) -> StreamCompressor:
+        return self._stream(self.level)
+
+
+def _zstd_compress(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def _brotli_compress(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _gzip_compress(data: bytes, level: int) -> bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def default_encodings(zstd_level: int = 3, brotli_level: int = 4, gzip_level: int = 6) -> list[Encoding]:
+    """Кодирования в порядке предпочтения сервера; br — если установлен brotli"""
+    encodings = [Encoding("zstd", zstd_level, _zstd_compress, _ZstdStream)]
+    if brotli is not None:
+        encodings.append(Encoding("br", brotli_level, _brotli_compress, _BrotliStream))
+    encodings.append(Encoding("gzip", gzip_level, _gzip_compress, _GzipStream))
+    return encodings
+
+
+def accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def negotiate(accept_encoding: str | None, encodings: Sequence[Encoding]) -> Encoding | None:
+    """Выбирает кодирование с наибольшим q; при равных q — по порядку предпочтения сервера"""
+    if not accept_encoding:
+        return None
+    accepted = accepted_encodings(accept_encoding)
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        quality = accepted.get(encoding.name, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressedCache:
+    """LRU сжатых тел, ограниченный суммарным размером.
+
+    Ключ — хеш исходного тела и кодирование, поэтому повторно отдаваемые
+    одинаковые ответы (закешированные страницы, справочники) сжимаются один
+    раз: blake2b на порядок дешевле сжатия.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+
+    def get_or_compress(self, encoding: Encoding, body: bytes) -> bytes:
+        if self.max_bytes <= 0:
+            return encoding.compress(body)
+        key = (encoding.name, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self._items.get(key)
+        if compressed is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return compressed
+        self.misses += 1
+        compressed = encoding.compress(body)
+        if len(compressed) <= self.max_bytes:
+            self._items[key] = compressed
+            self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+        return compressed
+
+
+class CompressionMiddleware:
+    """Сжатие ответов по Accept-Encoding: zstd, br, gzip.
+
+    Тело меньше minimum_size отдается как есть: на маленьких ответах
+    заголовки и CPU дороже сэкономленных байт. Ответ, тело которого
+    приходит несколькими сообщениями, сжимается потоково (если streaming
+    включен) со сбросом буфера после каждого куска, чтобы не задерживать
+    данные. Уже сжатые ответы, 204/304 и несжимаемые типы не трогаются.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        encodings: Sequence[Encoding] | None = None,
+        streaming: bool = True,
+        cache_bytes: int = 16 * 1024 * 1024,
+        compressible_types: Sequence[str] = COMPRESSIBLE_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = list(encodings) if encodings is not None else default_encodings()
+        self.streaming = streaming
+        self.cache = CompressedCache(cache_bytes)
+        self.compressible_types = tuple(compressible_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        stream: StreamCompressor | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, stream
+            if message["type"] == "http.response.start":
+                if self._compressible(message):
+                    # Решение зависит от размера тела, поэтому заголовки ждут первый кусок
+                    start = message
+                    return
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                response_start, start = start, None
+                if not more_body:
+                    if len(body) < self.minimum_size:
+                        await send(response_start)
+                        await send(message)
+                        return
+                    body = self.cache.get_or_compress(encoding, body)
+                    headers = self._set_encoding(response_start, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    await send(response_start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                if not self.streaming:
+                    await send(response_start)
+                    await send(message)
+                    return
+                stream = encoding.stream()
+                headers = self._set_encoding(response_start, encoding)
+                del headers["Content-Length"]
+                await send(response_start)
+
+            if stream is None:
+                await send(message)
+                return
+            chunk = stream.compress(body) if body else b""
+            if not more_body:
+                chunk += stream.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _compressible(self, message: Message) -> bool:
+        if message["status"] < 200 or message["status"] in {204, 304}:
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        return headers.get("content-type", "").startswith(self.compressible_types)
+
+    @staticmethod
+    def _set_encoding(message: Message, encoding: Encoding) -> MutableHeaders:
+        headers = MutableHeaders(scope=message)
+        headers["Content-Encoding"] = encoding.name
+        headers.add_vary_header("Accept-Encoding")
+        # Сильный ETag описывает байты без сжатия, у сжатого представления он становится слабым
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        return headers
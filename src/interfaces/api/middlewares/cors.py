@@ -0,0 +1,41 @@
+from collections.abc import Callable
+
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.config import get_settings
+from src.infrastructure.config.settings import CORSSettings
+
+
+class ReloadableCORSMiddleware:
+    """CORS по текущему снимку настроек.
+
+    Снимок неизменяем и заменяется целиком при перезагрузке настроек, поэтому
+    сравнения по ссылке достаточно, чтобы заметить изменения и пересобрать
+    CORSMiddleware без перезапуска worker'а.
+    """
+
+    def __init__(self, app: ASGIApp, get_cors_settings: Callable[[], CORSSettings] | None = None) -> None:
+        self.app = app
+        self._get_cors_settings = get_cors_settings or (lambda: get_settings().cors)
+        self._settings: CORSSettings | None = None
+        self._cors: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        settings = self._get_cors_settings()
+        if settings is not self._settings:
+            self._configure(settings)
+        await self._cors(scope, receive, send)
+
+    def _configure(self, settings: CORSSettings) -> None:
+        self._settings = settings
+        if not settings.enabled:
+            self._cors = self.app
+            return
+        self._cors = CORSMiddleware(
+            self.app,
+            allow_origins=settings.allow_origins,
+            allow_credentials=settings.allow_credentials,
+            allow_methods=settings.allow_methods,
+            allow_headers=settings.allow_headers,
+        )
@@ -0,0 +1,24 @@
+from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.database.telemetry import track_checkouts
+
+
+class DBCheckoutMiddleware:
+    """Логирует, сколько соединений из пула взял запрос.
+
+    Должен быть внешним по отношению к контейнеру Dishka, чтобы учитывать
+    и соединения, взятые при закрытии зависимостей запроса.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_checkouts() as stats:
+            await self.app(scope, receive, send)
+        logger.debug("{} {} took {} pool connections", scope["method"], scope["path"], stats.checkouts)
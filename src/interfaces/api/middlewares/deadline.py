@@ -0,0 +1,87 @@
+import asyncio
+import contextlib
+
+from loguru import logger
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.database.deadline import request_deadline
+
+
+class RequestDeadlineMiddleware:
+    """Задает срок выполнения запроса и отменяет его обработку при отключении клиента.
+
+    Срок берется из заголовка (в секундах) или из значения по умолчанию и
+    ограничивается max_timeout. Внутри срока сессии БД выставляют
+    statement_timeout, а отмена задачи обработчика прерывает текущий запрос
+    к базе и возвращает соединение в пул.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_timeout: float | None = None,
+        header: str = "X-Request-Timeout",
+        max_timeout: float | None = None,
+    ) -> None:
+        self.app = app
+        self.default_timeout = default_timeout
+        self.header = header
+        self.max_timeout = max_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_deadline(self.timeout(Headers(scope=scope))):
+            await self._run_until_disconnect(scope, receive, send)
+
+    def timeout(self, headers: Headers) -> float | None:
+        timeout = self.default_timeout
+        with contextlib.suppress(ValueError):
+            requested = float(headers.get(self.header, ""))
+            if requested > 0:
+                timeout = requested
+        if self.max_timeout is not None and (timeout is None or timeout > self.max_timeout):
+            timeout = self.max_timeout
+        return timeout
+
+    async def _run_until_disconnect(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Сообщения клиента читает слушатель, обработчик получает их через очередь
+        messages: asyncio.Queue[Message] = asyncio.Queue(maxsize=1)
+        response_complete = False
+        disconnected = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_complete
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+
+        handler = asyncio.create_task(self.app(scope, messages.get, send_wrapper))
+
+        async def listen() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    # После ответа обработчик только освобождает зависимости, его не прерываем
+                    if not response_complete:
+                        disconnected = True
+                        handler.cancel()
+                    await messages.put(message)
+                    return
+                await messages.put(message)
+
+        listener = asyncio.create_task(listen())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise
+            logger.info("{} {} cancelled: client disconnected", scope["method"], scope["path"])
+        finally:
+            listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
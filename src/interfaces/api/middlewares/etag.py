@@ -0,0 +1,60 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..conditional import NOT_MODIFIED_HEADERS, body_etag, etag_matches
+
+
+class ETagMiddleware:
+    """Условный GET для ответов, которые не выставили ETag сами.
+
+    ETag считается по телу ответа: это экономит трафик, но не работу
+    обработчика, поэтому эндпоинтам с updated_at лучше использовать
+    ConditionalRequestDep. Потоковые ответы пропускаются без изменений:
+    ответы без Content-Length (StreamingResponse, SSE) отдают заголовки
+    сразу, а тело в нескольких сообщениях не буферизуется.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in {"GET", "HEAD"}:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start" and message["status"] == 200 and _can_buffer(message):
+                # Заголовки отправляются вместе с первым куском тела, когда понятно, поток ли это
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+
+            response_start, start = start, None
+            headers = MutableHeaders(scope=response_start)
+            if "etag" not in headers and not message.get("more_body", False):
+                headers["ETag"] = body_etag(message.get("body", b""))
+            if "etag" in headers and etag_matches(if_none_match, headers["etag"]):
+                await send(_not_modified(headers))
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(response_start)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _can_buffer(message: Message) -> bool:
+    # Без Content-Length тело пишется потоком, и первого куска можно ждать долго (SSE)
+    headers = Headers(raw=message["headers"])
+    return "content-length" in headers and not headers.get("content-type", "").startswith("text/event-stream")
+
+
+def _not_modified(headers: MutableHeaders) -> Message:
+    raw = [(name, value) for name, value in headers.raw if name.decode("latin-1") in NOT_MODIFIED_HEADERS]
+    return {"type": "http.response.start", "status": 304, "headers": raw}
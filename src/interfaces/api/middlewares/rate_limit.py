@@ -0,0 +1,115 @@
+import hashlib
+import math
+from collections.abc import Callable, Sequence
+
+from dishka.exceptions import NoFactoryError
+from fastapi import status
+from fastapi.responses import JSONResponse
+from loguru import logger
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.application.common.rate_limit import IRateLimiter, RateLimitResult
+from src.infrastructure.config import get_settings
+from src.infrastructure.config.settings import RateLimitSettings
+
+
+def client_key(scope: Scope, key_header: str | None) -> str:
+    """Клиент запроса: хеш ключа из key_header, если он передан, иначе IP-адрес.
+
+    Значению key_header верим как есть, поэтому задавать его стоит, только
+    если ключ проверяет шлюз перед приложением: иначе клиент обходит лимит
+    по IP, меняя ключ в каждом запросе. IP берется из scope: за прокси его
+    подставляет uvicorn с --proxy-headers и --forwarded-allow-ips.
+    """
+    if key_header is not None:
+        api_key = Headers(scope=scope).get(key_header)
+        if api_key:
+            return f"key:{hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def is_preflight(scope: Scope) -> bool:
+    """CORS preflight: OPTIONS с Access-Control-Request-Method"""
+    return scope["method"] == "OPTIONS" and "access-control-request-method" in Headers(scope=scope)
+
+
+def rate_limit_headers(result: RateLimitResult) -> dict[str, str]:
+    return {"Retry-After": str(math.ceil(result.retry_after)), "X-RateLimit-Remaining": "0"}
+
+
+async def resolve_rate_limiter(scope: Scope) -> IRateLimiter | None:
+    """Лимитер из контейнера Dishka приложения; None, если он не зарегистрирован или не создается"""
+    container = getattr(scope["app"].state, "dishka_container", None)
+    if container is None:
+        return None
+    try:
+        return await container.get(IRateLimiter)
+    except NoFactoryError:
+        return None
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Rate limiter is unavailable, requests are not limited: {}", exc)
+        return None
+
+
+async def hit(limiter: IRateLimiter, key: str, rate: float, burst: int, cost: int = 1) -> RateLimitResult | None:
+    """Списание из корзины; None, если хранилище лимитов недоступно — запрос тогда пропускается"""
+    try:
+        return await limiter.hit(key, rate, burst, cost)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Rate limiter failed, request is not limited: {}", exc)
+        return None
+
+
+class RateLimitMiddleware:
+    """Общий лимит запросов на клиента по корзине токенов.
+
+    Клиент определяется по заголовку с ключом API или по IP. Лимит и
+    включение читаются из текущего снимка настроек RATE_LIMIT_* и меняются
+    при их перезагрузке. Превысивший лимит клиент получает 429 с Retry-After
+    до того, как запрос займет место в очереди или соединение с БД.
+    Лимиты отдельных маршрутов задаются зависимостью rate_limit. Если
+    хранилище лимитов недоступно, запросы пропускаются без ограничения.
+    CORS preflight-запросы не списывают токены: их шлет браузер, а не клиент.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        exempt_paths: Sequence[str] = ("/health",),
+        limiter: IRateLimiter | None = None,
+        get_rate_limit_settings: Callable[[], RateLimitSettings] | None = None,
+    ) -> None:
+        self.app = app
+        self.exempt_paths = tuple(exempt_paths)
+        self._limiter = limiter
+        self._limiter_resolved = limiter is not None
+        self._get_rate_limit_settings = get_rate_limit_settings or (lambda: get_settings().rate_limit)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        settings = self._get_rate_limit_settings()
+        if (
+            scope["type"] != "http"
+            or not settings.enabled
+            or scope["path"].startswith(self.exempt_paths)
+            or is_preflight(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._limiter_resolved:
+            self._limiter_resolved = True
+            self._limiter = await resolve_rate_limiter(scope)
+        if self._limiter is not None:
+            key = f"global:{client_key(scope, settings.key_header)}"
+            result = await hit(self._limiter, key, settings.rate, settings.burst)
+            if result is not None and not result.allowed:
+                response = JSONResponse(
+                    {"msg": "rate limit exceeded"},
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    headers=rate_limit_headers(result),
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
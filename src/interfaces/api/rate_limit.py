@@ -0,0 +1,35 @@
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.params import Depends as DependsParam
+
+from src.infrastructure.config import get_settings
+
+from .middlewares.rate_limit import client_key, hit, rate_limit_headers, resolve_rate_limiter
+
+
+def rate_limit(rate: float, burst: int, cost: int = 1, name: str | None = None) -> DependsParam:
+    """Лимит маршрута на клиента: rate запросов в секунду с запасом burst.
+
+    Корзина у каждого маршрута своя (по шаблону пути или name, если маршруты
+    должны делить лимит) и действует вместе с общим лимитом
+    RateLimitMiddleware. cost — сколько токенов стоит один запрос::
+
+        @router.get("/items/export", dependencies=[rate_limit(rate=1, burst=5)])
+    """
+
+    async def check_rate_limit(request: Request) -> None:
+        settings = get_settings().rate_limit
+        if not settings.enabled:
+            return
+        limiter = await resolve_rate_limiter(request.scope)
+        if limiter is None:
+            return
+        bucket = name or getattr(request.scope.get("route"), "path", request.url.path)
+        result = await hit(limiter, f"{bucket}:{client_key(request.scope, settings.key_header)}", rate, burst, cost)
+        if result is not None and not result.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="rate limit exceeded",
+                headers=rate_limit_headers(result),
+            )
+
+    return Depends(check_rate_limit)
@@ -0,0 +1,32 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from src.domain.common.entity import EntityId
+
+
+def _default(value: Any) -> Any:
+    """Приводит к примитивам то, что orjson не кодирует сам: модели, dataclass'ы, EntityId"""
+    if isinstance(value, EntityId):
+        return str(value)
+    return to_jsonable_python(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON-ответ, который сериализуется сразу в bytes.
+
+    Pydantic-модель кодируется ее сериализатором (model_dump_json без
+    промежуточного dict), остальное — orjson. Эндпоинт без response_model
+    возвращает FastJSONResponse(content) напрямую, чтобы обойти
+    jsonable_encoder. Классом ответа по умолчанию его не делаем: маршруты
+    с response_model FastAPI и так сериализует в bytes, но только со
+    стандартным JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,57 @@
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+import orjson
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from src.application.common.value_objects import EventType
+from src.infrastructure.outbox.feed import FeedEvent, InvalidResumeTokenError, ShardedOutboxFeed
+from src.infrastructure.outbox.serializers import event_to_dict, json_default
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+_HEARTBEAT = b": heartbeat\n\n"
+
+
+def _format_sse(item: FeedEvent) -> bytes:
+    data = orjson.dumps(event_to_dict(item.event), default=json_default)
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (
+        item.resume_token.encode(),
+        item.event.event_type.value.encode(),
+        data,
+    )
+
+
+async def _sse_stream(events: AsyncIterator[FeedEvent | None]) -> AsyncIterator[bytes]:
+    async for item in events:
+        yield _HEARTBEAT if item is None else _format_sse(item)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+@inject
+async def stream_events(
+    feed: FromDishka[ShardedOutboxFeed],
+    event_type: Annotated[list[EventType] | None, Query(description="Фильтр по типам событий")] = None,
+    resource: Annotated[list[str] | None, Query(description="Фильтр по ресурсам")] = None,
+    resume_token: Annotated[str | None, Query(description="Продолжить после этого события")] = None,
+    last_event_id: Annotated[str | None, Header(description="Resume token от EventSource")] = None,
+) -> StreamingResponse:
+    """Поток зафиксированных событий outbox в формате Server-Sent Events.
+
+    ``id`` каждого события — resume token: при переподключении EventSource
+    сам передает его в заголовке Last-Event-ID, и пропущенные события
+    догружаются из БД.
+    """
+    try:
+        after = feed.parse_resume_token(last_event_id or resume_token)
+    except InvalidResumeTokenError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    events = feed.subscribe(event_types=event_type, resources=resource, after=after)
+    return StreamingResponse(
+        _sse_stream(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
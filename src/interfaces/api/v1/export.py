@@ -0,0 +1,125 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Callable, Iterable
+from enum import StrEnum
+from typing import Annotated, Any
+
+import orjson
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.common.entity import Entity
+from src.infrastructure.database.repositories.mixins import StreamMethodMixin
+
+from ..depends import ReadOnlyUnitOfWorkDep
+
+# Строки копятся в куски примерно такого размера, чтобы не вызывать send на каждую строку
+CHUNK_SIZE = 64 * 1024
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {ExportFormat.NDJSON: "application/x-ndjson", ExportFormat.CSV: "text/csv; charset=utf-8"}
+
+
+def ndjson_line(entity: Entity) -> bytes:
+    return entity.__pydantic_serializer__.to_json(entity) + b"\n"
+
+
+def _csv_value(value: Any) -> Any:
+    # Вложенные структуры пишутся в ячейку как JSON
+    if isinstance(value, dict | list):
+        return orjson.dumps(value).decode()
+    return "" if value is None else value
+
+
+def csv_lines(fields: Iterable[str]) -> Callable[[Entity | None], bytes]:
+    """Кодировщик строк CSV: None дает заголовок, сущность — строку с ее полями."""
+    fields = list(fields)
+    include = set(fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def encode(entity: Entity | None) -> bytes:
+        if entity is None:
+            writer.writerow(fields)
+        else:
+            data = entity.model_dump(mode="json", include=include)
+            writer.writerow([_csv_value(data.get(field)) for field in fields])
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line.encode()
+
+    return encode
+
+
+async def encode_rows(
+    entities: AsyncIterator[Entity],
+    encode: Callable[[Entity], bytes],
+    header: bytes = b"",
+    chunk_size: int = CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Кодирует сущности и отдает их кусками не больше chunk_size (плюс одна строка).
+
+    Следующая пачка читается из курсора только после того, как сервер принял
+    предыдущий кусок, поэтому медленный клиент тормозит чтение из БД, а не
+    копит ответ в памяти.
+    """
+    chunk = bytearray(header)
+    async for entity in entities:
+        chunk += encode(entity)
+        if len(chunk) >= chunk_size:
+            yield bytes(chunk)
+            chunk.clear()
+    if chunk:
+        yield bytes(chunk)
+
+
+def add_export_route[E: Entity](
+    router: APIRouter,
+    path: str,
+    entity_cls: type[E],
+    repository_factory: Callable[[AsyncSession], StreamMethodMixin[E]],
+    *,
+    filename: str,
+    batch_size: int = 1000,
+) -> None:
+    """Добавляет в router GET-эндпоинт, который выгружает все сущности в NDJSON или CSV.
+
+    Строки читаются серверным курсором в read-only транзакции и пишутся в
+    ответ по мере чтения: память worker'а не зависит от размера таблицы.
+    Колонки CSV — поля entity_cls. Пример::
+
+        add_export_route(router, "/users/export", UserEntity, UserRepository, filename="users")
+    """
+    fields = list(entity_cls.model_fields)
+
+    @router.get(path, response_class=StreamingResponse, summary=f"Export {filename}")
+    @inject
+    async def export(
+        session: FromDishka[AsyncSession],
+        uow: ReadOnlyUnitOfWorkDep,  # задает режим READ ONLY общей сессии запроса
+        export_format: Annotated[
+            ExportFormat, Query(alias="format", description="Формат выгрузки")
+        ] = ExportFormat.NDJSON,
+    ) -> StreamingResponse:
+        entities = repository_factory(session).stream(batch_size=batch_size)
+        if export_format is ExportFormat.CSV:
+            encode = csv_lines(fields)
+            body = encode_rows(entities, encode, header=encode(None))
+        else:
+            body = encode_rows(entities, ndjson_line)
+        return StreamingResponse(
+            body,
+            media_type=MEDIA_TYPES[export_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}.{export_format}"',
+                "X-Accel-Buffering": "no",
+            },
+        )
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from dishka import AsyncContainer
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from src.application.common.unit_of_work import IUnitOfWork
+from src.domain.common.entity import Entity
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.sharding import ShardRouter
+
+type WarmupStep = Callable[[FastAPI, AsyncContainer], Awaitable[None]]
+
+
+@dataclass
+class WarmupReport:
+    """Длительность шагов прогрева в секундах и ошибки шагов, которые не удались"""
+
+    timings: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+async def resolve_dependencies(app: FastAPI, container: AsyncContainer) -> None:
+    """Создает зависимости уровня приложения и один раз проходит граф запроса"""
+    await container.get(ShardRouter)
+    async with container() as request_container:
+        # Сессия и UnitOfWork создаются без обращения к базе
+        await request_container.get(IUnitOfWork)
+
+
+def open_pool_connections(connections: int | None = None) -> WarmupStep:
+    """Шаг, заранее открывающий соединения пула каждого шарда.
+
+    connections=None заполняет пул до pool_size; больше pool_size не открывается,
+    чтобы прогрев не занимал соединения из переполнения.
+    """
+
+    async def step(app: FastAPI, container: AsyncContainer) -> None:
+        router = await container.get(ShardRouter)
+        await asyncio.gather(*(_open_connections(engine, connections) for engine in router.engines))
+
+    return step
+
+
+async def _open_connections(engine: AsyncEngine, connections: int | None) -> None:
+    pool = engine.sync_engine.pool
+    # NullPool и StaticPool не хранят открытые соединения
+    if not isinstance(pool, QueuePool):
+        return
+    count = pool.size() if connections is None else min(connections, pool.size())
+    opened = await asyncio.gather(*(engine.connect() for _ in range(count)))
+    await asyncio.gather(*(connection.close() for connection in opened))
+
+
+async def build_converters(app: FastAPI, container: AsyncContainer) -> None:  # noqa: RUF029
+    """Настраивает мапперы SQLAlchemy и достраивает схемы сущностей, используемые репозиториями"""
+    Base.registry.configure()
+    pending = [Entity]
+    while pending:
+        entity_cls = pending.pop()
+        entity_cls.model_rebuild()
+        pending.extend(entity_cls.__subclasses__())
+
+
+async def render_openapi(app: FastAPI, container: AsyncContainer) -> None:  # noqa: RUF029
+    """Генерирует OpenAPI-схему; FastAPI кеширует ее для последующих запросов"""
+    if app.openapi_url is not None:
+        app.openapi()
+
+
+async def run_warmup(app: FastAPI, container: AsyncContainer, steps: dict[str, WarmupStep]) -> WarmupReport:
+    """Выполняет шаги прогрева по очереди и логирует время каждого.
+
+    Ошибка шага не останавливает запуск: worker, который не смог прогреться
+    (например, база еще недоступна), обслужит первые запросы медленнее, но
+    не уйдет в цикл перезапусков.
+    """
+    report = WarmupReport()
+    for name, step in steps.items():
+        started = time.perf_counter()
+        try:
+            await step(app, container)
+        except Exception as exc:  # noqa: BLE001
+            report.errors[name] = repr(exc)
+            logger.warning("Warmup step {} failed: {!r}", name, exc)
+        report.timings[name] = time.perf_counter() - started
+        logger.info("Warmup step {} took {:.1f} ms", name, report.timings[name] * 1000)
+    logger.info("Warmup finished in {:.1f} ms", sum(report.timings.values()) * 1000)
+    return report
+
+
+def default_warmup_steps(pool_connections: int | None = None) -> dict[str, WarmupStep]:
+    return {
+        "dependencies": resolve_dependencies,
+        "pool": open_pool_connections(pool_connections),
+        "converters": build_converters,
+        "openapi": render_openapi,
+    }
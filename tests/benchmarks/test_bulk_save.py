@@ -0,0 +1,105 @@
+"""Benchmarks for saving many entities through SaveMethodMixin.
+
+Compares per-entity ``save()`` (merge + flush + refresh per row) with
+``uow.bulk()`` on an in-memory SQLite database. ``extra_info["rows_per_second"]``
+is included in ``--benchmark-json`` output.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+from src.domain.common.entity import Entity, UuidEntityId
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.repositories.base import BaseRepository
+from src.infrastructure.database.repositories.mixins import SaveMethodMixin
+from src.infrastructure.unit_of_work import UnitOfWork
+
+ROWS = 500
+
+
+class BenchItemModel(Base):
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    price: Mapped[int]
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class BenchItemEntity(Entity):
+    id: UuidEntityId
+    name: str
+    price: int
+    created_at: datetime | None = None
+
+
+class BenchItemRepository(BaseRepository[BenchItemModel, BenchItemEntity], SaveMethodMixin[BenchItemEntity]):
+    def entity_to_model(self, value: BenchItemEntity) -> BenchItemModel:
+        return BenchItemModel(id=value.id.value, name=value.name, price=value.price)
+
+
+@pytest.fixture
+def runner() -> Iterator[asyncio.Runner]:
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture
+def engine(runner: asyncio.Runner) -> Iterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    async def create_table() -> None:
+        async with engine.begin() as connection:
+            await connection.run_sync(BenchItemModel.__table__.create)
+
+    runner.run(create_table())
+    yield engine
+    runner.run(engine.dispose())
+
+
+async def _save_one_by_one(engine: AsyncEngine, entities: list[BenchItemEntity]) -> None:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        uow = UnitOfWork(session=session)
+        repository = BenchItemRepository(session)
+        for entity in entities:
+            await repository.save(entity)
+        await uow.commit()
+
+
+async def _save_bulk(engine: AsyncEngine, entities: list[BenchItemEntity], refresh: bool) -> None:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        uow = UnitOfWork(session=session)
+        repository = BenchItemRepository(session)
+        async with uow.bulk(refresh=refresh):
+            for entity in entities:
+                await repository.save(entity)
+        await uow.commit()
+
+
+MODES = {
+    "one_by_one": _save_one_by_one,
+    "bulk": lambda engine, entities: _save_bulk(engine, entities, refresh=False),
+    "bulk+refresh": lambda engine, entities: _save_bulk(engine, entities, refresh=True),
+}
+
+
+@pytest.mark.benchmark(group="bulk-save", max_time=0.5)
+@pytest.mark.parametrize("mode", MODES)
+def test_save(benchmark, runner: asyncio.Runner, engine: AsyncEngine, mode: str):
+    save = MODES[mode]
+
+    def setup():
+        entities = [BenchItemEntity(id=UuidEntityId(uuid4()), name=f"item-{i}", price=i) for i in range(ROWS)]
+        return (entities,), {}
+
+    benchmark.pedantic(lambda entities: runner.run(save(engine, entities)), setup=setup, rounds=5)
+    benchmark.extra_info["rows"] = ROWS
+    benchmark.extra_info["rows_per_second"] = ROWS / benchmark.stats.stats.mean
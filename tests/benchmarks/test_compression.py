@@ -0,0 +1,71 @@
+"""Benchmarks for response compression: CPU time against bytes saved.
+
+Compresses a JSON page of entities with every available encoding. The
+``cached`` case goes through ``CompressedCache``, where a repeated body costs
+one blake2b hash instead of a compression. ``extra_info`` holds the original
+and compressed sizes and the ratio and is included in ``--benchmark-json``
+output.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.application.common.schemas import PaginationRequest, PaginationResponse
+from src.domain.common.entity import Entity, UuidEntityId
+from src.interfaces.api.middlewares.compression import CompressedCache, default_encodings
+
+
+class BenchItemEntity(Entity):
+    """Сущность в ответе списка."""
+
+    id: UuidEntityId
+    name: str
+    description: str
+    created_at: datetime
+    tags: list[str]
+
+
+BODY = (
+    PaginationResponse[BenchItemEntity, PaginationRequest](
+        data=[
+            BenchItemEntity(
+                id=UuidEntityId(),
+                name=f"item-{i}",
+                description=f"Description of item {i} with some repeated text",
+                created_at=datetime.now(UTC),
+                tags=["catalog", "active"],
+            )
+            for i in range(100)
+        ],
+        filters=PaginationRequest(limit=100),
+        count=100,
+    )
+    .model_dump_json()
+    .encode()
+)
+
+ENCODINGS = {encoding.name: encoding for encoding in default_encodings()}
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.benchmark(group="compression")
+def test_compress(benchmark, encoding: str):
+    compressed = benchmark(ENCODINGS[encoding].compress, BODY)
+
+    benchmark.extra_info.update(
+        original_bytes=len(BODY), compressed_bytes=len(compressed), ratio=round(len(BODY) / len(compressed), 2)
+    )
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+@pytest.mark.benchmark(group="compression")
+def test_compress_cached(benchmark, encoding: str):
+    cache = CompressedCache(max_bytes=1024 * 1024)
+    cache.get_or_compress(ENCODINGS[encoding], BODY)
+
+    compressed = benchmark(cache.get_or_compress, ENCODINGS[encoding], BODY)
+
+    benchmark.extra_info.update(original_bytes=len(BODY), compressed_bytes=len(compressed))
@@ -0,0 +1,98 @@
+"""Benchmarks for OutboxEvent serialization.
+
+Compares encode/decode speed and bytes per event for every ``OutboxEvent.create_*``
+factory. Sizes are stored in ``extra_info`` and show up in ``--benchmark-json`` output.
+"""
+
+import json
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.application.common.value_objects import OutboxEvent
+from src.infrastructure.outbox.serializers import Codec, EventSerializer, event_from_dict, event_to_dict
+
+EVENTS = {
+    "message": OutboxEvent.create_message(
+        to="user@example.com",
+        send_type="email",
+        subject="Your order has been shipped",
+        body="Hello! " + "Your order #12345 has been shipped and will arrive soon. " * 20,
+    ),
+    "user_action": OutboxEvent.create_user_action(
+        user_id="user-123",
+        action="login",
+        resource="auth_service",
+        details={"ip": "192.168.1.1", "user_agent": "Mozilla/5.0", "success": True},
+    ),
+    "audit_log": OutboxEvent.create_audit_log(
+        entity_type="Order",
+        entity_id="order-456",
+        operation="update",
+        user_id="user-123",
+        changes={f"field_{i}": {"old": i, "new": i + 1} for i in range(50)},
+    ),
+    "webhook": OutboxEvent.create_webhook(
+        url="https://api.example.com/webhook",
+        headers={"Authorization": "Bearer token123", "Content-Type": "application/json"},
+        body={"event": "order.created", "id": "order-456", "items": list(range(20))},
+    ),
+    "notification": OutboxEvent.create_notification(
+        user_id="user-123",
+        title="New message",
+        message="You have a new message",
+        link="https://example.com/messages/1",
+    ),
+}
+
+SERIALIZERS = {
+    "json": None,
+    "orjson": {"codec": Codec.ORJSON, "compression_threshold": None},
+    "orjson+zstd": {"codec": Codec.ORJSON, "compression_threshold": 512},
+    "msgpack": {"codec": Codec.MSGPACK, "compression_threshold": None},
+    "msgpack+zstd": {"codec": Codec.MSGPACK, "compression_threshold": 512},
+}
+
+
+class _StdlibJsonSerializer:
+    """Базовая линия: stdlib json без заголовка и сжатия"""
+
+    def serialize(self, event: OutboxEvent) -> bytes:
+        return json.dumps(event_to_dict(event)).encode()
+
+    def deserialize(self, value: bytes) -> OutboxEvent:
+        return event_from_dict(json.loads(value))
+
+
+def _make_serializer(name: str):
+    options = SERIALIZERS[name]
+    if options is None:
+        return _StdlibJsonSerializer()
+    if options["codec"] is Codec.MSGPACK:
+        pytest.importorskip("msgpack")
+    return EventSerializer(**options)
+
+
+@pytest.mark.benchmark(group="event-encode", max_time=0.1)
+@pytest.mark.parametrize("serializer_name", SERIALIZERS)
+@pytest.mark.parametrize("event_name", EVENTS)
+def test_encode(benchmark, event_name: str, serializer_name: str):
+    serializer = _make_serializer(serializer_name)
+    event = EVENTS[event_name]
+
+    data = benchmark(serializer.serialize, event)
+
+    benchmark.extra_info["bytes"] = len(data)
+
+
+@pytest.mark.benchmark(group="event-decode", max_time=0.1)
+@pytest.mark.parametrize("serializer_name", SERIALIZERS)
+@pytest.mark.parametrize("event_name", EVENTS)
+def test_decode(benchmark, event_name: str, serializer_name: str):
+    serializer = _make_serializer(serializer_name)
+    data = serializer.serialize(EVENTS[event_name])
+
+    benchmark(serializer.deserialize, data)
+
+    benchmark.extra_info["bytes"] = len(data)
@@ -0,0 +1,90 @@
+"""Benchmarks for JSON responses of list endpoints.
+
+Serves a ``PaginationResponse`` page of entities through a FastAPI app from
+an endpoint with a response model, one without it (``jsonable_encoder``
+path) and one that returns ``FastJSONResponse`` directly.
+Requests go straight to the ASGI app, so the numbers cover routing,
+validation and serialization only. ``extra_info["requests_per_second"]`` is
+included in ``--benchmark-json`` output.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fastapi import FastAPI
+from src.application.common.schemas import PaginationRequest, PaginationResponse
+from src.domain.common.entity import Entity, UuidEntityId
+from src.interfaces.api.responses import FastJSONResponse
+
+ITEMS = 100
+REQUESTS = 200
+
+
+class BenchItemEntity(Entity):
+    """Сущность в ответе списка."""
+
+    id: UuidEntityId
+    owner_id: UuidEntityId
+    name: str
+    created_at: datetime
+    tags: list[str]
+
+
+type Page = PaginationResponse[BenchItemEntity, PaginationRequest]
+
+PAGE = PaginationResponse[BenchItemEntity, PaginationRequest](
+    data=[
+        BenchItemEntity(
+            id=UuidEntityId(), owner_id=UuidEntityId(), name=f"item-{i}", created_at=datetime.now(UTC), tags=["a", "b"]
+        )
+        for i in range(ITEMS)
+    ],
+    filters=PaginationRequest(limit=100),
+    count=ITEMS,
+)
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.get("/typed", response_model=PaginationResponse[BenchItemEntity, PaginationRequest])(lambda: PAGE)
+    app.get("/untyped")(lambda: PAGE)
+    app.get("/direct")(lambda: FastJSONResponse(PAGE))
+    return app
+
+
+async def serve(app: FastAPI, path: str, requests: int) -> None:
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+
+    async def receive() -> dict:  # noqa: RUF029
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        pass
+
+    for _ in range(requests):
+        await app(scope, receive, send)
+
+
+@pytest.mark.parametrize("path", ["/typed", "/untyped", "/direct"])
+@pytest.mark.benchmark(group="json-response")
+def test_list_endpoint(benchmark, path: str):
+    app = make_app()
+
+    benchmark.pedantic(lambda: asyncio.run(serve(app, path, REQUESTS)), rounds=5)
+    benchmark.extra_info["requests_per_second"] = REQUESTS / benchmark.stats.stats.mean
@@ -0,0 +1,79 @@
+"""Benchmarks for direct and PgBouncer connection configurations.
+
+Runs the same parametrized SELECT against a local Postgres directly and
+through PgBouncer in transaction mode. Set ``BENCH_POSTGRES_URL`` and
+``BENCH_PGBOUNCER_URL`` (``postgresql+asyncpg://...``) to enable; the
+benchmarks are skipped otherwise. ``extra_info["queries_per_second"]`` is
+included in ``--benchmark-json`` output.
+"""
+
+import asyncio
+import os
+from collections.abc import Iterator
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("asyncpg")
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from src.di.database import DBConfig, engine_options
+from src.infrastructure.database.telemetry import PoolTelemetry
+
+QUERIES = 200
+CONCURRENCY = 10
+
+# url env, pgbouncer, null pool, statement cache size
+CONFIGS = {
+    "direct": ("BENCH_POSTGRES_URL", False, False, 100),
+    "pgbouncer-no-cache": ("BENCH_PGBOUNCER_URL", True, False, 0),
+    "pgbouncer-unique-names": ("BENCH_PGBOUNCER_URL", True, False, 100),
+    "pgbouncer-null-pool": ("BENCH_PGBOUNCER_URL", True, True, 100),
+}
+
+
+@pytest.fixture
+def runner() -> Iterator[asyncio.Runner]:
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(params=CONFIGS)
+def engine(request: pytest.FixtureRequest, runner: asyncio.Runner) -> Iterator[AsyncEngine]:
+    url_env, pgbouncer, null_pool, cache_size = CONFIGS[request.param]
+    url = os.environ.get(url_env)
+    if not url:
+        pytest.skip(f"{url_env} is not set")
+
+    config = DBConfig(
+        url=url,
+        pool_size=CONCURRENCY,
+        statement_cache_size=cache_size,
+        pgbouncer=pgbouncer,
+        pgbouncer_null_pool=null_pool,
+    )
+    engine = create_async_engine(**engine_options(config, PoolTelemetry()))
+    yield engine
+    runner.run(engine.dispose())
+
+
+async def _run_queries(engine: AsyncEngine) -> None:
+    query = text("SELECT CAST(:value AS integer) + 1")
+
+    async def worker(offset: int) -> None:
+        for i in range(offset, QUERIES, CONCURRENCY):
+            async with engine.connect() as connection:
+                await connection.execute(query, {"value": i})
+
+    await asyncio.gather(*(worker(offset) for offset in range(CONCURRENCY)))
+
+
+@pytest.mark.benchmark(group="pgbouncer", max_time=1.0)
+def test_queries(benchmark, runner: asyncio.Runner, engine: AsyncEngine):
+    # Прогрев: соединения и кеш prepared statements
+    runner.run(_run_queries(engine))
+
+    benchmark.pedantic(lambda: runner.run(_run_queries(engine)), rounds=5)
+    benchmark.extra_info["queries"] = QUERIES
+    benchmark.extra_info["queries_per_second"] = QUERIES / benchmark.stats.stats.mean
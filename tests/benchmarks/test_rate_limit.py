@@ -0,0 +1,84 @@
+"""Benchmarks for the per-request overhead of rate limiting.
+
+Serves a small endpoint through a FastAPI app without rate limiting and with
+``RateLimitMiddleware`` over the in-memory token buckets, with one client
+and with many distinct clients. The limit is high enough that no request is
+rejected, so the difference is the cost of the check itself. The ``redis``
+case uses ``RedisRateLimiter`` and runs only when ``REDIS_URL`` is set.
+``extra_info["requests_per_second"]`` is included in ``--benchmark-json``
+output.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fastapi import FastAPI
+from src.infrastructure.config.settings import RateLimitSettings
+from src.infrastructure.rate_limit import InMemoryRateLimiter, RedisRateLimiter
+from src.interfaces.api.middlewares import RateLimitMiddleware
+
+REQUESTS = 500
+CLIENTS = {"one-client": 1, "many-clients": REQUESTS}
+SETTINGS = RateLimitSettings(enabled=True, rate=1_000_000, burst=1_000_000)
+
+
+def make_app(limiter) -> FastAPI:
+    app = FastAPI()
+    app.get("/items")(lambda: {"ok": True})
+    if limiter is not None:
+        app.add_middleware(RateLimitMiddleware, limiter=limiter, get_rate_limit_settings=lambda: SETTINGS)
+    return app
+
+
+async def serve(app: FastAPI, clients: int) -> None:
+    async def receive() -> dict:  # noqa: RUF029
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        pass
+
+    for i in range(REQUESTS):
+        scope = {
+            "type": "http",
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/items",
+            "raw_path": b"/items",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [],
+            "server": ("testserver", 80),
+            "client": (f"10.0.{i % clients // 256}.{i % clients % 256}", 50000),
+        }
+        await app(scope, receive, send)
+
+
+def make_limiter(backend: str):
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryRateLimiter()
+    pytest.importorskip("redis")
+    url = os.environ.get("REDIS_URL")
+    if not url:
+        pytest.skip("REDIS_URL is not set")
+    return RedisRateLimiter.from_url(url, key_prefix=f"bench:{os.urandom(4).hex()}")
+
+
+@pytest.mark.parametrize("clients", CLIENTS)
+@pytest.mark.parametrize("backend", ["none", "memory", "redis"])
+@pytest.mark.benchmark(group="rate-limit")
+def test_request_overhead(benchmark, backend: str, clients: str):
+    limiter = make_limiter(backend)
+    app = make_app(limiter)
+
+    with asyncio.Runner() as runner:
+        benchmark.pedantic(lambda: runner.run(serve(app, CLIENTS[clients])), rounds=5)
+        if isinstance(limiter, RedisRateLimiter):
+            runner.run(limiter.close())
+    benchmark.extra_info["requests_per_second"] = REQUESTS / benchmark.stats.stats.mean
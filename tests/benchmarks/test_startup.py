@@ -0,0 +1,110 @@
+"""Cold-start benchmarks for the supervisor and a fresh worker.
+
+``test_import_budget`` runs ``python -X importtime`` in a fresh interpreter and
+fails when the cumulative import time exceeds its budget: ``main`` alone is
+what the supervisor process imports, ``create_app`` calls the factory, so it
+covers exactly the modules every worker loads before serving. Budgets are in milliseconds and can be
+overridden with ``STARTUP_MAIN_BUDGET_MS`` and ``STARTUP_WORKER_BUDGET_MS``
+on slower machines.
+
+``test_time_to_first_request`` starts uvicorn with the app factory and
+measures the time until ``/health`` answers, warmup included.
+``extra_info["time_to_first_request_ms"]`` is included in
+``--benchmark-json`` output.
+"""
+
+import operator
+import os
+import re
+import socket
+import subprocess  # noqa: S404
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+ROOT = Path(__file__).resolve().parents[2]
+
+BUDGETS_MS = {
+    "main": float(os.environ.get("STARTUP_MAIN_BUDGET_MS", 500)),
+    "create_app": float(os.environ.get("STARTUP_WORKER_BUDGET_MS", 2000)),
+}
+
+IMPORTS = {
+    "main": "import main",
+    # Фабрика импортирует провайдеры лениво: вызываем ее, чтобы список модулей не устаревал
+    "create_app": "import main; main.create_app()",
+}
+
+# Эти модули нужны только worker'у, процесс-супервизор их загружать не должен
+WORKER_ONLY_MODULES = ("fastapi", "starlette", "sqlalchemy", "dishka", "uvicorn")
+
+STARTUP_TIMEOUT = 30.0
+
+
+def import_time_ms(code: str) -> tuple[float, dict[str, float]]:
+    """Суммарное время импорта и время каждого модуля верхнего уровня по -X importtime"""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    top_level = {}
+    for match in re.finditer(r"^import time:\s+\d+ \|\s+(\d+) \| (\S.*)$", result.stderr, re.MULTILINE):
+        top_level[match.group(2)] = int(match.group(1)) / 1000
+    return sum(top_level.values()), top_level
+
+
+@pytest.mark.parametrize("entry_point", IMPORTS)
+def test_import_budget(entry_point: str):
+    total, top_level = import_time_ms(IMPORTS[entry_point])
+    slowest = sorted(top_level.items(), key=operator.itemgetter(1), reverse=True)[:5]
+
+    assert total <= BUDGETS_MS[entry_point], f"{entry_point} imports took {total:.0f} ms, slowest: {slowest}"
+
+
+def test_supervisor_does_not_import_worker_stack():
+    code = f"import sys, main; print(','.join(m for m in {WORKER_ONLY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)  # noqa: S603
+
+    assert result.stdout.strip() == ""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_worker_and_wait(port: int) -> float:
+    env = os.environ | {"DB_WARMUP_CONNECTIONS": "0", "LOGGING_LEVEL": "WARNING"}
+    command = [sys.executable, "-m", "uvicorn", "main:create_app", "--factory", "--port", str(port)]
+    started = time.perf_counter()
+    worker = subprocess.Popen(command, cwd=ROOT, env=env)  # noqa: S603
+    try:
+        while time.perf_counter() - started < STARTUP_TIMEOUT:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                if worker.poll() is not None:
+                    pytest.fail(f"Worker exited with code {worker.returncode}")
+                time.sleep(0.01)
+        pytest.fail(f"Worker did not answer within {STARTUP_TIMEOUT} s")
+    finally:
+        worker.terminate()
+        worker.wait()
+
+
+@pytest.mark.benchmark(group="startup")
+def test_time_to_first_request(benchmark):
+    benchmark.pedantic(lambda: start_worker_and_wait(free_port()), rounds=3)
+    benchmark.extra_info["time_to_first_request_ms"] = benchmark.stats.stats.mean * 1000
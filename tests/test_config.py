@@ -7,9 +7,13 @@ from src.infrastructure.config.settings import (
     AppSettings,
     CORSSettings,
     DatabaseSettings,
+    EventBusSettings,
     LoggingSettings,
+    OutboxSettings,
     Settings,
+    load_settings,
 )
+from src.infrastructure.config.store import SettingsStore
 
 
 def test_database_settings_defaults():
@@ -22,6 +26,22 @@ def test_database_settings_defaults():
     assert db_settings.name == "app_db"
     assert db_settings.echo is False
     assert db_settings.pool_size == 5
+    assert db_settings.pool_timeout == 30.0
+    assert db_settings.pool_recycle == -1
+    assert db_settings.pool_pre_ping is False
+    assert db_settings.pool_use_lifo is False
+    assert db_settings.statement_cache_size == 100
+    assert db_settings.pgbouncer is False
+    assert db_settings.pgbouncer_null_pool is True
+    assert db_settings.shard_urls == []
+    assert db_settings.warmup_connections is None
+
+
+def test_database_settings_shard_urls_from_env(monkeypatch):
+    """Test shard URLs are read from a comma-separated environment variable."""
+    monkeypatch.setenv("DB_SHARD_URLS", "postgresql+asyncpg://a/db, postgresql+asyncpg://b/db,")
+
+    assert DatabaseSettings().shard_urls == ["postgresql+asyncpg://a/db", "postgresql+asyncpg://b/db"]
 
 
 def test_database_settings_url_generation():
@@ -49,6 +69,8 @@ def test_app_settings_defaults():
     assert app_settings.host == "0.0.0.0"
     assert app_settings.port == 8000
     assert app_settings.workers == 1
+    assert app_settings.limit_max_requests is None
+    assert app_settings.warmup is True
 
 
 def test_app_settings_environment_validation():
@@ -119,6 +141,10 @@ def test_api_settings_defaults():
     assert api_settings.redoc_url == "/redoc"
     assert api_settings.openapi_url == "/openapi.json"
     assert api_settings.title == "Python Web Template API"
+    assert api_settings.request_timeout == 30.0
+    assert api_settings.request_timeout_header == "X-Request-Timeout"
+    assert api_settings.max_request_timeout == 300.0
+    assert api_settings.pool_stats is False
 
 
 def test_settings_composition():
@@ -131,6 +157,8 @@ def test_settings_composition():
     assert isinstance(settings.logging, LoggingSettings)
     assert isinstance(settings.cors, CORSSettings)
     assert isinstance(settings.api, APISettings)
+    assert isinstance(settings.event_bus, EventBusSettings)
+    assert isinstance(settings.outbox, OutboxSettings)
 
 
 def test_settings_with_custom_values():
@@ -195,3 +223,121 @@ def test_api_settings_docs_disabled():
     assert api_settings.docs_url is None
     assert api_settings.redoc_url is None
     assert api_settings.openapi_url is None
+
+
+def test_event_bus_settings_defaults():
+    """Test event bus settings with default values."""
+    event_bus_settings = EventBusSettings()
+
+    assert event_bus_settings.queue_size == 1000
+    assert event_bus_settings.publish_timeout == 0.1
+    assert event_bus_settings.overflow == "block"
+
+    with pytest.raises(ValidationError):
+        EventBusSettings(overflow="invalid")
+
+
+def test_outbox_settings_defaults():
+    """Test outbox settings with default values."""
+    outbox_settings = OutboxSettings()
+
+    assert outbox_settings.codec == "orjson"
+    assert outbox_settings.compression_threshold == 1024
+    assert outbox_settings.notify_channel == "outbox_events"
+    assert outbox_settings.feed_batch_size == 500
+
+    with pytest.raises(ValidationError):
+        OutboxSettings(codec="pickle")
+
+
+def test_connection_plan_without_budget_keeps_pool_settings():
+    """Test that pool settings are used as is when no budget is set."""
+    settings = Settings(
+        app=AppSettings(workers=4),
+        database=DatabaseSettings(pool_size=5, max_overflow=10),
+    )
+
+    plan = settings.connection_plan
+    assert (plan.pool_size, plan.max_overflow) == (5, 10)
+    assert plan.peak_connections == 60
+
+
+def test_connection_plan_fits_budget():
+    """Test that pools are shrunk to fit the budget across workers and replicas."""
+    settings = Settings(
+        app=AppSettings(workers=4, replicas=3),
+        database=DatabaseSettings(pool_size=5, max_overflow=10, connection_budget=100, reserved_connections=4),
+    )
+
+    plan = settings.connection_plan
+    assert plan.processes == 12
+    assert (plan.pool_size, plan.max_overflow) == (5, 3)
+    assert plan.peak_connections <= 96
+
+
+def test_connection_plan_rejects_too_small_budget():
+    """Test that settings refuse a budget smaller than the number of processes."""
+    with pytest.raises(ValidationError, match="DB_CONNECTION_BUDGET"):
+        Settings(
+            app=AppSettings(workers=8, replicas=2),
+            database=DatabaseSettings(connection_budget=10),
+        )
+
+
+def test_load_settings_reads_env_file_once_with_environment_override(tmp_path, monkeypatch):
+    """Test that load_settings reads .env and lets the environment override it."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("DB_HOST=db.internal\nLOG_LEVEL=DEBUG\nCORS_ALLOW_ORIGINS=https://a.com,https://b.com\n")
+    monkeypatch.setenv("LOG_LEVEL", "ERROR")
+
+    settings = load_settings(env_file)
+
+    assert settings.database.host == "db.internal"
+    assert settings.logging.level == "ERROR"
+    assert settings.cors.allow_origins == ["https://a.com", "https://b.com"]
+
+
+def test_load_settings_decodes_json_lists(tmp_path, monkeypatch):
+    """Test that list settings accept JSON lists as well as comma-separated values."""
+    monkeypatch.setenv("CORS_ALLOW_ORIGINS", '["http://a.com","http://b.com"]')
+    monkeypatch.setenv("CORS_ALLOW_METHODS", "GET, POST")
+    monkeypatch.setenv("API_PRIORITY_PATHS", '["/health", "/api/v1/events/stream"]')
+
+    settings = load_settings(tmp_path / ".env")
+
+    assert settings.cors.allow_origins == ["http://a.com", "http://b.com"]
+    assert settings.cors.allow_methods == ["GET", "POST"]
+    assert settings.api.priority_paths == ["/health", "/api/v1/events/stream"]
+    assert Settings().cors.allow_origins == settings.cors.allow_origins
+
+
+def test_settings_are_frozen(tmp_path):
+    """Test that the settings snapshot cannot be modified in place."""
+    settings = load_settings(tmp_path / ".env")
+
+    with pytest.raises(ValidationError):
+        settings.logging.level = "DEBUG"
+    with pytest.raises(ValidationError):
+        settings.database = DatabaseSettings()
+
+
+def test_settings_store_reload_applies_only_reloadable_fields(tmp_path, monkeypatch):
+    """Test that reload applies log level and CORS but keeps settings that need a restart."""
+    for name in ("LOG_LEVEL", "CORS_ALLOW_ORIGINS", "DB_HOST"):
+        monkeypatch.delenv(name, raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("LOG_LEVEL=INFO\nCORS_ALLOW_ORIGINS=https://a.com\nDB_HOST=old-db\n")
+    store = SettingsStore(env_file)
+    before = store.get()
+    reloaded = []
+    store.subscribe(reloaded.append)
+
+    env_file.write_text("LOG_LEVEL=WARNING\nCORS_ALLOW_ORIGINS=https://b.com\nDB_HOST=new-db\n")
+    after = store.reload()
+
+    assert store.get() is after
+    assert reloaded == [after]
+    assert after.logging.level == "WARNING"
+    assert after.cors.allow_origins == ["https://b.com"]
+    assert after.database is before.database
+    assert before.logging.level == "INFO"
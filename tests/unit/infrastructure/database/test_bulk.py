@@ -0,0 +1,160 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import DateTime, String, event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+from src.domain.common.entity import Entity, UuidEntityId
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.repositories.base import BaseRepository
+from src.infrastructure.database.repositories.mixins import SaveMethodMixin
+from src.infrastructure.unit_of_work import UnitOfWork
+
+pytest.importorskip("aiosqlite")
+
+
+class BulkItemModel(Base):
+    """Тестовая модель с серверным значением по умолчанию."""
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class BulkItemEntity(Entity):
+    """Тестовая сущность."""
+
+    id: UuidEntityId
+    name: str
+    created_at: datetime | None = None
+
+
+class BulkItemRepository(
+    BaseRepository[BulkItemModel, BulkItemEntity],
+    SaveMethodMixin[BulkItemEntity],
+):
+    """Тестовый репозиторий."""
+
+    def entity_to_model(self, value: BulkItemEntity) -> BulkItemModel:
+        return BulkItemModel(id=value.id.value, name=value.name)
+
+
+@pytest_asyncio.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    """Создает SQLite БД в памяти с тестовой таблицей."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(BulkItemModel.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """Создает сессию."""
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine: AsyncEngine) -> list[str]:
+    """Собирает выполненные SQL-запросы."""
+    statements: list[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement.split()[0]),
+    )
+    return statements
+
+
+def make_entities(count: int) -> list[BulkItemEntity]:
+    return [BulkItemEntity(id=UuidEntityId(uuid4()), name=f"item-{i}") for i in range(count)]
+
+
+class TestBulkWrite:
+    """Тесты пакетной записи через uow.bulk()"""
+
+    @pytest.mark.asyncio
+    async def test_inserts_in_single_flush(self, session: AsyncSession, statements: list[str]) -> None:
+        """Проверяет, что сохранения откладываются и пишутся одним INSERT без повторных чтений."""
+        uow = UnitOfWork(session=session)
+        repository = BulkItemRepository(session)
+
+        async with uow.bulk():
+            for entity in make_entities(50):
+                await repository.save(entity)
+            assert statements == []
+
+        assert statements.count("INSERT") == 1
+        assert statements.count("SELECT") == 1
+        await uow.commit()
+        assert len((await session.execute(select(BulkItemModel))).scalars().all()) == 50
+
+    @pytest.mark.asyncio
+    async def test_updates_existing_rows(self, session: AsyncSession, statements: list[str]) -> None:
+        """Проверяет обновление существующих строк без SELECT на каждую сущность."""
+        entities = make_entities(10)
+        uow = UnitOfWork(session=session)
+        repository = BulkItemRepository(session)
+        async with uow.bulk():
+            for entity in entities:
+                await repository.save(entity)
+        await uow.commit()
+        session.expunge_all()
+        statements.clear()
+
+        async with uow.bulk():
+            for entity in entities:
+                await repository.save(entity.model_copy(update={"name": "renamed"}))
+
+        assert statements.count("SELECT") == 1
+        assert statements.count("INSERT") == 0
+        names = (await session.execute(select(BulkItemModel.name))).scalars().all()
+        assert set(names) == {"renamed"}
+
+    @pytest.mark.asyncio
+    async def test_refresh_loads_server_defaults(self, session: AsyncSession) -> None:
+        """Проверяет, что refresh=True перечитывает серверные значения по умолчанию."""
+        uow = UnitOfWork(session=session)
+        entity = make_entities(1)[0]
+
+        async with uow.bulk(refresh=True) as saved:
+            await BulkItemRepository(session).save(entity)
+
+        assert [item.id for item in saved] == [entity.id]
+        assert saved[0].created_at is not None
+
+    @pytest.mark.asyncio
+    async def test_saved_follows_call_order(self, session: AsyncSession) -> None:
+        """Проверяет, что результаты идут в порядке вызовов save(), а повтор получает итоговое состояние."""
+        uow = UnitOfWork(session=session)
+        repository = BulkItemRepository(session)
+        first, second, third = make_entities(3)
+
+        async with uow.bulk(refresh=True) as saved:
+            for entity in (third, first, second, first.model_copy(update={"name": "renamed"})):
+                await repository.save(entity)
+
+        assert [item.id for item in saved] == [third.id, first.id, second.id, first.id]
+        assert saved[1].name == saved[3].name == "renamed"
+
+    @pytest.mark.asyncio
+    async def test_error_discards_buffer(self, session: AsyncSession, statements: list[str]) -> None:
+        """Проверяет, что при ошибке в блоке ничего не записывается."""
+        uow = UnitOfWork(session=session)
+        repository = BulkItemRepository(session)
+
+        async def fail_inside_bulk() -> None:
+            async with uow.bulk():
+                await repository.save(make_entities(1)[0])
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await fail_inside_bulk()
+
+        assert statements == []
+        assert session.sync_session.autoflush is True
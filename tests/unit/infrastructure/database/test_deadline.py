@@ -0,0 +1,61 @@
+import asyncio
+import re
+
+import pytest
+from src.infrastructure.database.deadline import (
+    DeadlineExceededError,
+    remaining_time,
+    request_deadline,
+    statement_timeout_sql,
+)
+
+
+def timeout_ms(sql: str | None) -> int:
+    assert sql is not None
+    match = re.fullmatch(r"SET LOCAL statement_timeout = (\d+)", sql)
+    assert match is not None
+    return int(match.group(1))
+
+
+class TestRequestDeadline:
+    """Тесты срока выполнения запроса"""
+
+    def test_no_deadline(self) -> None:
+        """Проверяет, что без срока statement_timeout не выставляется."""
+        assert remaining_time() is None
+        assert statement_timeout_sql() is None
+
+    def test_statement_timeout_from_remaining_time(self) -> None:
+        """Проверяет, что statement_timeout равен оставшемуся сроку."""
+        with request_deadline(2.0):
+            assert 1900 < timeout_ms(statement_timeout_sql()) <= 2000
+
+        assert remaining_time() is None
+
+    def test_nested_deadline_cannot_extend_outer(self) -> None:
+        """Проверяет, что вложенный блок только сокращает срок."""
+        with request_deadline(1.0):
+            with request_deadline(10.0):
+                assert timeout_ms(statement_timeout_sql()) <= 1000
+            with request_deadline(0.5):
+                assert timeout_ms(statement_timeout_sql()) <= 500
+            with request_deadline(None):
+                assert timeout_ms(statement_timeout_sql()) <= 1000
+
+    def test_expired_deadline(self) -> None:
+        """Проверяет ошибку, если срок истек до начала транзакции."""
+        with request_deadline(0), pytest.raises(DeadlineExceededError):
+            statement_timeout_sql()
+
+    @pytest.mark.asyncio
+    async def test_deadline_propagates_to_tasks(self) -> None:
+        """Проверяет, что срок виден во вложенных задачах."""
+
+        async def read_remaining() -> float | None:  # noqa: RUF029
+            return remaining_time()
+
+        with request_deadline(5.0):
+            remaining = await asyncio.create_task(read_remaining())
+
+        assert remaining is not None
+        assert 0 < remaining <= 5.0
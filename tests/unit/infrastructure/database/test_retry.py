@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy.exc import DBAPIError
+from src.infrastructure.database.retry import DEADLOCK_DETECTED, SERIALIZATION_FAILURE, RetryPolicy, get_sqlstate
+
+
+class DriverError(Exception):
+    def __init__(self, sqlstate: str | None) -> None:
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+def db_error(sqlstate: str | None) -> DBAPIError:
+    return DBAPIError("COMMIT", {}, DriverError(sqlstate))
+
+
+class TestRetryPolicy:
+    """Тесты политики повтора транзакций"""
+
+    def test_get_sqlstate(self) -> None:
+        """Проверяет извлечение SQLSTATE из ошибки драйвера."""
+        assert get_sqlstate(db_error(SERIALIZATION_FAILURE)) == SERIALIZATION_FAILURE
+
+    @pytest.mark.parametrize(
+        ("exc", "expected"),
+        [
+            (db_error(SERIALIZATION_FAILURE), True),
+            (db_error(DEADLOCK_DETECTED), True),
+            (db_error("23505"), False),
+            (db_error(None), False),
+            (RuntimeError("boom"), False),
+        ],
+    )
+    def test_is_retryable(self, exc: BaseException, expected: bool) -> None:
+        """Проверяет, что повторяются только ошибки сериализации и взаимоблокировки."""
+        assert RetryPolicy().is_retryable(exc) is expected
+
+    def test_delay_is_bounded(self) -> None:
+        """Проверяет, что задержка растет экспоненциально и ограничена max_delay."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+
+        assert all(0 <= policy.delay(1) <= 0.1 for _ in range(100))
+        assert all(0 <= policy.delay(10) <= 0.3 for _ in range(100))
+
+    def test_max_attempts_must_be_positive(self) -> None:
+        """Проверяет валидацию количества попыток."""
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
@@ -0,0 +1,183 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from dishka import make_async_container
+from sqlalchemy import String, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+from src.di.database import DBConfig, DBProvider
+from src.di.events import EventBusConfig, EventBusProvider
+from src.di.outbox import OutboxConfig, OutboxProvider
+from src.domain.common.entity import Entity, UuidEntityId
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.repositories.base import BaseRepository
+from src.infrastructure.database.repositories.mixins import GetManyByIdMethodMixin, SaveMethodMixin
+from src.infrastructure.database.sharding import (
+    ShardedReader,
+    ShardedUnitOfWorkFactory,
+    ShardRouter,
+    shard_index,
+)
+from src.infrastructure.database.telemetry import PoolTelemetry
+from src.infrastructure.unit_of_work import UnitOfWork
+
+pytest.importorskip("aiosqlite")
+
+SHARDS = 3
+
+
+class ShardItemModel(Base):
+    """Тестовая модель, распределенная по шардам."""
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+
+
+class ShardItemEntity(Entity):
+    """Тестовая сущность."""
+
+    id: UuidEntityId
+    name: str
+
+
+class ShardItemRepository(
+    BaseRepository[ShardItemModel, ShardItemEntity],
+    SaveMethodMixin[ShardItemEntity],
+    GetManyByIdMethodMixin[ShardItemEntity, UuidEntityId],
+):
+    """Тестовый репозиторий."""
+
+    def entity_to_model(self, value: ShardItemEntity) -> ShardItemModel:
+        return ShardItemModel(id=value.id.value, name=value.name)
+
+
+@pytest_asyncio.fixture
+async def router(tmp_path: Path) -> AsyncIterator[ShardRouter]:
+    """Создает по SQLite БД на каждый шард."""
+    engines: list[AsyncEngine] = []
+    for shard in range(SHARDS):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'shard{shard}.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(ShardItemModel.__table__.create)
+        engines.append(engine)
+    yield ShardRouter(engines)
+    for engine in engines:
+        await engine.dispose()
+
+
+async def count_rows(engine: AsyncEngine) -> int:
+    async with AsyncSession(engine) as session:
+        return await session.scalar(select(func.count()).select_from(ShardItemModel))
+
+
+class TestShardIndex:
+    """Тесты выбора шарда по ключу"""
+
+    def test_same_shard_for_id_forms(self) -> None:
+        """Проверяет, что UuidEntityId, UUID и строка с ним попадают на один шард."""
+        value = uuid4()
+
+        assert shard_index(UuidEntityId(value), SHARDS) == shard_index(value, SHARDS) == shard_index(str(value), SHARDS)
+
+    def test_distribution(self) -> None:
+        """Проверяет равномерное распределение случайных UUID."""
+        counts = [0] * SHARDS
+        for _ in range(3000):
+            counts[shard_index(uuid4(), SHARDS)] += 1
+
+        assert all(800 < count < 1200 for count in counts)
+
+    def test_tenant_key(self) -> None:
+        """Проверяет стабильный шард для строкового ключа арендатора."""
+        assert shard_index("tenant-42", SHARDS) == shard_index("tenant-42", SHARDS)
+
+    def test_requires_engines(self) -> None:
+        """Проверяет, что маршрутизатор без шардов не создается."""
+        with pytest.raises(ValueError, match="At least one shard"):
+            ShardRouter([])
+
+    @pytest.mark.asyncio
+    async def test_provider_disposes_shard_engines(self, tmp_path: Path) -> None:
+        """Проверяет, что контейнер при закрытии освобождает пулы шардов."""
+        config = DBConfig(
+            url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+            shard_urls=[f"sqlite+aiosqlite:///{tmp_path / 'shard1.db'}"],
+        )
+        container = make_async_container(
+            DBProvider(config),
+            EventBusProvider(EventBusConfig()),
+            OutboxProvider(OutboxConfig()),
+        )
+        router = await container.get(ShardRouter)
+        shard_engine = router.engines[1]
+        async with shard_engine.connect():
+            pass
+        assert shard_engine.pool.checkedin() == 1
+
+        await container.close()
+
+        assert shard_engine.pool.checkedin() == 0
+
+    @pytest.mark.asyncio
+    async def test_telemetry_covers_every_shard(self, tmp_path: Path) -> None:
+        """Проверяет, что телеметрия пула считает выдачи и размеры всех шардов."""
+        config = DBConfig(
+            url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+            shard_urls=[f"sqlite+aiosqlite:///{tmp_path / 'shard1.db'}"],
+        )
+        container = make_async_container(
+            DBProvider(config),
+            EventBusProvider(EventBusConfig()),
+            OutboxProvider(OutboxConfig()),
+        )
+        router = await container.get(ShardRouter)
+        telemetry = await container.get(PoolTelemetry)
+        for engine in router.engines:
+            async with engine.connect():
+                pass
+
+        stats = telemetry.snapshot()
+        await container.close()
+
+        assert stats.checkouts == 2
+        assert stats.size == sum(engine.pool.size() for engine in router.engines)
+
+
+class TestShardedWrites:
+    """Тесты записи и чтения через шарды"""
+
+    @pytest.mark.asyncio
+    async def test_unit_of_work_writes_to_owning_shard(self, router: ShardRouter) -> None:
+        """Проверяет, что UoW шарда пишет только в шард, которому принадлежит id."""
+        factory = ShardedUnitOfWorkFactory(router, lambda session: UnitOfWork(session=session))
+        entities = [ShardItemEntity(id=UuidEntityId(), name=f"item-{i}") for i in range(30)]
+
+        for entity in entities:
+            async with factory.for_key(entity.id) as uow:
+                await ShardItemRepository(uow._session).save(entity)
+                await uow.commit()
+
+        expected = [0] * SHARDS
+        for entity in entities:
+            expected[router.shard_for(entity.id)] += 1
+        assert [await count_rows(engine) for engine in router.engines] == expected
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_id_scatters_across_shards(self, router: ShardRouter) -> None:
+        """Проверяет, что get_many_by_id собирает сущности со всех шардов."""
+        items = [ShardItemEntity(id=UuidEntityId(), name=f"item-{i}") for i in range(30)]
+        entities = {entity.id: entity for entity in items}
+        for shard, ids in router.group(entities).items():
+            async with router.session(shard) as session:
+                session.add_all(ShardItemModel(id=key.value, name=entities[key].name) for key in ids)
+                await session.commit()
+        reader = ShardedReader(router, ShardItemRepository)
+
+        found = await reader.get_many_by_id([*entities, UuidEntityId()])
+
+        assert {entity.id for entity in found} == set(entities)
+        assert await reader.get_by_id(items[0].id) == items[0]
+        assert await reader.get_by_id(UuidEntityId()) is None
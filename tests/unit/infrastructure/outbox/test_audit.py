@@ -0,0 +1,148 @@
+from collections.abc import Iterator
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import String, create_engine, event
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from src.application.common.value_objects import EventType
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.outbox.audit import AuditCapture, AuditLogCollector, AuditRule
+
+
+class AuditedOrderModel(Base):
+    """Тестовая модель заказа для аудита."""
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    status: Mapped[str] = mapped_column(String(20))
+    total: Mapped[int] = mapped_column(default=0)
+    secret: Mapped[str | None] = mapped_column(String(20), nullable=True)
+
+
+class AuditedNoteModel(Base):
+    """Тестовая модель без правила аудита."""
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    text: Mapped[str] = mapped_column(String(20))
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Создает сессию над in-memory SQLite."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[AuditedOrderModel.__table__, AuditedNoteModel.__table__])
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def collector(session: Session) -> Iterator[AuditLogCollector]:
+    """Создает коллектор аудита, подключенный к сессии."""
+    collector = AuditLogCollector(AuditCapture(models={AuditedOrderModel: AuditRule(exclude={"secret"})}))
+    collector.attach(session)
+    yield collector
+    collector.detach(session)
+
+
+class TestAuditLogCollector:
+    """Тесты для AuditLogCollector"""
+
+    def test_create_includes_defaults_and_id(self, session: Session, collector: AuditLogCollector):
+        """Проверяет аудит создания сущности."""
+        order = AuditedOrderModel(status="new", secret="s")
+        session.add(order)
+        session.flush()
+
+        [audit_event] = collector.drain()
+
+        assert audit_event.event_type == EventType.AUDIT_LOG
+        assert audit_event.payload["entity_type"] == "AuditedOrderModel"
+        assert audit_event.payload["entity_id"] == str(order.id)
+        assert audit_event.payload["operation"] == "create"
+        assert audit_event.payload["changes"] == {
+            "id": {"old": None, "new": order.id},
+            "status": {"old": None, "new": "new"},
+            "total": {"old": None, "new": 0},
+        }
+
+    def test_update_uses_attribute_history_without_select(self, session: Session, collector: AuditLogCollector):
+        """Проверяет, что diff строится из истории атрибутов без SELECT."""
+        order = AuditedOrderModel(status="new", total=10)
+        session.add(order)
+        session.flush()
+        collector.drain()
+
+        statements: list[str] = []
+        event.listen(session.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        order.status = "paid"
+        order.total = 20
+        order.secret = "hidden"
+        session.flush()
+
+        [audit_event] = collector.drain()
+        assert audit_event.payload["operation"] == "update"
+        assert audit_event.payload["changes"] == {
+            "status": {"old": "new", "new": "paid"},
+            "total": {"old": 10, "new": 20},
+        }
+        assert not [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
+
+    def test_changes_across_flushes_are_batched(self, session: Session, collector: AuditLogCollector):
+        """Проверяет объединение изменений одной сущности за транзакцию."""
+        order = AuditedOrderModel(status="new")
+        session.add(order)
+        session.flush()
+        order.status = "pending"
+        session.flush()
+        order.status = "paid"
+        session.flush()
+
+        [audit_event] = collector.drain()
+
+        assert audit_event.payload["operation"] == "create"
+        assert audit_event.payload["changes"]["status"] == {"old": None, "new": "paid"}
+
+    def test_delete(self, session: Session, collector: AuditLogCollector):
+        """Проверяет аудит удаления сущности."""
+        order = AuditedOrderModel(status="new")
+        session.add(order)
+        session.flush()
+        collector.drain()
+
+        session.delete(order)
+        session.flush()
+
+        [audit_event] = collector.drain()
+        assert audit_event.payload["operation"] == "delete"
+        assert audit_event.payload["entity_id"] == str(order.id)
+        assert audit_event.payload["changes"]["status"] == {"old": "new", "new": None}
+
+    def test_models_without_rule_are_skipped(self, session: Session, collector: AuditLogCollector):
+        """Проверяет, что модели без правила не аудируются."""
+        session.add(AuditedNoteModel(text="note"))
+        session.flush()
+
+        assert collector.drain() == []
+
+    def test_include_list(self, session: Session):
+        """Проверяет список включаемых полей."""
+        collector = AuditLogCollector(
+            AuditCapture(default_rule=AuditRule(include={"text"}, entity_type="Note")),
+        )
+        collector.attach(session)
+        session.add(AuditedNoteModel(text="note"))
+        session.flush()
+
+        [audit_event] = collector.drain()
+
+        assert audit_event.payload["entity_type"] == "Note"
+        assert audit_event.payload["changes"] == {"text": {"old": None, "new": "note"}}
+
+    def test_clear_drops_collected_changes(self, session: Session, collector: AuditLogCollector):
+        """Проверяет сброс изменений при откате."""
+        session.add(AuditedOrderModel(status="new"))
+        session.flush()
+
+        collector.clear()
+
+        assert collector.drain() == []
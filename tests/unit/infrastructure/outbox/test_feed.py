@@ -0,0 +1,249 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from src.application.common.value_objects import EventType, OutboxEvent
+from src.infrastructure.database.deadline import remaining_time, request_deadline
+from src.infrastructure.database.models.outbox import OutboxRecord
+from src.infrastructure.outbox.feed import (
+    FeedEvent,
+    InvalidResumeTokenError,
+    OutboxFeed,
+    ShardedOutboxFeed,
+    parse_resume_token,
+)
+from src.infrastructure.outbox.serializers import EventSerializer
+from src.infrastructure.outbox.writer import OutboxWriter
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """Создает SQLite БД с таблицей outbox."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(OutboxRecord.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def feed(engine: AsyncEngine) -> AsyncIterator[OutboxFeed]:
+    """Создает ленту с быстрым опросом."""
+    feed = OutboxFeed(engine=engine, serializer=EventSerializer(), poll_interval=0.01, heartbeat_interval=0.05)
+    yield feed
+    await feed.close()
+
+
+async def write_events(engine: AsyncEngine, *events: OutboxEvent) -> None:
+    async with AsyncSession(engine) as session:
+        await OutboxWriter(EventSerializer()).write(session, list(events))
+        await session.commit()
+
+
+def notification(title: str) -> OutboxEvent:
+    return OutboxEvent.create_notification(user_id="u1", title=title, message="m")
+
+
+async def take(stream: AsyncIterator[FeedEvent | None], count: int) -> list[FeedEvent]:
+    items: list[FeedEvent] = []
+    async with asyncio.timeout(2):
+        async for item in stream:
+            if item is not None:
+                items.append(item)
+            if len(items) == count:
+                return items
+    return items
+
+
+class TestParseResumeToken:
+    """Тесты разбора resume token"""
+
+    def test_empty_token(self) -> None:
+        """Проверяет, что пустой токен означает чтение только новых событий."""
+        assert parse_resume_token(None) is None
+        assert parse_resume_token("") is None
+
+    def test_valid_token(self) -> None:
+        """Проверяет разбор корректного токена."""
+        assert parse_resume_token("42") == 42
+
+    @pytest.mark.parametrize("token", ["abc", "-1", "1.5"])
+    def test_invalid_token(self, token: str) -> None:
+        """Проверяет ошибку для некорректного токена."""
+        with pytest.raises(InvalidResumeTokenError):
+            parse_resume_token(token)
+
+
+class TestOutboxFeed:
+    """Тесты ленты событий outbox"""
+
+    @pytest.mark.asyncio
+    async def test_streams_new_events(self, engine: AsyncEngine, feed: OutboxFeed) -> None:
+        """Проверяет доставку событий, записанных после подписки."""
+        await write_events(engine, notification("old"))
+        stream = feed.subscribe()
+        reader = asyncio.create_task(take(stream, 2))
+        await asyncio.sleep(0.05)
+
+        await write_events(engine, notification("a"), notification("b"))
+
+        items = await reader
+        assert [item.event.payload["title"] for item in items] == ["a", "b"]
+        assert items[0].position < items[1].position
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_feed_task_does_not_inherit_request_context(self, feed: OutboxFeed) -> None:
+        """Проверяет, что задача ленты, запущенная первым подписчиком, не получает срок его запроса."""
+        with request_deadline(5):
+            stream = feed.subscribe()
+            reader = asyncio.create_task(take(stream, 1))
+            await asyncio.sleep(0.02)
+
+        assert feed._task.get_context().run(remaining_time) is None
+        reader.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await reader
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_resume_backfills_missed_events(self, engine: AsyncEngine, feed: OutboxFeed) -> None:
+        """Проверяет догрузку пропущенных событий по resume token."""
+        first, second, third = notification("1"), notification("2"), notification("3")
+        await write_events(engine, first, second, third)
+
+        stream = feed.subscribe(after=1)
+        items = await take(stream, 2)
+
+        assert [item.event.id for item in items] == [second.id, third.id]
+        assert [item.resume_token for item in items] == ["2", "3"]
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_filters_by_event_type_and_resource(self, engine: AsyncEngine, feed: OutboxFeed) -> None:
+        """Проверяет фильтрацию по типу события и ресурсу при догрузке."""
+        await write_events(
+            engine,
+            notification("skip"),
+            OutboxEvent.create_audit_log(entity_type="User", entity_id="1", operation="create"),
+            OutboxEvent.create_audit_log(entity_type="Order", entity_id="2", operation="create"),
+        )
+
+        stream = feed.subscribe(event_types=[EventType.AUDIT_LOG], resources=["Order"], after=0)
+        items = await take(stream, 1)
+
+        assert items[0].event.payload["entity_id"] == "2"
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_when_idle(self, feed: OutboxFeed) -> None:
+        """Проверяет, что без событий лента отдает heartbeat."""
+        stream = feed.subscribe()
+
+        async with asyncio.timeout(1):
+            item = await anext(stream)
+
+        assert item is None
+        await stream.aclose()
+
+    def test_cursor_waits_for_gap(self, engine: AsyncEngine) -> None:
+        """Проверяет, что курсор не перескакивает незакоммиченную позицию до gap_timeout."""
+        feed = OutboxFeed(engine=engine, serializer=EventSerializer(), gap_timeout=60)
+        feed._cursor = 1
+        feed._seen = {3}
+
+        feed._advance_cursor()
+        assert feed._cursor == 1
+
+        feed._gap_timeout = 0
+        feed._advance_cursor()
+        assert feed._cursor == 3
+        assert feed._seen == set()
+
+
+@pytest_asyncio.fixture
+async def shard_engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """Создает вторую SQLite БД с таблицей outbox."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'outbox-shard.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(OutboxRecord.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def sharded_feed(engine: AsyncEngine, shard_engine: AsyncEngine) -> AsyncIterator[ShardedOutboxFeed]:
+    """Создает ленту по двум шардам с быстрым опросом."""
+    feed = ShardedOutboxFeed(
+        [
+            OutboxFeed(engine=shard, serializer=EventSerializer(), poll_interval=0.01, heartbeat_interval=0.05)
+            for shard in (engine, shard_engine)
+        ],
+        heartbeat_interval=0.05,
+    )
+    yield feed
+    await feed.close()
+
+
+class TestShardedOutboxFeed:
+    """Тесты ленты событий outbox по нескольким шардам"""
+
+    def test_parse_resume_token(self, sharded_feed: ShardedOutboxFeed) -> None:
+        """Проверяет, что токен содержит позицию каждого шарда."""
+        assert sharded_feed.parse_resume_token(None) is None
+        assert sharded_feed.parse_resume_token("3.7") == (3, 7)
+        for token in ("3", "3.7.1", "3.", "a.1"):
+            with pytest.raises(InvalidResumeTokenError):
+                sharded_feed.parse_resume_token(token)
+
+    @pytest.mark.asyncio
+    async def test_streams_events_from_every_shard(
+        self, engine: AsyncEngine, shard_engine: AsyncEngine, sharded_feed: ShardedOutboxFeed
+    ) -> None:
+        """Проверяет доставку событий, записанных в разные шарды, с общим resume token."""
+        await write_events(shard_engine, notification("old"))
+        stream = sharded_feed.subscribe()
+        reader = asyncio.create_task(take(stream, 2))
+        await asyncio.sleep(0.05)
+
+        await write_events(engine, notification("primary"))
+        await asyncio.sleep(0.05)
+        await write_events(shard_engine, notification("shard"))
+
+        items = await reader
+        assert [item.event.payload["title"] for item in items] == ["primary", "shard"]
+        assert [item.resume_token for item in items] == ["1.1", "1.2"]
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_resume_backfills_every_shard(
+        self, engine: AsyncEngine, shard_engine: AsyncEngine, sharded_feed: ShardedOutboxFeed
+    ) -> None:
+        """Проверяет догрузку пропущенных событий каждого шарда по его позиции в токене."""
+        await write_events(engine, notification("p1"), notification("p2"))
+        await write_events(shard_engine, notification("s1"), notification("s2"))
+
+        stream = sharded_feed.subscribe(after=(1, 2))
+        items = await take(stream, 1)
+
+        assert [item.event.payload["title"] for item in items] == ["p2"]
+        assert items[0].resume_token == "2.2"
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_single_shard_keeps_plain_token(self, engine: AsyncEngine, feed: OutboxFeed) -> None:
+        """Проверяет, что с одной БД токены совпадают с токенами OutboxFeed."""
+        sharded = ShardedOutboxFeed([feed])
+        await write_events(engine, notification("1"), notification("2"))
+
+        stream = sharded.subscribe(after=sharded.parse_resume_token("1"))
+        items = await take(stream, 1)
+
+        assert [item.resume_token for item in items] == ["2"]
+        await stream.aclose()
@@ -0,0 +1,117 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from src.application.common.value_objects import EventId, EventType, OutboxEvent
+from src.domain.common.entity import UuidEntityId
+from src.infrastructure.outbox.serializers import (
+    FORMAT_VERSION,
+    Codec,
+    Compression,
+    EventSerializationError,
+    EventSerializer,
+)
+
+
+@pytest.fixture
+def audit_event() -> OutboxEvent:
+    """Создает событие аудит лога."""
+    return OutboxEvent.create_audit_log(
+        entity_type="Order",
+        entity_id="order-456",
+        operation="update",
+        user_id="user-123",
+        changes={"status": {"old": "pending", "new": "paid"}},
+        metadata={"ip": "192.168.1.1"},
+    )
+
+
+class TestEventSerializer:
+    """Тесты для EventSerializer"""
+
+    def test_roundtrip_orjson(self, audit_event: OutboxEvent):
+        """Тест сериализации и десериализации через orjson"""
+        serializer = EventSerializer()
+
+        data = serializer.serialize(audit_event)
+        restored = serializer.deserialize(data)
+
+        assert restored == audit_event
+        assert isinstance(restored.id, EventId)
+        assert restored.event_type is EventType.AUDIT_LOG
+
+    def test_header_contains_version_and_codec(self, audit_event: OutboxEvent):
+        """Тест заголовка с версией формата, кодеком и сжатием"""
+        data = EventSerializer().serialize(audit_event)
+
+        assert data[0] == FORMAT_VERSION
+        assert data[1] == Codec.ORJSON
+        assert data[2] == Compression.NONE
+
+    def test_roundtrip_msgpack(self, audit_event: OutboxEvent):
+        """Тест сериализации через msgpack"""
+        pytest.importorskip("msgpack")
+        serializer = EventSerializer(codec=Codec.MSGPACK)
+
+        data = serializer.serialize(audit_event)
+
+        assert data[1] == Codec.MSGPACK
+        assert serializer.deserialize(data) == audit_event
+
+    def test_large_payload_is_compressed(self):
+        """Тест сжатия событий больше порога"""
+        event = OutboxEvent.create_message(to="user@example.com", send_type="email", body="x" * 4096)
+        serializer = EventSerializer(compression_threshold=1024)
+
+        data = serializer.serialize(event)
+
+        assert data[2] == Compression.ZSTD
+        assert len(data) < 1024
+        assert serializer.deserialize(data) == event
+
+    def test_compression_can_be_disabled(self):
+        """Тест отключения сжатия"""
+        event = OutboxEvent.create_message(to="user@example.com", send_type="email", body="x" * 4096)
+
+        data = EventSerializer(compression_threshold=None).serialize(event)
+
+        assert data[2] == Compression.NONE
+
+    def test_reads_events_written_with_other_settings(self, audit_event: OutboxEvent):
+        """Тест чтения событий, записанных другим кодеком и со сжатием"""
+        pytest.importorskip("msgpack")
+        writer = EventSerializer(codec=Codec.MSGPACK, compression_threshold=0)
+        reader = EventSerializer()
+
+        assert reader.deserialize(writer.serialize(audit_event)) == audit_event
+
+    def test_non_json_values_in_payload(self):
+        """Тест сериализации UUID, EntityId и datetime в payload"""
+        created_at = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+        entity_id = UuidEntityId(uuid4())
+        event = OutboxEvent.create(
+            event_type=EventType.CUSTOM,
+            payload={"entity_id": entity_id, "created_at": created_at, "tags": {"a"}},
+        )
+        serializer = EventSerializer()
+
+        restored = serializer.deserialize(serializer.serialize(event))
+
+        assert restored.payload == {
+            "entity_id": str(entity_id),
+            "created_at": created_at.isoformat(),
+            "tags": ["a"],
+        }
+
+    def test_unsupported_version(self, audit_event: OutboxEvent):
+        """Тест ошибки при неизвестной версии формата"""
+        data = bytearray(EventSerializer().serialize(audit_event))
+        data[0] = FORMAT_VERSION + 1
+
+        with pytest.raises(EventSerializationError):
+            EventSerializer().deserialize(bytes(data))
+
+    def test_truncated_data(self):
+        """Тест ошибки при слишком коротких данных"""
+        with pytest.raises(EventSerializationError):
+            EventSerializer().deserialize(b"\x01")
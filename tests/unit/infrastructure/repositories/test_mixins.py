@@ -172,6 +172,7 @@ class DocumentRepository(
 def mock_session() -> AsyncMock:
     """Создает mock для AsyncSession."""
     session = AsyncMock(spec=AsyncSession)
+    session.info = {}
     session.merge = AsyncMock()
     session.flush = AsyncMock()
     session.refresh = AsyncMock()
@@ -0,0 +1,93 @@
+import dataclasses
+import time
+
+import pytest
+from src.application.common.cache import CacheEntry
+from src.infrastructure.cache import InMemoryCache, RedisCache, decode_entry, encode_entry
+
+
+def make_entry(body: bytes = b"{}", ttl: float = 10.0, stale_ttl: float = 0.0, age: float = 0.0) -> CacheEntry:
+    return CacheEntry(
+        body=body,
+        status_code=200,
+        headers=(("content-type", "application/json"),),
+        created_at=time.time() - age,
+        ttl=ttl,
+        stale_ttl=stale_ttl,
+    )
+
+
+class FakeRedis:
+    """Минимальный клиент Redis в памяти: get/set с PX/delete."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.expires: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, px: int) -> None:
+        self.values[key] = value
+        self.expires[key] = px
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+
+class TestInMemoryCache:
+    """Тесты LRU-кеша ответов в памяти"""
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        """Проверяет вытеснение давно не читанной записи при переполнении."""
+        cache = InMemoryCache(max_entries=2)
+        await cache.set("a", make_entry(b"a"))
+        await cache.set("b", make_entry(b"b"))
+        await cache.get("a")
+        await cache.set("c", make_entry(b"c"))
+
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).body == b"a"
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_keeps_stale_entries_until_stale_ttl(self) -> None:
+        """Проверяет, что устаревшая запись отдается до конца stale_ttl и затем удаляется."""
+        cache = InMemoryCache()
+        await cache.set("stale", make_entry(ttl=1, stale_ttl=10, age=5))
+        await cache.set("expired", make_entry(ttl=1, stale_ttl=1, age=5))
+
+        stale = await cache.get("stale")
+
+        assert stale is not None
+        assert not stale.is_fresh(time.time())
+        assert await cache.get("expired") is None
+        assert len(cache) == 1
+
+
+class TestRedisCache:
+    """Тесты кеша ответов в Redis"""
+
+    def test_entry_roundtrip(self) -> None:
+        """Проверяет кодирование записи в bytes и обратно."""
+        entry = make_entry(b'{"items": []}', stale_ttl=5)
+        with_headers = dataclasses.replace(entry, headers=(("etag", 'W/"1"'), ("link", "<a>"), ("link", "<b>")))
+        without_headers = dataclasses.replace(entry, headers=())
+
+        assert decode_entry(encode_entry(entry)) == entry
+        assert decode_entry(encode_entry(with_headers)) == with_headers
+        assert decode_entry(encode_entry(without_headers)) == without_headers
+
+    @pytest.mark.asyncio
+    async def test_stores_until_stale_ttl(self) -> None:
+        """Проверяет префикс ключа и срок хранения до конца stale_ttl."""
+        client = FakeRedis()
+        cache = RedisCache(client, key_prefix="test")
+
+        await cache.set("key", make_entry(ttl=10, stale_ttl=20))
+
+        assert (await cache.get("key")).body == b"{}"
+        assert 29_000 < client.expires["test:v2:key"] <= 30_000
+        await cache.delete("key")
+        assert await cache.get("key") is None
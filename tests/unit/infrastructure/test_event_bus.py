@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+from src.application.common.value_objects import EventType, OutboxEvent
+from src.infrastructure.database.deadline import remaining_time, request_deadline
+from src.infrastructure.event_bus import InProcessEventBus, OverflowPolicy
+
+
+def make_notification(index: int = 0) -> OutboxEvent:
+    return OutboxEvent.create_notification(user_id=f"user-{index}", title="t", message="m")
+
+
+class TestInProcessEventBus:
+    """Тесты для InProcessEventBus"""
+
+    @pytest.mark.asyncio
+    async def test_delivers_events_by_type(self) -> None:
+        """Проверяет доставку событий только подписчикам нужного типа."""
+        bus = InProcessEventBus()
+        notifications: list[OutboxEvent] = []
+        audit_logs: list[OutboxEvent] = []
+
+        async def on_notification(event: OutboxEvent) -> None:  # noqa: RUF029
+            notifications.append(event)
+
+        async def on_audit_log(event: OutboxEvent) -> None:  # noqa: RUF029
+            audit_logs.append(event)
+
+        bus.subscribe(EventType.NOTIFICATION, on_notification)
+        bus.subscribe([EventType.AUDIT_LOG, EventType.CUSTOM], on_audit_log)
+        notification = make_notification()
+        audit_log = OutboxEvent.create_audit_log(entity_type="Order", entity_id="1", operation="update")
+
+        await bus.publish([notification, audit_log])
+        await bus.join()
+
+        assert notifications == [notification]
+        assert audit_logs == [audit_log]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_subscriber_does_not_inherit_request_context(self) -> None:
+        """Проверяет, что обработчик, запущенный первым publish, не получает срок запроса."""
+        bus = InProcessEventBus()
+        remaining: list[float | None] = []
+
+        async def handler(event: OutboxEvent) -> None:  # noqa: RUF029
+            remaining.append(remaining_time())
+
+        bus.subscribe(EventType.NOTIFICATION, handler)
+        with request_deadline(5):
+            await bus.publish([make_notification()])
+        await bus.join()
+
+        assert remaining == [None]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_subscriber_failure_is_isolated(self) -> None:
+        """Проверяет, что ошибка подписчика не мешает остальным и publish."""
+        bus = InProcessEventBus()
+        received: list[OutboxEvent] = []
+
+        async def failing(event: OutboxEvent) -> None:  # noqa: RUF029
+            raise RuntimeError("boom")
+
+        async def healthy(event: OutboxEvent) -> None:  # noqa: RUF029
+            received.append(event)
+
+        bus.subscribe(EventType.NOTIFICATION, failing)
+        bus.subscribe(EventType.NOTIFICATION, healthy)
+        events = [make_notification(i) for i in range(3)]
+
+        await bus.publish(events)
+        await bus.join()
+
+        assert received == events
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_when_queue_is_full(self) -> None:
+        """Проверяет отбрасывание новых событий при переполнении очереди."""
+        bus = InProcessEventBus(queue_size=2, overflow=OverflowPolicy.DROP_NEWEST)
+        release = asyncio.Event()
+        received: list[OutboxEvent] = []
+
+        async def slow(event: OutboxEvent) -> None:
+            await release.wait()
+            received.append(event)
+
+        bus.subscribe(EventType.NOTIFICATION, slow)
+        events = [make_notification(i) for i in range(5)]
+
+        await bus.publish(events[:1])
+        await asyncio.sleep(0)  # обработчик забирает первое событие и ждет
+        await bus.publish(events[1:])
+        release.set()
+        await bus.join()
+
+        assert received == events[:3]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_when_queue_is_full(self) -> None:
+        """Проверяет вытеснение старых событий при переполнении очереди."""
+        bus = InProcessEventBus(queue_size=2, overflow=OverflowPolicy.DROP_OLDEST)
+        release = asyncio.Event()
+        received: list[OutboxEvent] = []
+
+        async def slow(event: OutboxEvent) -> None:
+            await release.wait()
+            received.append(event)
+
+        bus.subscribe(EventType.NOTIFICATION, slow)
+        events = [make_notification(i) for i in range(5)]
+
+        await bus.publish(events[:1])
+        await asyncio.sleep(0)
+        await bus.publish(events[1:])
+        release.set()
+        await bus.join()
+
+        assert received == [events[0], events[3], events[4]]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_room_with_timeout(self) -> None:
+        """Проверяет ограниченное ожидание места в очереди."""
+        bus = InProcessEventBus(queue_size=1, publish_timeout=0.01)
+        release = asyncio.Event()
+
+        async def stuck(event: OutboxEvent) -> None:
+            await release.wait()
+
+        bus.subscribe(EventType.NOTIFICATION, stuck)
+
+        await bus.publish([make_notification(0)])
+        await asyncio.sleep(0)
+        await asyncio.wait_for(bus.publish([make_notification(i) for i in range(1, 4)]), timeout=1)
+
+        assert bus._subscriptions[0].dropped == 2
+        release.set()
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self) -> None:
+        """Проверяет отписку обработчика."""
+        bus = InProcessEventBus()
+        received: list[OutboxEvent] = []
+
+        async def handler(event: OutboxEvent) -> None:  # noqa: RUF029
+            received.append(event)
+
+        unsubscribe = bus.subscribe(EventType.NOTIFICATION, handler)
+        unsubscribe()
+        await bus.publish([make_notification()])
+
+        assert received == []
+        await bus.close()
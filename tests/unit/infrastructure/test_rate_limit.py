@@ -0,0 +1,85 @@
+import os
+
+import pytest
+from src.infrastructure import rate_limit as rate_limit_module
+from src.infrastructure.rate_limit import InMemoryRateLimiter, RedisRateLimiter
+
+
+class Clock:
+    """Управляемые часы для time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", clock)
+    return clock
+
+
+class TestInMemoryRateLimiter:
+    """Тесты корзин токенов в памяти"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_refill(self, clock: Clock) -> None:
+        """Проверяет запас burst, отказ с retry_after и пополнение со скоростью rate."""
+        limiter = InMemoryRateLimiter()
+
+        allowed = [(await limiter.hit("client", rate=2, burst=3)).allowed for _ in range(4)]
+        rejected = await limiter.hit("client", rate=2, burst=3)
+        clock.now += 0.5
+        refilled = await limiter.hit("client", rate=2, burst=3)
+
+        assert allowed == [True, True, True, False]
+        assert rejected.retry_after == pytest.approx(0.5)
+        assert refilled.allowed
+        assert refilled.remaining == pytest.approx(0)
+
+    @pytest.mark.asyncio
+    async def test_cost_and_cap(self, clock: Clock) -> None:
+        """Проверяет списание cost токенов и то, что простой не копит токены сверх burst."""
+        limiter = InMemoryRateLimiter()
+        await limiter.hit("client", rate=1, burst=5, cost=5)
+        clock.now += 100
+
+        result = await limiter.hit("client", rate=1, burst=5, cost=2)
+
+        assert (result.allowed, result.remaining) == (True, 3)
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, clock: Clock) -> None:
+        """Проверяет ограничение числа корзин."""
+        limiter = InMemoryRateLimiter(max_keys=2)
+        for key in ("a", "b", "a", "c"):
+            await limiter.hit(key, rate=1, burst=1)
+
+        assert len(limiter) == 2
+        assert not (await limiter.hit("a", rate=1, burst=1)).allowed
+        assert (await limiter.hit("b", rate=1, burst=1)).allowed
+
+
+class TestRedisRateLimiter:
+    """Тесты корзин токенов в Redis; нужен REDIS_URL"""
+
+    @pytest.mark.asyncio
+    async def test_shared_bucket(self) -> None:
+        """Проверяет, что два лимитера делят одну корзину."""
+        pytest.importorskip("redis")
+        url = os.environ.get("REDIS_URL")
+        if not url:
+            pytest.skip("REDIS_URL is not set")
+        key = f"test:{os.urandom(8).hex()}"
+        first = RedisRateLimiter.from_url(url)
+        second = RedisRateLimiter.from_url(url)
+
+        results = [await limiter.hit(key, rate=0.1, burst=2) for limiter in (first, second, first)]
+        await first.close()
+        await second.close()
+
+        assert [result.allowed for result in results] == [True, True, False]
+        assert 0 < results[-1].retry_after <= 10
@@ -0,0 +1,387 @@
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import String, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+from src.application.common.event_coalescing import AuditLogCoalescingRule
+from src.application.common.unit_of_work import TransactionMode
+from src.application.common.value_objects import OutboxEvent
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.outbox import OutboxRecord
+from src.infrastructure.database.retry import SERIALIZATION_FAILURE, RetryPolicy
+from src.infrastructure.event_bus import InProcessEventBus
+from src.infrastructure.outbox.audit import AuditCapture, AuditRule
+from src.infrastructure.outbox.serializers import EventSerializer
+from src.infrastructure.outbox.writer import OutboxWriter
+from src.infrastructure.unit_of_work import ReadOnlyTransactionError, UnitOfWork, set_transaction_sql
+
+
+class UowAuditedItemModel(Base):
+    """Тестовая модель, аудируемая правилом по умолчанию."""
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(20))
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """Создает mock для AsyncSession."""
+    session = AsyncMock(spec=AsyncSession)
+    session.info = {}
+    return session
+
+
+@pytest.fixture
+def mock_event_bus() -> AsyncMock:
+    """Создает mock для шины событий."""
+    return AsyncMock(spec=InProcessEventBus)
+
+
+class TestRegisterEvent:
+    """Тесты регистрации событий в UnitOfWork"""
+
+    @pytest.mark.asyncio
+    async def test_events_without_key_are_not_deduplicated(self, mock_session: AsyncMock) -> None:
+        """Проверяет, что события без ключа идемпотентности не схлопываются."""
+        uow = UnitOfWork(session=mock_session)
+
+        await uow.register_event(OutboxEvent.create_notification(user_id="u1", title="t", message="m"))
+        await uow.register_event(OutboxEvent.create_notification(user_id="u1", title="t", message="m"))
+
+        assert len(uow._events) == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_idempotency_key_is_skipped(self, mock_session: AsyncMock) -> None:
+        """Проверяет дедупликацию по ключу идемпотентности."""
+        uow = UnitOfWork(session=mock_session)
+        first = OutboxEvent.create_notification(user_id="u1", title="t", message="m", idempotency_key="k1")
+        second = OutboxEvent.create_notification(user_id="u1", title="t2", message="m2", idempotency_key="k1")
+
+        await uow.register_event(first)
+        await uow.register_event(second)
+
+        assert uow._events == [first]
+
+    @pytest.mark.asyncio
+    async def test_rollback_resets_idempotency_keys(self, mock_session: AsyncMock) -> None:
+        """Проверяет, что после отката ключ можно зарегистрировать снова."""
+        uow = UnitOfWork(session=mock_session)
+        event = OutboxEvent.create_notification(user_id="u1", title="t", message="m", idempotency_key="k1")
+
+        await uow.register_event(event)
+        await uow.rollback()
+        await uow.register_event(event)
+
+        assert uow._events == [event]
+
+    @pytest.mark.asyncio
+    async def test_commit_coalesces_events(self, mock_session: AsyncMock, mock_event_bus: AsyncMock) -> None:
+        """Проверяет объединение событий перед коммитом."""
+        uow = UnitOfWork(
+            session=mock_session,
+            coalescing_rules=[AuditLogCoalescingRule()],
+            event_bus=mock_event_bus,
+        )
+        for value in range(3):
+            await uow.register_event(
+                OutboxEvent.create_audit_log(
+                    entity_type="Order",
+                    entity_id="order-1",
+                    operation="update",
+                    changes={"total": {"old": value, "new": value + 1}},
+                )
+            )
+
+        await uow.commit()
+
+        mock_session.commit.assert_awaited_once()
+        [published] = mock_event_bus.publish.await_args.args[0]
+        assert published.payload["changes"] == {"total": {"old": 0, "new": 3}}
+
+
+class TestEventBusPublishing:
+    """Тесты публикации событий в шину после коммита"""
+
+    @pytest.mark.asyncio
+    async def test_publishes_after_commit(self, mock_session: AsyncMock, mock_event_bus: AsyncMock) -> None:
+        """Проверяет публикацию зарегистрированных событий после коммита."""
+        calls: list[str] = []
+        mock_session.commit.side_effect = lambda: calls.append("commit")
+        mock_event_bus.publish.side_effect = lambda events: calls.append("publish")
+        uow = UnitOfWork(session=mock_session, event_bus=mock_event_bus)
+        event = OutboxEvent.create_notification(user_id="u1", title="t", message="m")
+
+        await uow.register_event(event)
+        await uow.commit()
+
+        assert calls == ["commit", "publish"]
+        mock_event_bus.publish.assert_awaited_once_with([event])
+        assert uow._events == []
+
+    @pytest.mark.asyncio
+    async def test_never_publishes_after_rollback(self, mock_session: AsyncMock, mock_event_bus: AsyncMock) -> None:
+        """Проверяет, что после отката события не публикуются."""
+        async with UnitOfWork(session=mock_session, event_bus=mock_event_bus) as uow:
+            await uow.register_event(OutboxEvent.create_notification(user_id="u1", title="t", message="m"))
+
+        mock_event_bus.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_does_not_publish(self, mock_session: AsyncMock, mock_event_bus: AsyncMock) -> None:
+        """Проверяет, что при ошибке коммита события не публикуются."""
+        mock_session.commit.side_effect = RuntimeError("db is down")
+        uow = UnitOfWork(session=mock_session, event_bus=mock_event_bus)
+        await uow.register_event(OutboxEvent.create_notification(user_id="u1", title="t", message="m"))
+
+        with pytest.raises(RuntimeError):
+            await uow.commit()
+
+        mock_event_bus.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_does_not_break_commit(
+        self, mock_session: AsyncMock, mock_event_bus: AsyncMock
+    ) -> None:
+        """Проверяет, что ошибка шины не пробрасывается в запрос."""
+        mock_event_bus.publish.side_effect = RuntimeError("bus is broken")
+        uow = UnitOfWork(session=mock_session, event_bus=mock_event_bus)
+        await uow.register_event(OutboxEvent.create_notification(user_id="u1", title="t", message="m"))
+
+        await uow.commit()
+
+        mock_session.commit.assert_awaited_once()
+
+
+class TestOutboxPersistence:
+    """Тесты сохранения событий в таблицу outbox"""
+
+    @pytest.mark.asyncio
+    async def test_writes_events_before_commit(self, mock_session: AsyncMock) -> None:
+        """Проверяет, что события пишутся в outbox в той же транзакции до коммита."""
+        calls: list[str] = []
+        writer = AsyncMock(spec=OutboxWriter)
+        writer.write.side_effect = lambda session, events: calls.append("write")
+        mock_session.commit.side_effect = lambda: calls.append("commit")
+        uow = UnitOfWork(session=mock_session, outbox_writer=writer)
+        event = OutboxEvent.create_notification(user_id="u1", title="t", message="m")
+
+        await uow.register_event(event)
+        await uow.commit()
+
+        assert calls == ["write", "commit"]
+        writer.write.assert_awaited_once_with(mock_session, [event])
+
+
+class TestLazyTransaction:
+    """Тесты работы UnitOfWork без обращения к БД"""
+
+    @pytest.mark.asyncio
+    async def test_exit_without_transaction_skips_rollback(self, mock_session: AsyncMock) -> None:
+        """Проверяет, что без начатой транзакции выход не делает ROLLBACK."""
+        mock_session.in_transaction.return_value = False
+
+        async with UnitOfWork(session=mock_session) as uow:
+            await uow.register_event(OutboxEvent.create_notification(user_id="u1", title="t", message="m"))
+
+        mock_session.rollback.assert_not_awaited()
+        assert uow._events == []
+
+    @pytest.mark.asyncio
+    async def test_exit_with_transaction_rolls_back(self, mock_session: AsyncMock) -> None:
+        """Проверяет откат начатой и не зафиксированной транзакции."""
+        mock_session.in_transaction.return_value = True
+
+        async with UnitOfWork(session=mock_session):
+            pass
+
+        mock_session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_commit_without_changes_is_noop(self, mock_session: AsyncMock) -> None:
+        """Проверяет, что коммит без транзакции и событий не обращается к БД."""
+        mock_session.in_transaction.return_value = False
+        uow = UnitOfWork(session=mock_session)
+
+        await uow.commit()
+
+        mock_session.commit.assert_not_awaited()
+
+
+class TestTransactionMode:
+    """Тесты режимов транзакции UnitOfWork"""
+
+    @pytest.fixture
+    def session(self) -> AsyncSession:
+        """Создает сессию без подключения к БД."""
+        pytest.importorskip("aiosqlite")
+        return AsyncSession(create_async_engine("sqlite+aiosqlite://"))
+
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [
+            (TransactionMode.READ_ONLY, "SET TRANSACTION READ ONLY"),
+            (
+                TransactionMode.READ_ONLY_DEFERRABLE,
+                "SET TRANSACTION ISOLATION LEVEL SERIALIZABLE, READ ONLY, DEFERRABLE",
+            ),
+            (TransactionMode.REPEATABLE_READ, "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ WRITE"),
+        ],
+    )
+    def test_set_transaction_sql(self, mode: TransactionMode, expected: str) -> None:
+        """Проверяет SQL для режимов транзакции."""
+        assert set_transaction_sql(mode) == expected
+
+    def test_deferrable_requires_serializable_read_only(self) -> None:
+        """Проверяет, что DEFERRABLE допустим только для SERIALIZABLE READ ONLY."""
+        with pytest.raises(ValueError, match="DEFERRABLE"):
+            TransactionMode(read_only=True, deferrable=True)
+
+    def test_sets_transaction_on_begin(self, session: AsyncSession) -> None:
+        """Проверяет, что режим устанавливается первым запросом транзакции PostgreSQL."""
+        uow = UnitOfWork(session=session, mode=TransactionMode.READ_ONLY)
+        connection = MagicMock()
+        connection.dialect.name = "postgresql"
+
+        uow._set_transaction(session.sync_session, MagicMock(nested=False), connection)
+        uow._set_transaction(session.sync_session, MagicMock(nested=True), connection)
+
+        connection.exec_driver_sql.assert_called_once_with("SET TRANSACTION READ ONLY")
+
+    @pytest.mark.asyncio
+    async def test_read_only_disables_autoflush_and_events(self, session: AsyncSession) -> None:
+        """Проверяет, что read-only UnitOfWork не делает flush и не принимает события."""
+        async with UnitOfWork(session=session, mode=TransactionMode.READ_ONLY) as uow:
+            assert session.sync_session.autoflush is False
+            with pytest.raises(ReadOnlyTransactionError):
+                await uow.register_event(OutboxEvent.create_notification(user_id="u1", title="t", message="m"))
+
+        assert "transaction_mode" not in session.info
+
+    @pytest.mark.asyncio
+    async def test_read_only_commit_rejects_pending_changes(self, session: AsyncSession) -> None:
+        """Проверяет, что коммит read-only UnitOfWork с изменениями завершается ошибкой."""
+        uow = UnitOfWork(session=session, mode=TransactionMode.READ_ONLY)
+        session.add(OutboxRecord(id=uuid4(), event_type="custom", data=b""))
+
+        with pytest.raises(ReadOnlyTransactionError):
+            await uow.commit()
+
+    def test_conflicting_modes_on_one_session(self, session: AsyncSession) -> None:
+        """Проверяет, что на одной сессии нельзя смешать разные режимы."""
+        UnitOfWork(session=session, mode=TransactionMode.READ_ONLY)
+
+        with pytest.raises(ValueError, match="already used"):
+            UnitOfWork(session=session)
+
+
+class TestRetry:
+    """Тесты повтора транзакций в UnitOfWork"""
+
+    @staticmethod
+    def serialization_failure() -> DBAPIError:
+        orig = Exception("could not serialize access")
+        orig.sqlstate = SERIALIZATION_FAILURE
+        return DBAPIError("COMMIT", {}, orig)
+
+    @pytest.mark.asyncio
+    async def test_retries_serialization_failure(self, mock_session: AsyncMock) -> None:
+        """Проверяет повтор работы с откатом после ошибки сериализации."""
+        uow = UnitOfWork(session=mock_session, retry_policy=RetryPolicy(base_delay=0))
+        work = AsyncMock(side_effect=[self.serialization_failure(), "done"])
+
+        assert await uow.run(work) == "done"
+        assert work.await_count == 2
+        mock_session.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, mock_session: AsyncMock) -> None:
+        """Проверяет, что после исчерпания попыток ошибка пробрасывается."""
+        uow = UnitOfWork(session=mock_session, retry_policy=RetryPolicy(max_attempts=2, base_delay=0))
+        work = AsyncMock(side_effect=self.serialization_failure())
+
+        with pytest.raises(DBAPIError):
+            await uow.run(work)
+        assert work.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_other_errors(self, mock_session: AsyncMock) -> None:
+        """Проверяет, что прочие ошибки не повторяются."""
+        uow = UnitOfWork(session=mock_session)
+        work = AsyncMock(side_effect=DBAPIError("INSERT", {}, Exception("unique violation")))
+
+        with pytest.raises(DBAPIError):
+            await uow.run(work)
+        work.assert_awaited_once()
+        mock_session.rollback.assert_not_awaited()
+
+
+class TestSavepoint:
+    """Тесты частичного отката через SAVEPOINT"""
+
+    @pytest_asyncio.fixture
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Создает сессию SQLite с таблицей outbox."""
+        pytest.importorskip("aiosqlite")
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(OutboxRecord.__table__.create)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_failed_savepoint_keeps_outer_changes(self, session: AsyncSession) -> None:
+        """Проверяет, что ошибка в SAVEPOINT откатывает только изменения и события блока."""
+        uow = UnitOfWork(session=session)
+        outer_event = OutboxEvent.create_notification(user_id="u1", title="outer", message="m")
+        session.add(OutboxRecord(id=uuid4(), event_type="custom", data=b"outer"))
+        await uow.register_event(outer_event)
+
+        async def fail_inside_savepoint() -> None:
+            async with uow.savepoint():
+                session.add(OutboxRecord(id=uuid4(), event_type="custom", data=b"inner"))
+                await uow.register_event(
+                    OutboxEvent.create_notification(user_id="u1", title="inner", message="m", idempotency_key="k1")
+                )
+                raise RuntimeError("partial failure")
+
+        with pytest.raises(RuntimeError):
+            await fail_inside_savepoint()
+        await uow.commit()
+
+        data = (await session.execute(select(OutboxRecord.data))).scalars().all()
+        assert data == [b"outer"]
+        assert uow._idempotency_keys == set()
+
+
+class TestAuditCapture:
+    """Тесты аудита изменений при коммите"""
+
+    @pytest.mark.asyncio
+    async def test_consecutive_commits_with_outbox(self) -> None:
+        """Проверяет, что записи outbox не аудируются и не переходят в следующий коммит."""
+        pytest.importorskip("aiosqlite")
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(
+                Base.metadata.create_all, tables=[OutboxRecord.__table__, UowAuditedItemModel.__table__]
+            )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            uow = UnitOfWork(
+                session=session,
+                audit_capture=AuditCapture(default_rule=AuditRule()),
+                outbox_writer=OutboxWriter(EventSerializer()),
+            )
+            for name in ("first", "second"):
+                session.add(UowAuditedItemModel(name=name))
+                await uow.commit()
+
+            records = (await session.execute(select(OutboxRecord.resource))).scalars().all()
+        await engine.dispose()
+
+        assert records == ["UowAuditedItemModel", "UowAuditedItemModel"]
@@ -0,0 +1,196 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.infrastructure.config import store
+from src.infrastructure.config.settings import APISettings, AppSettings, CORSSettings, DatabaseSettings, Settings
+from src.infrastructure.database.telemetry import PoolTelemetry
+from src.interfaces.api import create_rest_app
+from src.interfaces.api.middlewares import AdmissionMiddleware
+
+
+def find_middleware(app: FastAPI) -> AdmissionMiddleware:
+    middleware = app.middleware_stack
+    while not isinstance(middleware, AdmissionMiddleware):
+        middleware = middleware.app
+    return middleware
+
+
+def make_app(gate: asyncio.Event, **options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, **options)
+
+    @app.get("/slow")
+    async def slow() -> dict:
+        await gate.wait()
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            yield b"start"
+            await gate.wait()
+            yield b"end"
+
+        return StreamingResponse(chunks())
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    return app
+
+
+@pytest.fixture
+def gate() -> asyncio.Event:
+    return asyncio.Event()
+
+
+def client_for(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestAdmissionMiddleware:
+    """Тесты ограничения одновременных запросов и сброса нагрузки"""
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_and_priority(self, gate: asyncio.Event) -> None:
+        """Проверяет очередь сверх лимита, 503 при ее переполнении и обход для health."""
+        app = make_app(gate, max_concurrent=1, queue_size=1, queue_timeout=5, retry_after=3)
+        async with client_for(app) as client:
+            running = asyncio.create_task(client.get("/slow"))
+            queued = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.05)
+            middleware = find_middleware(app)
+            assert (middleware.in_flight, middleware.queued) == (1, 1)
+
+            rejected = await client.get("/slow")
+            health = await client.get("/health")
+            gate.set()
+            responses = await asyncio.gather(running, queued)
+
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "3"
+        assert health.status_code == 200
+        assert [response.status_code for response in responses] == [200, 200]
+        assert (middleware.in_flight, middleware.queued, middleware.rejected) == (0, 0, 1)
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self, gate: asyncio.Event) -> None:
+        """Проверяет 503, если слот не освободился за queue_timeout."""
+        app = make_app(gate, max_concurrent=1, queue_timeout=0.05)
+        async with client_for(app) as client:
+            running = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.01)
+            timed_out = await client.get("/slow")
+            gate.set()
+            await running
+
+        assert timed_out.status_code == 503
+        assert (find_middleware(app).in_flight, find_middleware(app).queued) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_releases_slot(self, gate: asyncio.Event) -> None:
+        """Проверяет, что начатый потоковый ответ не держит слот до конца потока."""
+        app = make_app(gate, max_concurrent=1, queue_timeout=0.05)
+        async with client_for(app) as client:
+            streaming = asyncio.create_task(client.get("/stream"))
+            await asyncio.sleep(0.05)
+            in_flight = find_middleware(app).in_flight
+            gate.set()
+            other = await client.get("/slow")
+            response = await streaming
+
+        assert in_flight == 0
+        assert other.status_code == 200
+        assert response.content == b"startend"
+        assert find_middleware(app).in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self, gate: asyncio.Event) -> None:
+        """Проверяет, что отмененный (отключившийся) запрос уходит из очереди, не занимая слот."""
+        middleware = AdmissionMiddleware(make_app(gate), max_concurrent=1, queue_timeout=5)
+        assert await middleware._acquire()
+
+        waiter = asyncio.create_task(middleware._acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        middleware._release()
+
+        assert (middleware.in_flight, middleware.queued) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_pool_is_saturated(self, gate: asyncio.Event, tmp_path: Path) -> None:
+        """Проверяет 503 без ожидания, пока запросы стоят в очереди пула БД."""
+        pytest.importorskip("aiosqlite")
+        telemetry = PoolTelemetry()
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=telemetry.pool_class(),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=5,
+        )
+        telemetry.instrument(engine)
+        provider = Provider(scope=Scope.APP)
+        provider.provide(lambda: telemetry, provides=PoolTelemetry)
+        container = make_async_container(provider)
+        app = make_app(gate, pool_waiters=1)
+        setup_dishka(container=container, app=app)
+        gate.set()
+
+        async with client_for(app) as client, engine.connect():
+            waiting = asyncio.create_task(engine.connect().start())
+            await asyncio.sleep(0.05)
+            saturated = await client.get("/slow")
+            health = await client.get("/health")
+            waiting.cancel()
+        async with client_for(app) as client:
+            after = await client.get("/slow")
+        await container.close()
+        await engine.dispose()
+
+        assert saturated.status_code == 503
+        assert health.status_code == 200
+        assert after.status_code == 200
+        assert telemetry.waiting == 0
+
+
+class TestRestAppAdmission:
+    """Тесты ограничения одновременных запросов в собранном приложении"""
+
+    @pytest.mark.asyncio
+    async def test_rejection_carries_cors_headers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Проверяет CORS-заголовки у 503, preflight без слота и пул с учетом бюджета соединений."""
+        settings = Settings(
+            app=AppSettings(workers=4, warmup=False),
+            database=DatabaseSettings(pool_size=10, max_overflow=0, connection_budget=20, reserved_connections=0),
+            cors=CORSSettings(allow_origins=["https://a.com"]),
+            api=APISettings(max_concurrent_requests=1, admission_queue_size=0),
+        )
+        monkeypatch.setattr(store._store, "_settings", settings)
+        app = create_rest_app(make_async_container(Provider(scope=Scope.APP)))
+        origin = {"Origin": "https://a.com"}
+
+        async with client_for(app) as client:
+            await client.get("/health")
+            middleware = find_middleware(app)
+            middleware.in_flight = 1
+            rejected = await client.get("/api/v1/missing", headers=origin)
+            preflight = await client.options(
+                "/api/v1/missing", headers={**origin, "Access-Control-Request-Method": "GET"}
+            )
+
+        assert rejected.status_code == 503
+        assert rejected.headers["access-control-allow-origin"] == "https://a.com"
+        assert preflight.status_code == 200
+        assert middleware.rejected == 1
+        assert middleware.pool_waiters == settings.connection_plan.pool_size < settings.database.pool_size
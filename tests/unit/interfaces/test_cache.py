@@ -0,0 +1,235 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+import pytest_asyncio
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import FromDishka, inject, setup_dishka
+from fastapi import FastAPI, Request, Response
+from src.application.common.cache import ICache
+from src.di.cache import CacheConfig, CacheProvider
+from src.infrastructure.config.settings import CacheSettings, Settings
+from src.interfaces.api import cache as cache_module
+from src.interfaces.api.cache import SingleFlight, cache_key, cached
+from src.interfaces.api.depends import ConditionalRequestDep
+
+
+class Counter:
+    """Считает вызовы эндпоинта; gate задерживает ответ."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+
+@pytest.fixture
+def counter() -> Counter:
+    return Counter()
+
+
+@pytest_asyncio.fixture
+async def client(counter: Counter) -> AsyncIterator[httpx.AsyncClient]:
+    """Приложение с закешированными эндпоинтами и кешем в памяти из Dishka."""
+    provider = Provider(scope=Scope.APP)
+    provider.provide(lambda: counter, provides=Counter)
+    container = make_async_container(CacheProvider(CacheConfig()), provider)
+    app = FastAPI()
+
+    @app.get("/items")
+    @cached(ttl=60, vary_on_headers=["Accept-Language"])
+    async def list_items(limit: int = 10) -> dict:
+        counter.calls += 1
+        await counter.gate.wait()
+        return {"call": counter.calls, "limit": limit}
+
+    @app.get("/injected")
+    @cached(ttl=60)
+    @inject
+    async def injected(request: Request, injected_counter: FromDishka[Counter]) -> dict:
+        injected_counter.calls += 1
+        return {"path": request.url.path}
+
+    @app.get("/headers")
+    @cached(ttl=60)
+    async def with_headers() -> Response:
+        counter.calls += 1
+        response = Response(b"raw", headers={"ETag": '"v1"', "Cache-Control": "max-age=60"})
+        response.set_cookie("session", "secret")
+        return response
+
+    @app.get("/conditional")
+    @cached(ttl=60)
+    async def conditional(conditional: ConditionalRequestDep) -> dict:
+        counter.calls += 1
+        conditional.check(datetime(2024, 1, 1, tzinfo=UTC))
+        return {"call": counter.calls}
+
+    @app.get("/stale")
+    @cached(ttl=0.05, stale_ttl=60)
+    async def stale() -> dict:
+        counter.calls += 1
+        return {"call": counter.calls}
+
+    setup_dishka(container=container, app=app)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    await container.close()
+
+
+class TestCached:
+    """Тесты кеша ответов эндпоинтов"""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_key_normalization(self, client: httpx.AsyncClient, counter: Counter) -> None:
+        """Проверяет попадание в кеш независимо от порядка параметров и промах по другому заголовку."""
+        first = await client.get("/items?limit=5&x=1")
+        second = await client.get("/items?x=1&limit=5")
+        other_language = await client.get("/items?limit=5&x=1", headers={"Accept-Language": "ru"})
+
+        assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+        assert second.json() == first.json() == {"call": 1, "limit": 5}
+        assert other_language.headers["x-cache"] == "MISS"
+        assert counter.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_keeps_response_headers(self, client: httpx.AsyncClient, counter: Counter) -> None:
+        """Проверяет, что ответ из кеша сохраняет заголовки эндпоинта, кроме cookie, и тип тела."""
+        miss = await client.get("/headers")
+        hit = await client.get("/headers")
+
+        for response in (miss, hit):
+            assert response.content == b"raw"
+            assert response.headers["etag"] == '"v1"'
+            assert response.headers["cache-control"] == "max-age=60"
+            assert "content-type" not in response.headers
+        assert "set-cookie" in miss.headers
+        assert "set-cookie" not in hit.headers
+        assert hit.headers["x-cache"] == "HIT"
+        assert counter.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_keeps_headers_set_on_request_response(self, client: httpx.AsyncClient, counter: Counter) -> None:
+        """Проверяет ETag и Last-Modified из ConditionalRequestDep в ответах MISS и HIT."""
+        miss = await client.get("/conditional")
+        hit = await client.get("/conditional")
+
+        assert (miss.headers["x-cache"], hit.headers["x-cache"]) == ("MISS", "HIT")
+        for response in (miss, hit):
+            assert response.headers["etag"].startswith('W/"')
+            assert response.headers["last-modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+            assert response.json() == {"call": 1}
+        assert counter.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self, client: httpx.AsyncClient, counter: Counter) -> None:
+        """Проверяет, что одновременные промахи по одному ключу вызывают эндпоинт один раз."""
+        counter.gate.clear()
+        requests = [asyncio.create_task(client.get("/items")) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        counter.gate.set()
+
+        responses = await asyncio.gather(*requests)
+
+        assert counter.calls == 1
+        assert {response.json()["call"] for response in responses} == {1}
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, client: httpx.AsyncClient, counter: Counter) -> None:
+        """Проверяет, что устаревший ответ отдается сразу, а обновляется после ответа."""
+        await client.get("/stale")
+        await asyncio.sleep(0.1)
+
+        stale = await client.get("/stale")
+        fresh = await client.get("/stale")
+
+        assert (stale.headers["x-cache"], stale.json()) == ("STALE", {"call": 1})
+        assert (fresh.headers["x-cache"], fresh.json()) == ("HIT", {"call": 2})
+
+    @pytest.mark.asyncio
+    async def test_works_with_inject(self, client: httpx.AsyncClient, counter: Counter) -> None:
+        """Проверяет декоратор поверх @inject с собственным параметром Request."""
+        responses = [await client.get("/injected") for _ in range(2)]
+
+        assert [response.json() for response in responses] == [{"path": "/injected"}] * 2
+        assert counter.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_settings(
+        self, client: httpx.AsyncClient, counter: Counter, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Проверяет, что CACHE_ENABLED=false отключает кеш без перезапуска."""
+        monkeypatch.setattr(cache_module, "get_settings", lambda: Settings(cache=CacheSettings(enabled=False)))
+
+        await client.get("/items")
+        response = await client.get("/items")
+
+        assert "x-cache" not in response.headers
+        assert counter.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_fail_open(self, counter: Counter) -> None:
+        """Проверяет, что при недоступном кеше эндпоинт отвечает без кеша."""
+
+        class BrokenCache:
+            async def get(self, key: str) -> None:
+                raise ConnectionError("cache is down")
+
+            async def set(self, key: str, entry: object) -> None:
+                raise ConnectionError("cache is down")
+
+        provider = Provider(scope=Scope.APP)
+        provider.provide(BrokenCache, provides=ICache)
+        container = make_async_container(provider)
+        app = FastAPI()
+
+        @app.get("/items")
+        @cached(ttl=60)
+        async def list_items() -> dict:
+            counter.calls += 1
+            return {"call": counter.calls}
+
+        setup_dishka(container=container, app=app)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            responses = [await client.get("/items") for _ in range(2)]
+        await container.close()
+
+        assert [response.json() for response in responses] == [{"call": 1}, {"call": 2}]
+        assert counter.calls == 2
+
+
+class TestSingleFlight:
+    """Тесты объединения одновременных вычислений"""
+
+    @pytest.mark.asyncio
+    async def test_failed_leader_does_not_fail_followers(self) -> None:
+        """Проверяет, что после ошибки первого вызова ожидающий вычисляет значение сам."""
+        flights: SingleFlight[int] = SingleFlight()
+        started = asyncio.Event()
+
+        async def failing() -> int:
+            started.set()
+            await asyncio.sleep(0.01)
+            raise ConnectionError("db is down")
+
+        async def succeeding() -> int:  # noqa: RUF029
+            return 42
+
+        leader = asyncio.create_task(flights.run("key", failing))
+        await started.wait()
+        follower = asyncio.create_task(flights.run("key", succeeding))
+
+        with pytest.raises(ConnectionError):
+            await leader
+        assert await follower == 42
+        assert not flights.running("key")
+
+
+def test_cache_key_ignores_query_order() -> None:
+    """Проверяет нормализацию параметров запроса в ключе."""
+    first = Request({"type": "http", "path": "/a", "query_string": b"b=2&a=1", "headers": []})
+    second = Request({"type": "http", "path": "/a", "query_string": b"a=1&b=2", "headers": []})
+
+    assert cache_key("ns", first) == cache_key("ns", second)
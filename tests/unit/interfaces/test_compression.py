@@ -0,0 +1,130 @@
+import gzip
+
+import pytest
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from src.interfaces.api.middlewares import CompressionMiddleware
+from src.interfaces.api.middlewares.compression import default_encodings, negotiate
+
+BODY = {"items": [{"id": i, "name": f"item-{i}"} for i in range(200)]}
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    app.get("/large")(lambda: BODY)
+    app.get("/small")(lambda: {"ok": True})
+    app.get("/event-stream")(lambda: StreamingResponse(iter([b"data: 1\n\n"] * 100), media_type="text/event-stream"))
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([b'{"row": 1}\n'] * 500), media_type="application/x-ndjson")
+
+    @app.get("/encoded")
+    def encoded() -> PlainTextResponse:
+        return PlainTextResponse(gzip.compress(b"x" * 2000), headers={"Content-Encoding": "gzip"})
+
+    return app
+
+
+@pytest.fixture
+def client(app: FastAPI) -> TestClient:
+    return TestClient(app)
+
+
+def raw_get(client: TestClient, path: str, accept_encoding: str) -> tuple[int, dict[str, str], bytes]:
+    # httpx распаковывает gzip сам, поэтому тело читается без декодирования
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response.status_code, dict(response.headers), b"".join(response.iter_raw())
+
+
+class TestNegotiation:
+    """Тесты выбора Content-Encoding"""
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "expected"),
+        [
+            ("gzip, deflate, br, zstd", "zstd"),
+            ("gzip", "gzip"),
+            ("zstd;q=0.5, gzip;q=0.9", "gzip"),
+            ("zstd;q=0, *", "gzip"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_negotiate(self, accept_encoding: str, expected: str | None) -> None:
+        """Проверяет приоритет q и порядок предпочтения сервера."""
+        encodings = [encoding for encoding in default_encodings() if encoding.name != "br"]
+
+        encoding = negotiate(accept_encoding, encodings)
+
+        assert (encoding.name if encoding else None) == expected
+
+
+class TestCompressionMiddleware:
+    """Тесты сжатия ответов"""
+
+    def test_compresses_large_body(self, client: TestClient) -> None:
+        """Проверяет сжатие zstd с корректной длиной и Vary."""
+        status, headers, body = raw_get(client, "/large", "zstd, gzip")
+
+        assert status == 200
+        assert headers["content-encoding"] == "zstd"
+        assert headers["vary"] == "Accept-Encoding"
+        assert int(headers["content-length"]) == len(body)
+        assert zstandard.ZstdDecompressor().decompress(body) == client.get("/large").content
+
+    def test_gzip(self, client: TestClient) -> None:
+        """Проверяет gzip, который распаковывает сам клиент."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == BODY
+
+    def test_small_body_and_unsupported_client(self, client: TestClient) -> None:
+        """Проверяет, что маленькие ответы и ответы без Accept-Encoding не сжимаются."""
+        _, small_headers, _ = raw_get(client, "/small", "zstd")
+        _, plain_headers, _ = raw_get(client, "/large", "identity")
+
+        assert "content-encoding" not in small_headers
+        assert "content-encoding" not in plain_headers
+
+    def test_skips_event_stream_and_encoded(self, client: TestClient) -> None:
+        """Проверяет, что SSE и уже сжатые ответы не трогаются."""
+        _, sse_headers, _ = raw_get(client, "/event-stream", "zstd")
+        _, encoded_headers, body = raw_get(client, "/encoded", "zstd")
+
+        assert "content-encoding" not in sse_headers
+        assert encoded_headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body) == b"x" * 2000
+
+    def test_streaming(self, client: TestClient) -> None:
+        """Проверяет потоковое сжатие без Content-Length."""
+        _, headers, body = raw_get(client, "/stream", "zstd")
+
+        assert headers["content-encoding"] == "zstd"
+        assert "content-length" not in headers
+        decompressed = zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        assert decompressed == b'{"row": 1}\n' * 500
+
+    def test_streaming_disabled(self, app: FastAPI) -> None:
+        """Проверяет, что без streaming потоковые ответы отдаются как есть."""
+        app.user_middleware.clear()
+        app.add_middleware(CompressionMiddleware, streaming=False)
+
+        _, headers, _ = raw_get(TestClient(app), "/stream", "zstd")
+
+        assert "content-encoding" not in headers
+
+    def test_cache_reuses_compressed_body(self, app: FastAPI, client: TestClient) -> None:
+        """Проверяет, что одинаковое тело сжимается один раз."""
+        for _ in range(3):
+            raw_get(client, "/large", "zstd")
+
+        middleware = app.middleware_stack
+        while not isinstance(middleware, CompressionMiddleware):
+            middleware = middleware.app
+        assert (middleware.cache.misses, middleware.cache.hits) == (1, 2)
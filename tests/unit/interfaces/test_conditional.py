@@ -0,0 +1,231 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Annotated
+from uuid import UUID
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import String, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+from src.domain.common.entity import Entity, UuidEntityId
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.mixins import TimestampMixin
+from src.infrastructure.database.repositories.base import BaseRepository
+from src.infrastructure.database.repositories.mixins import GetByIdMethodMixin, VersionMethodMixin
+from src.interfaces.api.conditional import etag_matches, http_date
+from src.interfaces.api.depends import ConditionalRequestDep
+from src.interfaces.api.middlewares import ETagMiddleware
+
+pytest.importorskip("aiosqlite")
+
+
+class VersionedItemModel(TimestampMixin, Base):
+    """Тестовая модель с updated_at."""
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+
+
+class VersionedItemEntity(Entity):
+    """Тестовая сущность."""
+
+    id: UuidEntityId
+    name: str
+
+
+class VersionedItemRepository(
+    BaseRepository[VersionedItemModel, VersionedItemEntity],
+    GetByIdMethodMixin[VersionedItemEntity, UUID],
+    VersionMethodMixin[UUID],
+):
+    """Тестовый репозиторий, считающий загруженные сущности."""
+
+    loaded = 0
+
+    def model_to_entity(self, value: VersionedItemModel) -> VersionedItemEntity:
+        VersionedItemRepository.loaded += 1
+        return VersionedItemEntity(id=UuidEntityId(value.id), name=value.name)
+
+
+ITEM_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """Создает SQLite БД с одной записью."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'conditional.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(VersionedItemModel.__table__.create)
+    async with AsyncSession(engine) as session:
+        session.add(VersionedItemModel(id=ITEM_ID, name="item", updated_at=datetime(2024, 1, 1, tzinfo=UTC)))
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(engine: AsyncEngine) -> AsyncIterator[httpx.AsyncClient]:
+    """Приложение с эндпоинтами сущности и списка под условным GET."""
+
+    async def get_repository() -> AsyncIterator[VersionedItemRepository]:
+        async with AsyncSession(engine) as session:
+            yield VersionedItemRepository(session)
+
+    repository_dep = Annotated[VersionedItemRepository, Depends(get_repository)]
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: UUID, repository: repository_dep, conditional: ConditionalRequestDep) -> dict:
+        conditional.check(await repository.get_updated_at(item_id))
+        entity = await repository.get_by_id(item_id)
+        if entity is None:
+            raise HTTPException(status_code=404)
+        return {"id": str(entity.id), "name": entity.name}
+
+    @app.get("/items")
+    async def list_items(repository: repository_dep, conditional: ConditionalRequestDep) -> dict:
+        conditional.check(*await repository.get_collection_version())
+        return {"loaded": True}
+
+    VersionedItemRepository.loaded = 0
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestConditionalRequest:
+    """Тесты условного GET по updated_at"""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_skips_loading(self, client: httpx.AsyncClient) -> None:
+        """Проверяет, что совпавший If-None-Match дает 304 без загрузки сущности."""
+        first = await client.get(f"/items/{ITEM_ID}")
+        second = await client.get(f"/items/{ITEM_ID}", headers={"If-None-Match": first.headers["etag"]})
+
+        assert first.status_code == 200
+        assert first.headers["etag"].startswith('W/"')
+        assert first.headers["last-modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
+        assert VersionedItemRepository.loaded == 1
+
+    @pytest.mark.asyncio
+    async def test_if_modified_since(self, client: httpx.AsyncClient) -> None:
+        """Проверяет 304 по If-Modified-Since и 200 после изменения записи."""
+        not_modified = await client.get(
+            f"/items/{ITEM_ID}", headers={"If-Modified-Since": http_date(datetime.now(UTC))}
+        )
+        modified = await client.get(
+            f"/items/{ITEM_ID}", headers={"If-Modified-Since": http_date(datetime(2023, 1, 1, tzinfo=UTC))}
+        )
+
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_collection_version(self, client: httpx.AsyncClient, engine: AsyncEngine) -> None:
+        """Проверяет, что ETag списка меняется при изменении и добавлении записей."""
+        first = await client.get("/items")
+        async with AsyncSession(engine) as session:
+            await session.execute(
+                update(VersionedItemModel).values(updated_at=datetime(2024, 1, 1, tzinfo=UTC) + timedelta(seconds=1))
+            )
+            await session.commit()
+        after_update = await client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+        async with AsyncSession(engine) as session:
+            session.add(
+                VersionedItemModel(id=UuidEntityId().value, name="new", updated_at=datetime(2020, 1, 1, tzinfo=UTC))
+            )
+            await session.commit()
+        after_insert = await client.get("/items", headers={"If-None-Match": after_update.headers["etag"]})
+        unchanged = await client.get("/items", headers={"If-None-Match": after_insert.headers["etag"]})
+
+        assert after_update.status_code == 200
+        assert after_insert.status_code == 200
+        assert unchanged.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_missing_entity_is_not_conditional(self, client: httpx.AsyncClient) -> None:
+        """Проверяет, что для отсутствующей записи ответ не 304 даже при If-None-Match: *."""
+        response = await client.get(f"/items/{UuidEntityId().value}", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+
+class TestETagMiddleware:
+    """Тесты ETag по телу ответа"""
+
+    @pytest.fixture
+    def client(self) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(ETagMiddleware)
+        app.get("/data")(lambda: {"value": 1})
+
+        @app.get("/stream")
+        def stream() -> StreamingResponse:
+            return StreamingResponse(iter([b"a", b"b"]))
+
+        return TestClient(app)
+
+    def test_body_etag(self, client: TestClient) -> None:
+        """Проверяет ETag по телу и 304 без тела при совпадении."""
+        first = client.get("/data")
+        second = client.get("/data", headers={"If-None-Match": f'"other", {first.headers["etag"]}'})
+
+        assert first.json() == {"value": 1}
+        assert second.status_code == 304
+        assert second.content == b""
+        assert "content-length" not in second.headers
+        assert second.headers["etag"] == first.headers["etag"]
+
+    def test_streaming_is_untouched(self, client: TestClient) -> None:
+        """Проверяет, что потоковый ответ не буферизуется и не получает ETag."""
+        response = client.get("/stream", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert response.content == b"ab"
+        assert "etag" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_streaming_headers_are_not_delayed(self) -> None:
+        """Проверяет, что заголовки потока (SSE) уходят до первого куска тела."""
+        first_chunk = asyncio.Event()
+
+        async def events() -> AsyncIterator[bytes]:
+            await first_chunk.wait()
+            yield b"data: 1\n\n"
+
+        middleware = ETagMiddleware(StreamingResponse(events(), media_type="text/event-stream"))
+        sent: list[dict] = []
+
+        async def receive() -> dict:
+            await asyncio.Event().wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:  # noqa: RUF029
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "asgi": {"spec_version": "2.4"}}
+        response = asyncio.create_task(middleware(scope, receive, send))
+        await asyncio.sleep(0.01)
+        started = [message["type"] for message in sent]
+        first_chunk.set()
+        await response
+
+        assert started == ["http.response.start"]
+        assert sent[1]["body"] == b"data: 1\n\n"
+
+    def test_weak_comparison(self) -> None:
+        """Проверяет слабое сравнение ETag."""
+        assert etag_matches('"abc"', 'W/"abc"')
+        assert etag_matches("*", 'W/"abc"')
+        assert not etag_matches('W/"abd"', 'W/"abc"')
+        assert not etag_matches(None, 'W/"abc"')
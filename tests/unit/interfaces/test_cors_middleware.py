@@ -0,0 +1,26 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.infrastructure.config.settings import CORSSettings
+from src.interfaces.api.middlewares import ReloadableCORSMiddleware
+
+
+class TestReloadableCORSMiddleware:
+    """Тесты CORS, следующего за перезагрузкой настроек"""
+
+    def test_follows_settings_snapshot(self) -> None:
+        """Проверяет, что новый снимок настроек применяется без пересоздания приложения."""
+        current = {"cors": CORSSettings(allow_origins=["https://a.com"], allow_credentials=False)}
+        app = FastAPI()
+        app.add_middleware(ReloadableCORSMiddleware, get_cors_settings=lambda: current["cors"])
+        app.get("/ping")(lambda: {"ok": True})
+        client = TestClient(app)
+
+        first = client.get("/ping", headers={"Origin": "https://a.com"})
+        current["cors"] = CORSSettings(allow_origins=["https://b.com"], allow_credentials=False)
+        second = client.get("/ping", headers={"Origin": "https://a.com"})
+        current["cors"] = CORSSettings(enabled=False)
+        disabled = client.get("/ping", headers={"Origin": "https://b.com"})
+
+        assert first.headers["access-control-allow-origin"] == "https://a.com"
+        assert "access-control-allow-origin" not in second.headers
+        assert "access-control-allow-origin" not in disabled.headers
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from src.infrastructure.database.deadline import remaining_time
+from src.interfaces.api.middlewares import RequestDeadlineMiddleware
+from starlette.datastructures import Headers
+from starlette.types import Message, Receive, Scope, Send
+
+
+def http_scope(headers: list[tuple[bytes, bytes]] | None = None) -> Scope:
+    return {"type": "http", "method": "GET", "path": "/items", "headers": headers or []}
+
+
+class Client:
+    """ASGI-клиент, который может отключиться посреди запроса."""
+
+    def __init__(self) -> None:
+        self.disconnected = asyncio.Event()
+        self.sent: list[Message] = []
+        self._body_sent = False
+
+    async def receive(self) -> Message:
+        if not self._body_sent:
+            self._body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message: Message) -> None:
+        self.sent.append(message)
+
+
+async def respond(send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+class TestRequestDeadlineMiddleware:
+    """Тесты срока выполнения запроса и отмены при отключении клиента"""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, 30.0),
+            ("5", 5.0),
+            ("1000", 60.0),
+            ("oops", 30.0),
+            ("-1", 30.0),
+        ],
+    )
+    def test_timeout(self, header: str | None, expected: float) -> None:
+        """Проверяет выбор срока из заголовка, значения по умолчанию и ограничения сверху."""
+        middleware = RequestDeadlineMiddleware(app=respond, default_timeout=30.0, max_timeout=60.0)
+        headers = Headers({"X-Request-Timeout": header} if header is not None else {})
+
+        assert middleware.timeout(headers) == expected
+
+    @pytest.mark.asyncio
+    async def test_sets_deadline_for_handler(self) -> None:
+        """Проверяет, что обработчик выполняется внутри срока запроса."""
+        seen: list[float | None] = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            seen.append(remaining_time())
+            await respond(send)
+
+        client = Client()
+        middleware = RequestDeadlineMiddleware(app, default_timeout=10.0)
+        await middleware(http_scope([(b"x-request-timeout", b"2")]), client.receive, client.send)
+
+        assert seen[0] is not None
+        assert 0 < seen[0] <= 2.0
+        assert client.sent[-1]["body"] == b"ok"
+
+    @pytest.mark.asyncio
+    async def test_cancels_handler_on_disconnect(self) -> None:
+        """Проверяет отмену обработчика, когда клиент отключился до ответа."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            await receive()
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        client = Client()
+        middleware = RequestDeadlineMiddleware(app)
+        request = asyncio.create_task(middleware(http_scope(), client.receive, client.send))
+        await started.wait()
+        client.disconnected.set()
+
+        await asyncio.wait_for(request, timeout=1)
+        assert cancelled.is_set()
+        assert client.sent == []
+
+    @pytest.mark.asyncio
+    async def test_keeps_handler_after_response(self) -> None:
+        """Проверяет, что отключение после ответа не прерывает освобождение ресурсов."""
+        cleaned_up = asyncio.Event()
+        client = Client()
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            await respond(send)
+            client.disconnected.set()
+            await asyncio.sleep(0.01)
+            cleaned_up.set()
+
+        middleware = RequestDeadlineMiddleware(app)
+        await middleware(http_scope(), client.receive, client.send)
+
+        assert cleaned_up.is_set()
@@ -0,0 +1,139 @@
+import csv
+import io
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import UUID
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import APIRouter, FastAPI
+from sqlalchemy import String
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+from src.application.common.unit_of_work import IReadOnlyUnitOfWork, TransactionMode
+from src.domain.common.entity import Entity, UuidEntityId
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.repositories.base import BaseRepository
+from src.infrastructure.database.repositories.mixins import StreamMethodMixin
+from src.infrastructure.unit_of_work import UnitOfWork
+from src.interfaces.api.v1.export import add_export_route, encode_rows, ndjson_line
+
+pytest.importorskip("aiosqlite")
+
+ROWS = 250
+
+
+class ExportItemModel(Base):
+    """Тестовая модель для выгрузки."""
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
+    tags: Mapped[str] = mapped_column(String(100))
+
+
+class ExportItemEntity(Entity):
+    """Тестовая сущность с вложенным полем."""
+
+    id: UuidEntityId
+    name: str
+    tags: list[str]
+
+
+class ExportItemRepository(BaseRepository[ExportItemModel, ExportItemEntity], StreamMethodMixin[ExportItemEntity]):
+    """Тестовый репозиторий."""
+
+    def model_to_entity(self, value: ExportItemModel) -> ExportItemEntity:
+        return ExportItemEntity(id=UuidEntityId(value.id), name=value.name, tags=value.tags.split(","))
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """Создает SQLite БД с ROWS строками."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'export.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(ExportItemModel.__table__.create)
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            ExportItemModel(id=UuidEntityId().value, name=f'item "{i}", ok', tags="a,b") for i in range(ROWS)
+        )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(engine: AsyncEngine) -> AsyncIterator[httpx.AsyncClient]:
+    """Приложение с эндпоинтом выгрузки и сессией запроса из Dishka."""
+
+    async def get_session() -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(engine) as session:
+            yield session
+
+    async def get_read_only_unit_of_work(session: AsyncSession) -> AsyncIterator[IReadOnlyUnitOfWork]:
+        async with UnitOfWork(session=session, mode=TransactionMode.READ_ONLY) as uow:
+            yield uow
+
+    provider = Provider(scope=Scope.REQUEST)
+    provider.provide(get_session, provides=AsyncSession)
+    provider.provide(get_read_only_unit_of_work, provides=IReadOnlyUnitOfWork)
+    container = make_async_container(provider)
+
+    router = APIRouter()
+    add_export_route(router, "/items/export", ExportItemEntity, ExportItemRepository, filename="items", batch_size=50)
+    app = FastAPI()
+    app.include_router(router)
+    setup_dishka(container=container, app=app)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    await container.close()
+
+
+class TestEncodeRows:
+    """Тесты нарезки выгрузки на куски"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_bounded(self) -> None:
+        """Проверяет, что строки собираются в куски около chunk_size и ни одна не теряется."""
+
+        async def entities() -> AsyncIterator[ExportItemEntity]:  # noqa: RUF029
+            for i in range(100):
+                yield ExportItemEntity(id=UuidEntityId(), name=f"item-{i}", tags=[])
+
+        line_size = len(ndjson_line(ExportItemEntity(id=UuidEntityId(), name="item-00", tags=[])))
+        chunks = [chunk async for chunk in encode_rows(entities(), ndjson_line, chunk_size=1000)]
+
+        assert len(chunks) > 1
+        assert all(len(chunk) < 1000 + line_size for chunk in chunks)
+        assert b"".join(chunks).count(b"\n") == 100
+
+
+class TestExportRoute:
+    """Тесты эндпоинта выгрузки"""
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self, client: httpx.AsyncClient) -> None:
+        """Проверяет выгрузку всех строк в NDJSON через курсор."""
+        response = await client.get("/items/export")
+
+        rows = [orjson.loads(line) for line in response.content.splitlines()]
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["content-disposition"] == 'attachment; filename="items.ndjson"'
+        assert len(rows) == ROWS
+        assert rows[0]["tags"] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_csv(self, client: httpx.AsyncClient) -> None:
+        """Проверяет заголовок, экранирование и вложенные поля в CSV."""
+        response = await client.get("/items/export", params={"format": "csv"})
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert len(rows) == ROWS
+        assert {row["name"] for row in rows} == {f'item "{i}", ok' for i in range(ROWS)}
+        assert orjson.loads(rows[0]["tags"]) == ["a", "b"]
+        UUID(rows[0]["id"])
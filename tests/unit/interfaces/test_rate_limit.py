@@ -0,0 +1,181 @@
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import pytest_asyncio
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from src.application.common.rate_limit import IRateLimiter, RateLimitResult
+from src.di.rate_limit import RateLimitConfig, RateLimitProvider
+from src.infrastructure.config import store
+from src.infrastructure.config.settings import AppSettings, CORSSettings, RateLimitSettings, Settings
+from src.infrastructure.rate_limit import InMemoryRateLimiter
+from src.interfaces.api import create_rest_app
+from src.interfaces.api import rate_limit as rate_limit_module
+from src.interfaces.api.middlewares import RateLimitMiddleware
+from src.interfaces.api.rate_limit import rate_limit
+
+SETTINGS = RateLimitSettings(enabled=True, rate=0.001, burst=2)
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.get("/items")(lambda: {"ok": True})
+    app.get("/health")(lambda: {"status": "ok"})
+    return app
+
+
+def client_for(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class BrokenRateLimiter:
+    """Лимитер, хранилище которого недоступно."""
+
+    async def hit(self, key: str, rate: float, burst: int, cost: int = 1) -> RateLimitResult:
+        raise ConnectionError("redis is down")
+
+
+class TestRateLimitMiddleware:
+    """Тесты общего лимита запросов на клиента"""
+
+    @pytest.mark.asyncio
+    async def test_limits_per_client(self) -> None:
+        """Проверяет 429 после burst запросов и отдельные корзины для ключей API."""
+        app = make_app()
+        settings = SETTINGS.model_copy(update={"key_header": "X-API-Key"})
+        app.add_middleware(RateLimitMiddleware, limiter=InMemoryRateLimiter(), get_rate_limit_settings=lambda: settings)
+
+        async with client_for(app) as client:
+            by_ip = [(await client.get("/items")).status_code for _ in range(3)]
+            rejected = await client.get("/items")
+            by_key = [(await client.get("/items", headers={"X-API-Key": "secret"})).status_code for _ in range(3)]
+            health = await client.get("/health")
+
+        assert by_ip == [200, 200, 429]
+        assert int(rejected.headers["retry-after"]) > 0
+        assert rejected.json() == {"msg": "rate limit exceeded"}
+        assert by_key == [200, 200, 429]
+        assert health.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_key_header_is_ignored_by_default(self) -> None:
+        """Проверяет, что без настроенного заголовка новый ключ не дает обойти лимит по IP."""
+        app = make_app()
+        app.add_middleware(RateLimitMiddleware, limiter=InMemoryRateLimiter(), get_rate_limit_settings=lambda: SETTINGS)
+
+        async with client_for(app) as client:
+            statuses = [(await client.get("/items", headers={"X-API-Key": f"key-{i}"})).status_code for i in range(3)]
+
+        assert statuses == [200, 200, 429]
+
+    @pytest.mark.asyncio
+    async def test_fails_open(self) -> None:
+        """Проверяет, что при недоступном хранилище лимитов запросы пропускаются."""
+        app = make_app()
+        app.add_middleware(RateLimitMiddleware, limiter=BrokenRateLimiter(), get_rate_limit_settings=lambda: SETTINGS)
+
+        async with client_for(app) as client:
+            statuses = {(await client.get("/items")).status_code for _ in range(5)}
+
+        assert statuses == {200}
+
+    @pytest.mark.asyncio
+    async def test_limiter_that_cannot_be_created_fails_open(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Проверяет, что ошибка создания лимитера (нет extra redis) не превращается в 500."""
+        monkeypatch.setattr(rate_limit_module, "get_settings", lambda: Settings(rate_limit=SETTINGS))
+
+        def broken_limiter() -> IRateLimiter:
+            raise RuntimeError("Redis rate limiter requires the 'redis' extra")
+
+        provider = Provider(scope=Scope.APP)
+        provider.provide(broken_limiter, provides=IRateLimiter)
+        container = make_async_container(provider)
+        app = make_app()
+        app.add_middleware(RateLimitMiddleware, get_rate_limit_settings=lambda: SETTINGS)
+        app.get("/export", dependencies=[rate_limit(rate=0.001, burst=1)])(lambda: {"ok": True})
+        setup_dishka(container=container, app=app)
+
+        async with client_for(app) as client:
+            statuses = {(await client.get(path)).status_code for path in ("/items", "/export", "/export")}
+        await container.close()
+
+        assert statuses == {200}
+
+    @pytest.mark.asyncio
+    async def test_disabled(self) -> None:
+        """Проверяет, что выключенный лимит пропускает все запросы."""
+        app = make_app()
+        settings = SETTINGS.model_copy(update={"enabled": False})
+        app.add_middleware(RateLimitMiddleware, limiter=InMemoryRateLimiter(), get_rate_limit_settings=lambda: settings)
+
+        async with client_for(app) as client:
+            statuses = {(await client.get("/items")).status_code for _ in range(5)}
+
+        assert statuses == {200}
+
+    @pytest.mark.asyncio
+    async def test_skips_cors_preflight(self) -> None:
+        """Проверяет, что preflight-запросы браузера не списывают токены."""
+        app = make_app()
+        app.add_middleware(RateLimitMiddleware, limiter=InMemoryRateLimiter(), get_rate_limit_settings=lambda: SETTINGS)
+        preflight = {"Origin": "https://a.com", "Access-Control-Request-Method": "GET"}
+
+        async with client_for(app) as client:
+            preflights = {(await client.options("/items", headers=preflight)).status_code for _ in range(3)}
+            statuses = [(await client.get("/items")).status_code for _ in range(3)]
+
+        assert 429 not in preflights
+        assert statuses == [200, 200, 429]
+
+    @pytest.mark.asyncio
+    async def test_rejection_carries_cors_headers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Проверяет CORS-заголовки у 429 в собранном приложении."""
+        settings = Settings(
+            app=AppSettings(warmup=False),
+            cors=CORSSettings(allow_origins=["https://a.com"]),
+            rate_limit=SETTINGS,
+        )
+        monkeypatch.setattr(store._store, "_settings", settings)
+        provider = Provider(scope=Scope.APP)
+        provider.provide(lambda: InMemoryRateLimiter(), provides=IRateLimiter)
+        app = create_rest_app(make_async_container(provider))
+        origin = {"Origin": "https://a.com"}
+
+        async with client_for(app) as client:
+            statuses = [(await client.get("/api/v1/missing", headers=origin)).status_code for _ in range(2)]
+            rejected = await client.get("/api/v1/missing", headers=origin)
+
+        assert statuses == [404, 404]
+        assert rejected.status_code == 429
+        assert rejected.headers["access-control-allow-origin"] == "https://a.com"
+
+
+class TestRateLimitDependency:
+    """Тесты лимита отдельного маршрута"""
+
+    @pytest_asyncio.fixture
+    async def client(self, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[httpx.AsyncClient]:
+        monkeypatch.setattr(rate_limit_module, "get_settings", lambda: Settings(rate_limit=SETTINGS))
+        container = make_async_container(RateLimitProvider(RateLimitConfig()))
+        app = FastAPI()
+        app.get("/export", dependencies=[rate_limit(rate=0.001, burst=1)])(lambda: {"ok": True})
+        app.get("/report", dependencies=[rate_limit(rate=0.001, burst=1, name="reports")])(lambda: {"ok": True})
+        app.get("/summary", dependencies=[rate_limit(rate=0.001, burst=1, name="reports")])(lambda: {"ok": True})
+        setup_dishka(container=container, app=app)
+        async with client_for(app) as client:
+            yield client
+        await container.close()
+
+    @pytest.mark.asyncio
+    async def test_route_buckets(self, client: httpx.AsyncClient) -> None:
+        """Проверяет отдельную корзину маршрута и общую корзину по name."""
+        export = [(await client.get("/export")).status_code for _ in range(2)]
+        report = await client.get("/report")
+        summary = await client.get("/summary")
+
+        assert export == [200, 429]
+        assert report.status_code == 200
+        assert summary.status_code == 429
+        assert "retry-after" in summary.headers
@@ -0,0 +1,68 @@
+from datetime import UTC, datetime
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.application.common.schemas import PaginationRequest, PaginationResponse
+from src.domain.common.entity import Entity, UuidEntityId
+from src.interfaces.api.responses import FastJSONResponse
+
+
+class ItemEntity(Entity):
+    """Тестовая сущность."""
+
+    id: UuidEntityId
+    name: str
+    created_at: datetime
+
+
+def make_page() -> PaginationResponse[ItemEntity, PaginationRequest]:
+    items = [ItemEntity(id=UuidEntityId(), name=f"item-{i}", created_at=datetime.now(UTC)) for i in range(3)]
+    return PaginationResponse[ItemEntity, PaginationRequest](data=items, filters=PaginationRequest(), count=3)
+
+
+class TestFastJSONResponse:
+    """Тесты сериализации ответа сразу в bytes"""
+
+    def test_model_matches_model_dump_json(self) -> None:
+        """Проверяет, что модель кодируется так же, как model_dump_json."""
+        page = make_page()
+
+        assert FastJSONResponse(page).body == page.model_dump_json().encode()
+
+    def test_plain_content(self) -> None:
+        """Проверяет кодирование dict с EntityId, моделями и нестроковыми ключами."""
+        entity_id = UuidEntityId()
+        page = make_page()
+
+        body = orjson.loads(FastJSONResponse({"id": entity_id, 1: "one", "page": page}).body)
+
+        assert body["id"] == str(entity_id)
+        assert body["1"] == "one"
+        assert body["page"] == orjson.loads(page.model_dump_json())
+
+    def test_returned_from_endpoint(self) -> None:
+        """Проверяет, что ответ без response_model совпадает с ответом эндпоинта с моделью."""
+        page = make_page()
+        app = FastAPI()
+        app.get("/typed", response_model=PaginationResponse[ItemEntity, PaginationRequest])(lambda: page)
+        app.get("/untyped")(lambda: FastJSONResponse({"page": page}))
+        client = TestClient(app)
+
+        typed, untyped = client.get("/typed"), client.get("/untyped")
+
+        assert typed.headers["content-type"] == "application/json"
+        assert typed.json() == orjson.loads(page.model_dump_json())
+        assert untyped.json() == {"page": typed.json()}
+
+
+class TestUuidEntityIdSerialization:
+    """Тесты сериализации UuidEntityId"""
+
+    def test_json_and_python_modes(self) -> None:
+        """Проверяет строку и в JSON, и в model_dump(), и схему uuid в OpenAPI."""
+        entity = ItemEntity(id=UuidEntityId(), name="item", created_at=datetime.now(UTC))
+
+        assert orjson.loads(entity.model_dump_json())["id"] == str(entity.id)
+        assert entity.model_dump()["id"] == str(entity.id)
+        assert ItemEntity.model_json_schema(mode="serialization")["properties"]["id"]["format"] == "uuid"
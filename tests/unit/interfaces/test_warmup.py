@@ -0,0 +1,72 @@
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from dishka import AsyncContainer
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from src.infrastructure.database.sharding import ShardRouter
+from src.interfaces.api.warmup import open_pool_connections, render_openapi, run_warmup
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """Создает SQLite движок с очередью соединений."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'warmup.db'}", poolclass=AsyncAdaptedQueuePool, pool_size=3
+    )
+    yield engine
+    await engine.dispose()
+
+
+def container_with(router: ShardRouter) -> AsyncContainer:
+    container = AsyncMock(spec=AsyncContainer)
+    container.get.return_value = router
+    return container
+
+
+class TestWarmup:
+    """Тесты прогрева worker'а перед готовностью"""
+
+    @pytest.mark.asyncio
+    async def test_opens_pool_connections(self, engine: AsyncEngine) -> None:
+        """Проверяет, что прогрев заполняет пул до pool_size и возвращает соединения."""
+        await open_pool_connections()(FastAPI(), container_with(ShardRouter([engine])))
+
+        pool = engine.sync_engine.pool
+        assert pool.checkedin() == 3
+        assert pool.checkedout() == 0
+
+    @pytest.mark.asyncio
+    async def test_limits_pool_connections(self, engine: AsyncEngine) -> None:
+        """Проверяет, что прогрев открывает не больше заданного числа соединений."""
+        await open_pool_connections(2)(FastAPI(), container_with(ShardRouter([engine])))
+
+        assert engine.sync_engine.pool.checkedin() == 2
+
+    @pytest.mark.asyncio
+    async def test_renders_openapi(self) -> None:
+        """Проверяет, что OpenAPI-схема генерируется заранее."""
+        app = FastAPI()
+
+        await render_openapi(app, AsyncMock(spec=AsyncContainer))
+
+        assert app.openapi_schema is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_step_does_not_stop_warmup(self) -> None:
+        """Проверяет, что ошибка шага записывается в отчет, а остальные шаги выполняются."""
+        app = FastAPI()
+        failing = AsyncMock(side_effect=ConnectionRefusedError("db is down"))
+
+        report = await run_warmup(app, AsyncMock(spec=AsyncContainer), {"pool": failing, "openapi": render_openapi})
+
+        assert set(report.timings) == {"pool", "openapi"}
+        assert "db is down" in report.errors["pool"]
+        assert not report.ok
+        assert app.openapi_schema is not None
@@ -0,0 +1,88 @@
+from src.application.common.event_coalescing import (
+    AuditLogCoalescingRule,
+    DuplicatePayloadRule,
+    coalesce_events,
+)
+from src.application.common.value_objects import EventType, OutboxEvent
+
+
+class TestCoalesceEvents:
+    """Тесты для coalesce_events"""
+
+    def test_without_rules_returns_events_as_is(self):
+        """Тест без правил события не меняются"""
+        events = [OutboxEvent.create_notification(user_id="u1", title="t", message="m") for _ in range(2)]
+
+        assert coalesce_events(events, []) == events
+
+    def test_duplicate_payload_rule(self):
+        """Тест объединения одинаковых уведомлений"""
+        first = OutboxEvent.create_notification(user_id="u1", title="t", message="m")
+        other = OutboxEvent.create_notification(user_id="u2", title="t", message="m")
+        duplicate = OutboxEvent.create_notification(user_id="u1", title="t", message="m")
+
+        result = coalesce_events([first, other, duplicate], [DuplicatePayloadRule()])
+
+        assert result == [first, other]
+
+    def test_duplicate_payload_rule_filters_event_types(self):
+        """Тест правила только для выбранных типов событий"""
+        events = [OutboxEvent.create_user_action(user_id="u1", action="login") for _ in range(2)]
+
+        result = coalesce_events(events, [DuplicatePayloadRule(event_types=[EventType.NOTIFICATION])])
+
+        assert result == events
+
+    def test_audit_log_rule_merges_changes_per_entity(self):
+        """Тест объединения изменений аудит лога одной сущности"""
+        first = OutboxEvent.create_audit_log(
+            entity_type="Order",
+            entity_id="order-1",
+            operation="update",
+            changes={"status": {"old": "new", "new": "pending"}, "total": {"old": 100, "new": 200}},
+            metadata={"ip": "127.0.0.1"},
+        )
+        other_entity = OutboxEvent.create_audit_log(entity_type="Order", entity_id="order-2", operation="update")
+        second = OutboxEvent.create_audit_log(
+            entity_type="Order",
+            entity_id="order-1",
+            operation="update",
+            user_id="user-1",
+            changes={"status": {"old": "pending", "new": "paid"}},
+            metadata={"request_id": "r1"},
+        )
+
+        result = coalesce_events([first, other_entity, second], [AuditLogCoalescingRule()])
+
+        assert len(result) == 2
+        merged = result[0]
+        assert merged.id == first.id
+        assert merged.payload["user_id"] == "user-1"
+        assert merged.payload["changes"] == {
+            "status": {"old": "new", "new": "paid"},
+            "total": {"old": 100, "new": 200},
+        }
+        assert merged.metadata == {"ip": "127.0.0.1", "request_id": "r1"}
+        assert result[1] == other_entity
+
+    def test_audit_log_rule_operations(self):
+        """Тест итоговой операции при объединении"""
+        rule = AuditLogCoalescingRule()
+
+        def merged(*operations: str) -> str:
+            events = [
+                OutboxEvent.create_audit_log(entity_type="Order", entity_id="1", operation=op) for op in operations
+            ]
+            return coalesce_events(events, [rule])[0].payload["operation"]
+
+        assert merged("create", "update") == "create"
+        assert merged("update", "update") == "update"
+        assert merged("create", "update", "delete") == "delete"
+
+    def test_first_matching_rule_wins(self):
+        """Тест: событие обрабатывается первым подходящим правилом"""
+        events = [OutboxEvent.create_audit_log(entity_type="Order", entity_id="1", operation="update")] * 2
+
+        result = coalesce_events(events, [AuditLogCoalescingRule(), DuplicatePayloadRule()])
+
+        assert len(result) == 1
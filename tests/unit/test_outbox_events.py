@@ -181,6 +181,18 @@ class TestOutboxEvent:
         assert event.payload["notification_type"] == "info"
         assert event.payload["link"] is None
 
+    def test_idempotency_key(self):
+        """Тест ключа идемпотентности события"""
+        event = OutboxEvent.create_notification(
+            user_id="user-123",
+            title="Alert",
+            message="Something happened",
+            idempotency_key="order-456:paid",
+        )
+
+        assert event.idempotency_key == "order-456:paid"
+        assert OutboxEvent.create(event_type=EventType.CUSTOM, payload={}).idempotency_key is None
+
     def test_event_immutability(self):
         """Тест неизменяемости события"""
         event = OutboxEvent.create_message(